@@ -1,9 +1,11 @@
 from django.contrib import admin
+from django.utils import timezone
 from django.utils.html import format_html
 from apps.claims.models import (
     Journalist, Claim, ScoreHistory, Transfer, ScrapedArticle,
-    ReferenceClub, ReferencePlayer,
+    ReferenceClub, ReferencePlayer, Story, StoryReport, DirtyJournalist, ClaimClub,
 )
+from apps.claims.services.bulk_updates import bulk_claim_updates
 
 
 @admin.register(Journalist)
@@ -75,8 +77,9 @@ class JournalistAdmin(admin.ModelAdmin):
 
     def total_claims_count(self, obj):
         """Display total number of claims"""
-        return obj.claims.count()
+        return obj.total_claims
     total_claims_count.short_description = 'Total Claims'
+    total_claims_count.admin_order_field = 'total_claims'
 
     def stats_display(self, obj):
         """Display comprehensive statistics"""
@@ -98,8 +101,21 @@ class JournalistAdmin(admin.ModelAdmin):
     stats_display.short_description = 'Statistics'
 
 
+class ClaimClubInline(admin.TabularInline):
+    model = ClaimClub
+    fields = ('direction', 'name_key', 'club')
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+
+    def has_add_permission(self, request, obj=None):
+        """Links are resolved from from_club/to_club"""
+        return False
+
+
 @admin.register(Claim)
 class ClaimAdmin(admin.ModelAdmin):
+    inlines = [ClaimClubInline]
     list_display = (
         'journalist',
         'player_name',
@@ -124,7 +140,8 @@ class ClaimAdmin(admin.ModelAdmin):
     )
     date_hierarchy = 'claim_date'
     autocomplete_fields = ['journalist', 'cited_journalist']
-    readonly_fields = ('created_at', 'updated_at')
+    readonly_fields = ('reference_player', 'created_at', 'updated_at')
+    actions = ['mark_confirmed_true', 'mark_proven_false', 'mark_pending']
 
     fieldsets = (
         ('Basic Information', {
@@ -139,6 +156,7 @@ class ClaimAdmin(admin.ModelAdmin):
         ('Transfer Details', {
             'fields': (
                 'player_name',
+                'reference_player',
                 'from_club',
                 'to_club',
                 'transfer_fee'
@@ -187,7 +205,6 @@ class ClaimAdmin(admin.ModelAdmin):
     def save_model(self, request, obj, form, change):
         """Override save to set validation_date when status changes"""
         if change:  # Editing existing claim
-            from django.utils import timezone
             old_obj = Claim.objects.get(pk=obj.pk)
             # If validation status changed from pending to validated
             if old_obj.validation_status == 'pending' and obj.validation_status != 'pending':
@@ -195,6 +212,33 @@ class ClaimAdmin(admin.ModelAdmin):
                     obj.validation_date = timezone.now()
         super().save_model(request, obj, form, change)
 
+    def delete_queryset(self, request, queryset):
+        """Bulk delete with story re-ranking and rescoring deferred to the end"""
+        with bulk_claim_updates():
+            super().delete_queryset(request, queryset)
+
+    def _set_validation_status(self, request, queryset, status):
+        updated = 0
+        with bulk_claim_updates():
+            for claim in queryset.exclude(validation_status=status):
+                claim.validation_status = status
+                claim.validation_date = None if status == Claim.STATUS_PENDING else timezone.now()
+                claim.save(update_fields=['validation_status', 'validation_date', 'updated_at'])
+                updated += 1
+        self.message_user(request, f'{updated} claim(s) marked as {status.replace("_", " ")}.')
+
+    @admin.action(description='Mark selected claims as confirmed true')
+    def mark_confirmed_true(self, request, queryset):
+        self._set_validation_status(request, queryset, Claim.STATUS_CONFIRMED_TRUE)
+
+    @admin.action(description='Mark selected claims as proven false')
+    def mark_proven_false(self, request, queryset):
+        self._set_validation_status(request, queryset, Claim.STATUS_PROVEN_FALSE)
+
+    @admin.action(description='Mark selected claims as pending')
+    def mark_pending(self, request, queryset):
+        self._set_validation_status(request, queryset, Claim.STATUS_PENDING)
+
 
 @admin.register(ScoreHistory)
 class ScoreHistoryAdmin(admin.ModelAdmin):
@@ -316,3 +360,37 @@ class ReferencePlayerAdmin(admin.ModelAdmin):
     search_fields = ('name', 'current_club_name')
     readonly_fields = ('created_at', 'updated_at')
     autocomplete_fields = ['current_club', 'on_loan_from_club']
+
+
+class StoryReportInline(admin.TabularInline):
+    model = StoryReport
+    fields = ('position', 'journalist', 'first_reported_at', 'earliness', 'first_claim')
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+
+
+@admin.register(Story)
+class StoryAdmin(admin.ModelAdmin):
+    list_display = ('player_name', 'to_club', 'reporter_count', 'updated_at')
+    search_fields = ('player_name', 'to_club')
+    readonly_fields = (
+        'player_name', 'to_club', 'player_key', 'reference_player', 'reporter_count', 'created_at', 'updated_at',
+    )
+    exclude = ('claims',)
+    inlines = [StoryReportInline]
+
+    def has_add_permission(self, request):
+        """Stories are maintained by the story index"""
+        return False
+
+
+@admin.register(DirtyJournalist)
+class DirtyJournalistAdmin(admin.ModelAdmin):
+    list_display = ('journalist', 'first_marked_at', 'last_marked_at', 'record_history')
+    list_filter = ('record_history',)
+    readonly_fields = ('journalist', 'first_marked_at', 'last_marked_at', 'record_history')
+
+    def has_add_permission(self, request):
+        """Entries are queued by claim changes"""
+        return False
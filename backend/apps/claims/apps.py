@@ -1,4 +1,10 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def _repair_search_triggers(sender, using, **kwargs):
+    from apps.claims.services.search import repair_search_triggers
+    repair_search_triggers(using)
 
 
 class ClaimsConfig(AppConfig):
@@ -8,3 +14,4 @@ class ClaimsConfig(AppConfig):
 
     def ready(self):
         import apps.claims.signals  # Register signals
+        post_migrate.connect(_repair_search_triggers, sender=self)
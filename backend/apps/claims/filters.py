@@ -0,0 +1,32 @@
+"""DRF filter backends for the claims API."""
+
+from rest_framework import filters
+from rest_framework.settings import api_settings
+
+from apps.claims.pagination import KeysetPagination
+from apps.claims.services.search import RANK_ANNOTATION, search_queryset
+
+
+class RankedSearchFilter(filters.SearchFilter):
+    """
+    Drop-in SearchFilter that uses the indexed search backend.
+
+    Results are ordered by relevance, unless the client asked for an explicit
+    ordering or is paging with a cursor (which needs its date ordering). It
+    falls back to the view's search_fields ICONTAINS search where no index
+    exists. Place it after OrderingFilter so the relevance order wins.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+
+        results = search_queryset(queryset, ' '.join(terms))
+        if results is None:
+            return super().filter_queryset(request, queryset, view)
+
+        params = request.query_params
+        if api_settings.ORDERING_PARAM in params or KeysetPagination.cursor_query_param in params:
+            return results
+        return results.order_by(f'-{RANK_ANNOTATION}', *queryset.query.order_by)
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from apps.claims.services import club_resolver
+from apps.claims.services.response_cache import bump_data_version
+
+
+class Command(BaseCommand):
+    help = 'Resolve every claim\'s from_club/to_club text to ReferenceClub links'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=2000,
+            help='Claims relinked per batch',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Relinking claims to reference clubs...')
+        claims, created, deleted = club_resolver.backfill(batch_size=options['batch_size'])
+        if created or deleted:
+            bump_data_version()
+        self.stdout.write(f'  {claims} claims: {created} links created, {deleted} removed')
+        self.stdout.write(self.style.SUCCESS('Done.'))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from apps.claims.services import player_resolver
+from apps.claims.services.response_cache import bump_data_version
+from apps.claims.services.scoring import ScoringService
+from apps.claims.services.story_index import StoryIndex
+
+
+class Command(BaseCommand):
+    help = 'Resolve every claim\'s player_name to its ReferencePlayer'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=2000,
+            help='Claims resolved per batch',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Resolving claims to reference players...')
+        claims, changed = player_resolver.backfill(batch_size=options['batch_size'])
+        self.stdout.write(f'  {claims} claims: {changed} changed')
+        if changed:
+            # Story membership joins on the player id
+            self.stdout.write('Rebuilding story index...')
+            stories = StoryIndex.rebuild()
+            updated = ScoringService.update_all_journalist_scores()
+            bump_data_version()
+            self.stdout.write(f'  Indexed {stories} confirmed stories, rescored {updated} journalists')
+        self.stdout.write(self.style.SUCCESS('Done.'))
@@ -20,6 +20,8 @@ from apps.claims.classifiers import (
     detect_negative_claim,
 )
 from apps.claims.models import Claim, ReferencePlayer
+from apps.claims.services.bulk_updates import bulk_claim_updates
+from apps.claims.services.club_gazetteer import ClubGazetteer
 from apps.claims.scrapers.gossip_scraper import (
     _extract_clubs,
     _extract_fee,
@@ -68,6 +70,7 @@ class Command(BaseCommand):
             help='Only process these specific claim IDs',
         )
 
+    @bulk_claim_updates()
     def handle(self, *args, **options):
         dry_run = options['dry_run']
         fields = set(options['fields'])
@@ -80,6 +83,7 @@ class Command(BaseCommand):
 
         total = qs.count()
         has_ref = ReferencePlayer.objects.exists()
+        gazetteer = ClubGazetteer.current()
 
         self.stdout.write(
             f"{'[DRY RUN] ' if dry_run else ''}"
@@ -128,7 +132,7 @@ class Command(BaseCommand):
 
             # --- From/To clubs ---
             if 'from_club' in fields or 'to_club' in fields:
-                clubs = _extract_clubs(text)
+                clubs = _extract_clubs(text, gazetteer)
                 if clubs:
                     new_from, new_to = classify_club_direction(text, clubs)
                     # Use reference data to fill from_club if NLP missed it
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from apps.claims.services import near_duplicates
+
+
+class Command(BaseCommand):
+    help = 'Re-hash every claim\'s text into the near-duplicate index'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=2000,
+            help='Claims hashed per batch',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Hashing claim texts for near-duplicate lookup...')
+        claims = near_duplicates.backfill(batch_size=options['batch_size'])
+        self.stdout.write(f'  {claims} claims indexed')
+        self.stdout.write(self.style.SUCCESS('Done.'))
@@ -0,0 +1,100 @@
+"""Benchmark the one-pass phrase matcher against per-phrase scans.
+
+Runs the confidence classifier and negative detector over every claim's
+text, as reclassify_claims and backfill_claims do. Each text goes through
+the shipped classifiers and through the original loops that test every
+phrase with `in`, checking both give the same results. The transfer
+keyword filter is compared the same way, against a plain alternation.
+
+Usage:
+    python manage.py benchmark_classifiers
+    python manage.py benchmark_classifiers --limit 100000
+"""
+
+import re
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.claims import classifiers
+from apps.claims.classifiers import classify_claim_confidence, detect_negative_claim
+from apps.claims.models import Claim
+from apps.claims.scrapers.base import TRANSFER_KEYWORDS, is_transfer_related
+
+
+def _scan_confidence(text):
+    lower = text.lower()
+    matched_tiers = set()
+    for tier, phrases in classifiers.TIER_PHRASES.items():
+        for phrase in phrases:
+            if phrase in lower:
+                matched_tiers.add(tier)
+                break
+    for tier, patterns in classifiers._TIER_REGEX.items():
+        if tier not in matched_tiers:
+            for pattern in patterns:
+                if pattern.search(lower):
+                    matched_tiers.add(tier)
+                    break
+    return max(matched_tiers) if matched_tiers else 'tier_6_speculation'
+
+
+def _scan_negative(text):
+    lower = text.lower()
+    return (
+        any(phrase in lower for phrase in classifiers._NEGATIVE_PHRASES)
+        or any(pattern.search(lower) for pattern in classifiers._NEGATIVE_REGEX)
+    )
+
+
+_ALTERNATION = re.compile(
+    r'\b(' + '|'.join(re.escape(kw) for kw in TRANSFER_KEYWORDS) + r')\b',
+    re.IGNORECASE,
+)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the phrase-matcher classifiers against per-phrase scans'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=None,
+            help='Only use the first N claims',
+        )
+
+    def handle(self, *args, **options):
+        texts = list(Claim.objects.order_by('id').values_list('claim_text', flat=True)[:options['limit']])
+        self.stdout.write(f'Classifying {len(texts)} claims...')
+
+        start = time.perf_counter()
+        baseline = [(_scan_confidence(t), _scan_negative(t)) for t in texts]
+        scan_secs = time.perf_counter() - start
+
+        classifiers._phrase_hits.cache_clear()
+        start = time.perf_counter()
+        results = [(classify_claim_confidence(t), detect_negative_claim(t)) for t in texts]
+        matcher_secs = time.perf_counter() - start
+
+        self._report('classifiers', scan_secs, matcher_secs, baseline == results)
+
+        start = time.perf_counter()
+        baseline = [bool(_ALTERNATION.search(t)) for t in texts]
+        scan_secs = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = [is_transfer_related(t) for t in texts]
+        matcher_secs = time.perf_counter() - start
+
+        self._report('keywords', scan_secs, matcher_secs, baseline == results)
+        self.stdout.write(self.style.SUCCESS('Done.'))
+
+    def _report(self, name, scan_secs, matcher_secs, identical):
+        speedup = scan_secs / matcher_secs if matcher_secs else float('inf')
+        self.stdout.write(
+            f'  {name:<12} per-phrase {scan_secs:8.3f}s, matcher {matcher_secs:8.3f}s '
+            f'({speedup:.1f}x), {"identical" if identical else "DIFFERENT"}'
+        )
+        if not identical:
+            self.stderr.write(self.style.ERROR(f'  {name} results differ from the per-phrase scan!'))
@@ -0,0 +1,85 @@
+"""Benchmark the near-duplicate index against a full SequenceMatcher scan.
+
+Takes --queries claims as lookups. Each one is an existing claim's text
+with a few random word edits, so that it stays close to the original.
+For every lookup it finds all claims more similar than the threshold,
+first by comparing against every claim and then with the index's
+candidates only. It reports the time each approach takes and the recall
+of the index, which is the share of the scan's duplicates the index also
+finds. Run backfill_near_duplicate_index first.
+
+Usage:
+    python manage.py benchmark_near_duplicates
+    python manage.py benchmark_near_duplicates --queries 500 --limit 20000
+"""
+
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.claims.models import Claim
+from apps.claims.services import near_duplicates
+
+
+def _edit(rng: random.Random, text: str) -> str:
+    words = text.split()
+    for _ in range(rng.randint(0, 3)):
+        if len(words) < 4:
+            break
+        i = rng.randrange(len(words))
+        if rng.random() < 0.5:
+            del words[i]
+        else:
+            words.insert(i, rng.choice(words))
+    return ' '.join(words)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark MinHash candidate lookup against a full similarity scan'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--queries', type=int, default=200, help='Number of lookups')
+        parser.add_argument('--limit', type=int, default=None, help='Only scan the first N claims')
+        parser.add_argument('--seed', type=int, default=1)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        claims = list(Claim.objects.order_by('id').values_list('id', 'claim_text')[:options['limit']])
+        if not claims:
+            self.stdout.write('No claims to benchmark.')
+            return
+        queries = [_edit(rng, text) for _, text in rng.sample(claims, min(options['queries'], len(claims)))]
+        scope = Claim.objects.filter(id__lte=claims[-1][0])
+        threshold = near_duplicates.SIMILARITY_THRESHOLD
+        self.stdout.write(f'{len(queries)} lookups against {len(claims)} claims...')
+
+        start = time.perf_counter()
+        expected = [
+            {claim_id for claim_id, text in claims if near_duplicates.text_similarity(query, text) > threshold}
+            for query in queries
+        ]
+        scan_secs = time.perf_counter() - start
+
+        start = time.perf_counter()
+        found = []
+        for query in queries:
+            candidates = scope.filter(id__in=near_duplicates.candidate_ids(query)).values_list('id', 'claim_text')
+            found.append({
+                claim_id for claim_id, text in candidates
+                if near_duplicates.similarity_above(query, text, threshold) is not None
+            })
+        index_secs = time.perf_counter() - start
+
+        total = sum(len(ids) for ids in expected)
+        recalled = sum(len(ids & got) for ids, got in zip(expected, found))
+        speedup = scan_secs / index_secs if index_secs else float('inf')
+        self.stdout.write(
+            f'  full scan {scan_secs:8.3f}s, index {index_secs:8.3f}s ({speedup:.1f}x), '
+            f'recall {recalled}/{total} duplicates'
+        )
+        if recalled < total:
+            self.stdout.write(self.style.WARNING(
+                '  Some duplicates were missed: raise NEAR_DUPLICATE_BANDS or lower NEAR_DUPLICATE_ROWS'
+            ))
+        self.stdout.write(self.style.SUCCESS('Done.'))
@@ -0,0 +1,115 @@
+"""Benchmark blocking-key story clustering against the pairwise loop.
+
+Generates synthetic confirmed (player, to_club) pairs, clusters them with
+StoryClusterer and, for sizes up to --baseline-limit, with the original
+pairwise players_match/clubs_match loop, checking both give the same stories.
+
+Usage:
+    python manage.py benchmark_story_clustering
+    python manage.py benchmark_story_clustering --sizes 1000 10000 100000
+"""
+
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.claims.scrapers.gossip_scraper import CLUBS
+from apps.claims.services.story_clustering import StoryClusterer
+from apps.claims.services.validator import clubs_match, players_match
+
+_SYLLABLES = [
+    'ba', 'ro', 'di', 'ka', 'le', 'mo', 'san', 'ti', 'vo', 'ne', 'ric', 'gu',
+    'es', 'ha', 'lo', 'mar', 'qu', 'ze', 'fer', 'nan', 'do', 'ki', 'os', 'wa',
+]
+
+
+def _name(rng: random.Random, parts: int) -> str:
+    return ''.join(rng.choice(_SYLLABLES) for _ in range(parts)).capitalize()
+
+
+def _synthetic_pairs(count: int, seed: int) -> list[tuple[str, str]]:
+    """Build pairs with realistic repetition: players recur with name variants."""
+    rng = random.Random(seed)
+    clubs = list(CLUBS.values()) + ['']
+    players = [
+        f'{_name(rng, rng.randint(2, 3))} {_name(rng, rng.randint(2, 4))}'
+        for _ in range(max(1, count // 3))
+    ]
+    pairs = []
+    for _ in range(count):
+        player = rng.choice(players)
+        if rng.random() < 0.2:
+            player = player.split()[-1]  # surname-only variant
+        pairs.append((player, rng.choice(clubs)))
+    return pairs
+
+
+def _pairwise(pairs):
+    stories = []
+    for player, club in pairs:
+        if not player:
+            continue
+        found = False
+        for sp, sc in stories:
+            if players_match(player, sp) and (clubs_match(club, sc) if club and sc else True):
+                found = True
+                break
+        if not found:
+            stories.append((player, club or ''))
+    return stories
+
+
+class Command(BaseCommand):
+    help = 'Benchmark blocking-key story clustering against the pairwise matching loop'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            nargs='+',
+            type=int,
+            default=[1000, 10000, 100000],
+            help='Numbers of confirmed claims to cluster',
+        )
+        parser.add_argument(
+            '--baseline-limit',
+            type=int,
+            default=10000,
+            help='Largest size to also run (and compare with) the pairwise loop',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=42,
+            help='Random seed for the synthetic data',
+        )
+
+    def handle(self, *args, **options):
+        for size in options['sizes']:
+            pairs = _synthetic_pairs(size, options['seed'])
+
+            start = time.perf_counter()
+            clusterer = StoryClusterer()
+            for player, club in pairs:
+                clusterer.add(player, club)
+            blocked_secs = time.perf_counter() - start
+
+            line = (
+                f'{size:>8} claims: {len(clusterer.stories):>7} stories, '
+                f'blocked {blocked_secs:8.3f}s ({clusterer.comparisons} comparisons)'
+            )
+
+            if size <= options['baseline_limit']:
+                start = time.perf_counter()
+                baseline = _pairwise(pairs)
+                pairwise_secs = time.perf_counter() - start
+                line += f', pairwise {pairwise_secs:8.3f}s'
+                if baseline != clusterer.stories:
+                    self.stdout.write(line)
+                    self.stderr.write(self.style.ERROR('  Groupings differ from the pairwise loop!'))
+                    continue
+                line += ', identical'
+
+            self.stdout.write(line)
+
+        self.stdout.write(self.style.SUCCESS('Done.'))
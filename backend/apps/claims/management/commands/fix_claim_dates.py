@@ -6,8 +6,10 @@ import logging
 import httpx
 from bs4 import BeautifulSoup
 from django.core.management.base import BaseCommand
+from django.utils import timezone
 
 from apps.claims.models import Claim, ScrapedArticle
+from apps.claims.services.bulk_updates import bulk_claim_updates, note_claims
 from apps.claims.scrapers.gossip_scraper import _extract_article_date
 
 logger = logging.getLogger(__name__)
@@ -31,6 +33,7 @@ class Command(BaseCommand):
             help='Preview changes without saving',
         )
 
+    @bulk_claim_updates()
     def handle(self, *args, **options):
         dry_run = options['dry_run']
         articles = ScrapedArticle.objects.filter(
@@ -73,7 +76,8 @@ class Command(BaseCommand):
                 continue
 
             if not dry_run:
-                matched.update(claim_date=real_date)
+                note_claims(matched)
+                matched.update(claim_date=real_date, updated_at=timezone.now())
 
             updated_claims += count
             self.stdout.write(
@@ -14,9 +14,14 @@ import os
 from datetime import datetime
 
 from django.core.management.base import BaseCommand
+from django.utils import timezone
 from django.utils.text import slugify
 
 from apps.claims.models import ReferenceClub, ReferencePlayer
+from apps.claims.services import club_resolver, player_resolver, reference_name_index
+from apps.claims.services.response_cache import bump_data_version
+from apps.claims.services.scoring import ScoringService
+from apps.claims.services.story_index import StoryIndex
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +90,8 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         dry_run = options['dry_run']
         batch_size = options['batch_size']
+        self.clubs_changed = False
+        self.players_changed = False
 
         # 1. Import clubs
         clubs_csv = options['clubs_csv']
@@ -110,6 +117,24 @@ class Command(BaseCommand):
         if dry_run:
             self.stdout.write("[DRY RUN] No data was written.")
         else:
+            if self.clubs_changed:
+                # New or renamed clubs change how claim club text resolves
+                self.stdout.write("Relinking claims to reference clubs...")
+                claims, created, deleted = club_resolver.backfill()
+                if created or deleted:
+                    bump_data_version()
+                self.stdout.write(f"  {claims} claims: {created} links created, {deleted} removed")
+            if self.players_changed:
+                surnames = reference_name_index.write_index()
+                self.stdout.write(f"Wrote reference name index ({surnames} surnames)")
+                # New, renamed or manager-flagged players change how claim player names resolve
+                self.stdout.write("Resolving claims to reference players...")
+                claims, changed = player_resolver.backfill()
+                if changed:
+                    StoryIndex.rebuild()
+                    ScoringService.update_all_journalist_scores()
+                    bump_data_version()
+                self.stdout.write(f"  {claims} claims: {changed} changed")
             self.stdout.write(self.style.SUCCESS("Reference data import complete."))
 
     def _import_clubs(self, path: str, dry_run: bool, batch_size: int):
@@ -165,6 +190,8 @@ class Command(BaseCommand):
                         setattr(club, field, value)
                         changed = True
                 if changed:
+                    # bulk_update skips auto_now; the club resolver keys its cache on it
+                    club.updated_at = timezone.now()
                     to_update.append(club)
             else:
                 to_create.append(ReferenceClub(
@@ -177,9 +204,10 @@ class Command(BaseCommand):
         if to_update:
             ReferenceClub.objects.bulk_update(
                 to_update,
-                ['name', 'slug', 'country', 'competition', 'logo_url'],
+                ['name', 'slug', 'country', 'competition', 'logo_url', 'updated_at'],
                 batch_size=batch_size,
             )
+        self.clubs_changed = bool(to_create or to_update)
 
         self.stdout.write(
             f"  Clubs: {len(to_create)} created, {len(to_update)} updated, "
@@ -260,6 +288,7 @@ class Command(BaseCommand):
                         setattr(player, field, value)
                         changed = True
                 if changed:
+                    player.updated_at = timezone.now()
                     to_update.append(player)
             else:
                 to_create.append(ReferencePlayer(
@@ -276,10 +305,11 @@ class Command(BaseCommand):
                     'name', 'slug', 'current_club', 'current_club_name',
                     'on_loan_from_club', 'on_loan_from_club_name',
                     'position', 'date_of_birth', 'citizenship',
-                    'contract_expires', 'image_url',
+                    'contract_expires', 'image_url', 'updated_at',
                 ],
                 batch_size=batch_size,
             )
+        self.players_changed = bool(to_create or to_update)
 
         self.stdout.write(
             f"  Players: {len(to_create)} created, {len(to_update)} updated, "
@@ -320,7 +350,8 @@ class Command(BaseCommand):
         for player in ReferencePlayer.objects.filter(name__in=manager_names):
             if not player.is_manager:
                 player.is_manager = True
-                player.save(update_fields=['is_manager'])
+                player.save(update_fields=['is_manager', 'updated_at'])
                 flagged += 1
+        self.players_changed = self.players_changed or bool(flagged)
 
         self.stdout.write(f"  Flagged {flagged} existing players as managers")
@@ -0,0 +1,60 @@
+"""Rescore journalists queued by claim changes.
+
+Runs as a long-lived worker by default, polling the queue every
+SCORE_QUEUE_POLL_SECONDS. Use --once to drain due entries and exit
+(e.g. from cron), or --all to ignore the debounce window.
+
+Usage:
+    python manage.py process_score_queue
+    python manage.py process_score_queue --once
+    python manage.py process_score_queue --once --all
+"""
+
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.claims.services.score_queue import ScoreQueue
+
+
+class Command(BaseCommand):
+    help = 'Process the queue of journalists waiting to be rescored'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Process due entries once and exit',
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Process every queued journalist, ignoring the debounce window',
+        )
+        parser.add_argument(
+            '--poll',
+            type=int,
+            default=settings.SCORE_QUEUE_POLL_SECONDS,
+            help='Seconds between queue checks when running as a worker',
+        )
+
+    def handle(self, *args, **options):
+        debounce = 0 if options['all'] else None
+
+        if options['once']:
+            processed = ScoreQueue.process(debounce=debounce)
+            self.stdout.write(self.style.SUCCESS(f'Rescored {processed} journalists.'))
+            return
+
+        self.stdout.write(f"Processing score queue every {options['poll']}s (Ctrl+C to stop)...")
+        try:
+            while True:
+                close_old_connections()
+                processed = ScoreQueue.process(debounce=debounce)
+                if processed:
+                    self.stdout.write(f'  Rescored {processed} journalists')
+                time.sleep(options['poll'])
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.SUCCESS('Stopped.'))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from apps.claims.services import claim_counters
+
+
+class Command(BaseCommand):
+    help = 'Reconcile the claim counter columns on Journalist with the claims table'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding journalist claim counters...')
+        corrected = claim_counters.rebuild()
+        self.stdout.write(f'  Corrected {corrected} journalists')
+        self.stdout.write(self.style.SUCCESS('Done.'))
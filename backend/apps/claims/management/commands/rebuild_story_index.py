@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from apps.claims.services.scoring import ScoringService
+from apps.claims.services.story_index import StoryIndex
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the persisted story index and refresh journalist speed scores'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--no-rescore',
+            action='store_true',
+            help='Rebuild the index without updating journalist scores',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding story index...')
+        stories = StoryIndex.rebuild()
+        self.stdout.write(f'  Indexed {stories} confirmed stories')
+
+        if not options['no_rescore']:
+            updated = ScoringService.update_all_journalist_scores()
+            self.stdout.write(f'  Rescored {updated} journalists')
+
+        self.stdout.write(self.style.SUCCESS('Done.'))
@@ -2,6 +2,7 @@ from django.core.management.base import BaseCommand
 
 from apps.claims.classifiers import classify_claim_confidence
 from apps.claims.models import Claim
+from apps.claims.services.bulk_updates import bulk_claim_updates
 
 
 class Command(BaseCommand):
@@ -14,6 +15,7 @@ class Command(BaseCommand):
             help='Preview changes without saving',
         )
 
+    @bulk_claim_updates()
     def handle(self, *args, **options):
         dry_run = options['dry_run']
         claims = Claim.objects.all()
@@ -35,7 +37,7 @@ class Command(BaseCommand):
 
                 if not dry_run:
                     claim.certainty_level = new_tier
-                    claim.save(update_fields=['certainty_level'])
+                    claim.save(update_fields=['certainty_level', 'updated_at'])
 
         # Summary
         self.stdout.write('')
@@ -2,7 +2,9 @@ from django.core.management.base import BaseCommand
 
 from apps.claims.classifiers import classify_club_direction
 from apps.claims.models import Claim
+from apps.claims.services.bulk_updates import bulk_claim_updates
 from apps.claims.scrapers.gossip_scraper import _extract_clubs
+from apps.claims.services.club_gazetteer import ClubGazetteer
 
 
 class Command(BaseCommand):
@@ -15,6 +17,7 @@ class Command(BaseCommand):
             help='Preview changes without saving',
         )
 
+    @bulk_claim_updates()
     def handle(self, *args, **options):
         dry_run = options['dry_run']
         claims = Claim.objects.all()
@@ -23,9 +26,10 @@ class Command(BaseCommand):
         self.stdout.write(f"{'[DRY RUN] ' if dry_run else ''}Re-classifying clubs for {total} claims...")
 
         changed = 0
+        gazetteer = ClubGazetteer.current()
 
         for claim in claims.iterator():
-            clubs = _extract_clubs(claim.claim_text)
+            clubs = _extract_clubs(claim.claim_text, gazetteer)
             new_from, new_to = classify_club_direction(claim.claim_text, clubs)
 
             old_from = claim.from_club
@@ -43,7 +47,7 @@ class Command(BaseCommand):
                 else:
                     claim.from_club = new_from
                     claim.to_club = new_to
-                    claim.save(update_fields=['from_club', 'to_club'])
+                    claim.save(update_fields=['from_club', 'to_club', 'updated_at'])
 
         # Summary
         self.stdout.write('')
@@ -0,0 +1,17 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.claims.services.scoring import ScoringService
+
+
+class Command(BaseCommand):
+    help = 'Recompute truthfulness and speed scores for every journalist in one batch'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rescoring journalists...')
+        start = time.perf_counter()
+        updated = ScoringService.update_all_journalist_scores()
+        elapsed = time.perf_counter() - start
+        self.stdout.write(f'  Rescored {updated} journalists in {elapsed:.2f}s')
+        self.stdout.write(self.style.SUCCESS('Done.'))
@@ -6,6 +6,7 @@ from django.core.management.base import BaseCommand
 from apps.claims.models import ScrapedArticle
 from apps.claims.scrapers import RssScraper, TwitterScraper, WebScraper
 from apps.claims.scrapers.author_extractor import extract_author, _is_social_media_url
+from apps.claims.scrapers.gossip_backfill import run_gossip_backfill
 from apps.claims.scrapers.gossip_scraper import (
     create_claims_from_gossip,
     find_gossip_url_from_rss,
@@ -55,6 +56,11 @@ class Command(BaseCommand):
             default=0,
             help='Backfill gossip columns from N pages of the BBC gossip index (~24 articles per page)',
         )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help='With --pages: start the backfill over instead of resuming an unfinished one',
+        )
         parser.add_argument(
             '--reddit-pages',
             type=int,
@@ -74,7 +80,7 @@ class Command(BaseCommand):
 
         # Handle BBC gossip column (no Claude API needed)
         if 'gossip' in sources:
-            self._handle_gossip(urls, dry_run, pages=pages)
+            self._handle_gossip(urls, dry_run, pages=pages, restart=options['restart'])
 
         # Handle Reddit r/soccer (no API key needed)
         if 'reddit' in sources:
@@ -85,10 +91,10 @@ class Command(BaseCommand):
         if other_sources:
             self._handle_claude_sources(other_sources, urls, dry_run)
 
-    def _handle_gossip(self, urls: list[str], dry_run: bool, pages: int = 0):
+    def _handle_gossip(self, urls: list[str], dry_run: bool, pages: int = 0, restart: bool = False):
         """Scrape BBC Sport gossip column — no API key needed."""
         if pages > 0:
-            self._handle_gossip_backfill(pages, dry_run)
+            self._handle_gossip_backfill(pages, dry_run, restart=restart)
             return
 
         if urls:
@@ -158,8 +164,12 @@ class Command(BaseCommand):
                 count = create_claims_from_gossip(url, dry_run=False)
                 self.stdout.write(self.style.SUCCESS(f'  Created {count} claims from gossip column'))
 
-    def _handle_gossip_backfill(self, pages: int, dry_run: bool):
+    def _handle_gossip_backfill(self, pages: int, dry_run: bool, restart: bool = False):
         """Backfill BBC gossip columns from the BBC gossip index pages."""
+        if not dry_run:
+            self._run_gossip_backfill(pages, restart)
+            return
+
         self.stdout.write(f'Fetching article URLs from {pages} page(s) of BBC gossip index...')
 
         article_urls = find_gossip_urls_from_index(pages=pages)
@@ -171,46 +181,50 @@ class Command(BaseCommand):
 
         self.stdout.write(f'Found {len(article_urls)} articles to process')
 
-        total_claims = 0
-        total_skipped = 0
-
         for url in article_urls:
             self.stdout.write(f'  {url}')
 
-            if dry_run:
-                try:
-                    rumours = scrape_gossip_column(url)
-                    self.stdout.write(self.style.WARNING(
-                        f'    [DRY RUN] Found {len(rumours)} rumours'
-                    ))
-                    for i, r in enumerate(rumours, 1):
-                        source_url = r.get('source_url', '')
-                        author = extract_author(source_url) if source_url else None
-                        journalist_name = author or r['source_publication']
-                        self.stdout.write(f'    {i}. {r["claim_text"][:100]}...')
-                        self.stdout.write(f'       Source: {r["source_publication"]}')
-                        self.stdout.write(f'       Journalist: {journalist_name}')
-                except Exception as e:
-                    self.stderr.write(self.style.ERROR(f'    Error: {e}'))
+            try:
+                rumours = scrape_gossip_column(url)
+                self.stdout.write(self.style.WARNING(
+                    f'    [DRY RUN] Found {len(rumours)} rumours'
+                ))
+                for i, r in enumerate(rumours, 1):
+                    source_url = r.get('source_url', '')
+                    author = extract_author(source_url) if source_url else None
+                    journalist_name = author or r['source_publication']
+                    self.stdout.write(f'    {i}. {r["claim_text"][:100]}...')
+                    self.stdout.write(f'       Source: {r["source_publication"]}')
+                    self.stdout.write(f'       Journalist: {journalist_name}')
+            except Exception as e:
+                self.stderr.write(self.style.ERROR(f'    Error: {e}'))
+
+    def _run_gossip_backfill(self, pages: int, restart: bool):
+        """Fetch concurrently and write through a resumable checkpoint (see gossip_backfill)."""
+        self.stdout.write(f'Backfilling gossip columns from {pages} page(s) of BBC gossip index...')
+
+        def progress(url, count, error):
+            self.stdout.write(f'  {url}')
+            if error is not None:
+                self.stderr.write(self.style.ERROR(f'    Error: {error}'))
+            elif count:
+                self.stdout.write(self.style.SUCCESS(f'    Created {count} claims'))
             else:
-                try:
-                    count = create_claims_from_gossip(url, dry_run=False)
-                    if count > 0:
-                        total_claims += count
-                        self.stdout.write(self.style.SUCCESS(
-                            f'    Created {count} claims'
-                        ))
-                    else:
-                        total_skipped += 1
-                        self.stdout.write(f'    Skipped (already scraped or no rumours)')
-                except Exception as e:
-                    self.stderr.write(self.style.ERROR(f'    Error: {e}'))
+                self.stdout.write('    No new claims')
+
+        result = run_gossip_backfill(pages, restart=restart, progress=progress)
 
         self.stdout.write('')
+        if result.resumed:
+            self.stdout.write('Resumed an unfinished backfill (use --restart to start over)')
         self.stdout.write(self.style.SUCCESS(
-            f'Backfill complete: {total_claims} claims created, '
-            f'{total_skipped} skipped'
+            f'Backfill complete: {result.claims} claims created from {result.articles} articles, '
+            f'{result.skipped} skipped'
         ))
+        if result.failed:
+            self.stderr.write(self.style.WARNING(
+                f'{result.failed} articles could not be fetched; run again to retry them'
+            ))
 
     def _handle_reddit(self, pages: int, dry_run: bool):
         """Scrape r/soccer for transfer rumours — no API key needed."""
@@ -114,7 +114,7 @@ class Command(BaseCommand):
         if not dry_run:
             self.stdout.write(self.style.SUCCESS(
                 f'\nDone! Validated {len(matches)} claim(s). '
-                'Journalist scores updated via signals.'
+                'Journalists rescored.'
             ))
 
 
@@ -0,0 +1,283 @@
+# Generated by Django 5.0.1 on 2026-10-17 04:31
+
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Frozen copy of StoryIndex.rebuild() as of this migration (no claim has a
+# ReferencePlayer yet), so code changes do not change what it writes.
+# rebuild_story_index rebuilds with the current rules.
+CLUB_ALIASES = {
+    'man utd': 'manchester united',
+    'man united': 'manchester united',
+    'man city': 'manchester city',
+    'spurs': 'tottenham hotspur',
+    'wolves': 'wolverhampton wanderers',
+    'newcastle': 'newcastle united',
+    'west ham': 'west ham united',
+    'psg': 'paris saint-germain',
+    'paris st-germain': 'paris saint-germain',
+    'inter': 'inter milan',
+    'inter milan': 'fc internazionale milano',
+    'barca': 'barcelona',
+    'bayern': 'bayern munich',
+    'atletico': 'atletico de madrid',
+    'atletico madrid': 'atletico de madrid',
+    'real': 'real madrid',
+}
+
+GRAM_SIZE = 3
+
+
+def normalise_club(name):
+    lowered = name.strip().lower()
+    return CLUB_ALIASES.get(lowered, lowered)
+
+
+def clubs_match(club_a, club_b):
+    if not club_a or not club_b:
+        return False
+    a = normalise_club(club_a)
+    b = normalise_club(club_b)
+    return a in b or b in a
+
+
+def players_match(name_a, name_b):
+    if not name_a or not name_b:
+        return False
+    a = name_a.strip().lower()
+    b = name_b.strip().lower()
+    return a in b or b in a
+
+
+def player_key(player_name):
+    parts = (player_name or '').strip().split()
+    return parts[-1].lower() if parts else ''
+
+
+def claim_in_story(player_name, to_club, story_player, story_club):
+    if not players_match(player_name, story_player):
+        return False
+    if story_club:
+        return bool(to_club) and clubs_match(to_club, story_club)
+    return True
+
+
+def _grams(name):
+    return {name[i:i + GRAM_SIZE] for i in range(len(name) - GRAM_SIZE + 1)}
+
+
+def cluster_stories(pairs):
+    """Group (player, to_club) pairs into stories; the first pair of each story names it."""
+    stories, names, clubs = [], [], []
+    postings = defaultdict(set)
+    by_name = defaultdict(list)
+    short = []
+
+    def candidates(name):
+        grams = _grams(name)
+        if not grams:
+            return set(range(len(stories)))
+        lists = sorted((postings.get(g, set()) for g in grams), key=len)
+        found = set(lists[0])
+        for posting in lists[1:]:
+            found &= posting
+        found.update(short)
+        for start in range(len(name)):
+            for end in range(start + GRAM_SIZE, len(name) + 1):
+                found.update(by_name.get(name[start:end], ()))
+        return found
+
+    for player, club in pairs:
+        name = player.strip().lower()
+        if not name:
+            continue
+        club_norm = normalise_club(club) if club else ''
+        covered = False
+        for idx in candidates(name):
+            story_name = names[idx]
+            if not (name in story_name or story_name in name):
+                continue
+            if club_norm and clubs[idx] and not (club_norm in clubs[idx] or clubs[idx] in club_norm):
+                continue
+            covered = True
+            break
+        if covered:
+            continue
+        idx = len(stories)
+        stories.append((player, club or ''))
+        names.append(name)
+        clubs.append(club_norm)
+        by_name[name].append(idx)
+        grams = _grams(name)
+        if not grams:
+            short.append(idx)
+        for gram in grams:
+            postings[gram].add(idx)
+    return stories
+
+
+def build_story_index(apps, schema_editor):
+    """Seed a story per confirmed transfer and rank each story's reporters."""
+    Claim = apps.get_model('claims', 'Claim')
+    Story = apps.get_model('claims', 'Story')
+    StoryReport = apps.get_model('claims', 'StoryReport')
+
+    confirmed = (
+        Claim.objects
+        .filter(validation_status='confirmed_true')
+        .exclude(player_name='')
+        .order_by('-claim_date', 'id')
+        .values_list('player_name', 'to_club')
+    )
+    seeds = cluster_stories(dict.fromkeys((player.strip(), club) for player, club in confirmed))
+
+    by_key = defaultdict(list)
+    for row in (
+        Claim.objects
+        .exclude(player_name='')
+        .order_by('claim_date', 'id')
+        .values_list('id', 'journalist_id', 'claim_date', 'player_name', 'to_club')
+        .iterator(chunk_size=2000)
+    ):
+        by_key[player_key(row[3])].append(row)
+
+    stories = Story.objects.bulk_create([
+        Story(player_name=player, to_club=club, player_key=player_key(player))
+        for player, club in seeds
+    ])
+
+    through = Story.claims.through
+    memberships = []
+    reports = []
+    for story in stories:
+        members = [
+            row for row in by_key.get(story.player_key, [])
+            if claim_in_story(row[3], row[4], story.player_name, story.to_club)
+        ]
+        memberships.extend(through(story_id=story.id, claim_id=row[0]) for row in members)
+
+        first_claims = []
+        seen = set()
+        for claim_id, journalist_id, claim_date, _, _ in members:
+            if journalist_id not in seen:
+                seen.add(journalist_id)
+                first_claims.append((journalist_id, claim_id, claim_date))
+        n = len(first_claims)
+        if n >= 2:
+            reports.extend(
+                StoryReport(
+                    story_id=story.id,
+                    journalist_id=journalist_id,
+                    first_claim_id=claim_id,
+                    first_reported_at=claim_date,
+                    position=rank_idx + 1,
+                    earliness=(n - 1 - rank_idx) / (n - 1),
+                )
+                for rank_idx, (journalist_id, claim_id, claim_date) in enumerate(first_claims)
+            )
+        story.reporter_count = len({row[1] for row in members})
+
+    through.objects.bulk_create(memberships, batch_size=1000)
+    StoryReport.objects.bulk_create(reports, batch_size=1000)
+    Story.objects.bulk_update(stories, ['reporter_count'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('claims', '0007_referenceclub_referenceplayer'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Story',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('player_name', models.CharField(max_length=500)),
+                ('to_club', models.CharField(blank=True, max_length=500)),
+                ('player_key', models.CharField(db_index=True, help_text='Lowercased player surname used to find candidate claims', max_length=200)),
+                ('reporter_count', models.IntegerField(default=0, help_text='Number of distinct journalists who reported this story')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Story',
+                'verbose_name_plural': 'Stories',
+                'ordering': ['player_name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='StoryReport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('first_reported_at', models.DateTimeField()),
+                ('position', models.IntegerField(help_text="1-based rank among the story's reporters")),
+                ('earliness', models.FloatField(help_text='1.0 for the first reporter, 0.0 for the last')),
+            ],
+            options={
+                'verbose_name': 'Story Report',
+                'verbose_name_plural': 'Story Reports',
+                'ordering': ['story', 'position'],
+            },
+        ),
+        migrations.RenameIndex(
+            model_name='referenceclub',
+            new_name='claims_refe_name_3b3e48_idx',
+            old_name='claims_refe_name_club_idx',
+        ),
+        migrations.RenameIndex(
+            model_name='referenceclub',
+            new_name='claims_refe_country_e968db_idx',
+            old_name='claims_refe_country_idx',
+        ),
+        migrations.RenameIndex(
+            model_name='referenceplayer',
+            new_name='claims_refe_name_096aa2_idx',
+            old_name='claims_refe_name_player_idx',
+        ),
+        migrations.RenameIndex(
+            model_name='referenceplayer',
+            new_name='claims_refe_current_becd14_idx',
+            old_name='claims_refe_club_name_idx',
+        ),
+        migrations.RenameIndex(
+            model_name='referenceplayer',
+            new_name='claims_refe_positio_c43134_idx',
+            old_name='claims_refe_position_idx',
+        ),
+        migrations.AddField(
+            model_name='story',
+            name='claims',
+            field=models.ManyToManyField(blank=True, related_name='stories', to='claims.claim'),
+        ),
+        migrations.AddField(
+            model_name='storyreport',
+            name='first_claim',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='story_reports', to='claims.claim'),
+        ),
+        migrations.AddField(
+            model_name='storyreport',
+            name='journalist',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='story_reports', to='claims.journalist'),
+        ),
+        migrations.AddField(
+            model_name='storyreport',
+            name='story',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reports', to='claims.story'),
+        ),
+        migrations.AddIndex(
+            model_name='story',
+            index=models.Index(fields=['player_key'], name='claims_stor_player__e13ea3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='storyreport',
+            index=models.Index(fields=['journalist', 'story'], name='claims_stor_journal_5db07b_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='storyreport',
+            unique_together={('story', 'journalist')},
+        ),
+        migrations.RunPython(build_story_index, migrations.RunPython.noop),
+    ]
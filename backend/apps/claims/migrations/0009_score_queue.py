@@ -0,0 +1,29 @@
+# Generated by Django 5.0.1 on 2026-10-17 04:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('claims', '0008_story_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DirtyJournalist',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('first_marked_at', models.DateTimeField(help_text='When the journalist was first queued')),
+                ('last_marked_at', models.DateTimeField(db_index=True, help_text='Most recent change; processing waits until this is quiet')),
+                ('record_history', models.BooleanField(default=False, help_text='A validated claim changed, so record a ScoreHistory entry')),
+                ('journalist', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='score_queue_entry', to='claims.journalist')),
+            ],
+            options={
+                'verbose_name': 'Dirty Journalist',
+                'verbose_name_plural': 'Dirty Journalists',
+                'ordering': ['first_marked_at'],
+            },
+        ),
+    ]
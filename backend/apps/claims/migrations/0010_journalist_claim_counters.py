@@ -0,0 +1,78 @@
+# Generated by Django 5.0.1 on 2026-10-17 04:47
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def populate_counters(apps, schema_editor):
+    """Fill the new counter columns from existing claims in one aggregate query."""
+    Claim = apps.get_model('claims', 'Claim')
+    Journalist = apps.get_model('claims', 'Journalist')
+
+    rows = (
+        Claim.objects
+        .values('journalist_id')
+        .annotate(
+            total_claims=Count('id'),
+            validated_claims=Count('id', filter=~Q(validation_status='pending')),
+            pending_claims=Count('id', filter=Q(validation_status='pending')),
+            true_claims=Count('id', filter=Q(validation_status='confirmed_true')),
+            false_claims=Count('id', filter=Q(validation_status='proven_false')),
+            partially_true_claims=Count('id', filter=Q(validation_status='partially_true')),
+            original_scoops=Count('id', filter=Q(source_type='original')),
+            first_to_report_count=Count('id', filter=Q(source_type='original', is_first_claim=True)),
+        )
+    )
+    for row in rows:
+        Journalist.objects.filter(pk=row.pop('journalist_id')).update(**row)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('claims', '0009_score_queue'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='journalist',
+            name='false_claims',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='journalist',
+            name='first_to_report_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='journalist',
+            name='original_scoops',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='journalist',
+            name='partially_true_claims',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='journalist',
+            name='pending_claims',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='journalist',
+            name='total_claims',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='journalist',
+            name='true_claims',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='journalist',
+            name='validated_claims',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.0.1 on 2026-10-17 04:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('claims', '0010_journalist_claim_counters'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='claim',
+            name='claims_clai_claim_d_bf2f08_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='claim',
+            name='claims_clai_validat_38e289_idx',
+        ),
+        migrations.AddIndex(
+            model_name='claim',
+            index=models.Index(fields=['-claim_date', '-id'], name='claims_clai_claim_d_07f06e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='claim',
+            index=models.Index(fields=['-validation_date', '-id'], name='claims_clai_validat_33bf9a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='claim',
+            index=models.Index(fields=['validation_status', '-claim_date', '-id'], name='claims_clai_validat_6162b6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='claim',
+            index=models.Index(fields=['journalist', '-claim_date', '-id'], name='claims_clai_journal_4bc9dd_idx'),
+        ),
+    ]
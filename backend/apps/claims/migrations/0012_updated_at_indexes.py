@@ -0,0 +1,21 @@
+# Generated by Django 5.0.1 on 2026-10-17 04:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('claims', '0011_claim_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='claim',
+            index=models.Index(fields=['updated_at'], name='claims_clai_updated_03cf69_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='story',
+            index=models.Index(fields=['updated_at'], name='claims_stor_updated_7e3de1_idx'),
+        ),
+    ]
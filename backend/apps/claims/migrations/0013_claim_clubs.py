@@ -0,0 +1,166 @@
+# Generated by Django 5.0.1 on 2026-10-17 05:01
+
+import re
+import unicodedata
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Frozen copy of club_resolver's keys and resolution rules (with
+# validator.CLUB_ALIASES), so code changes do not change what this
+# migration writes. backfill_claim_clubs relinks with the current rules.
+CLUB_ALIASES = {
+    'man utd': 'manchester united',
+    'man united': 'manchester united',
+    'man city': 'manchester city',
+    'spurs': 'tottenham hotspur',
+    'wolves': 'wolverhampton wanderers',
+    'newcastle': 'newcastle united',
+    'west ham': 'west ham united',
+    'psg': 'paris saint-germain',
+    'paris st-germain': 'paris saint-germain',
+    'inter': 'inter milan',
+    'inter milan': 'fc internazionale milano',
+    'barca': 'barcelona',
+    'bayern': 'bayern munich',
+    'atletico': 'atletico de madrid',
+    'atletico madrid': 'atletico de madrid',
+    'real': 'real madrid',
+}
+
+_AFFIXES = {
+    'fc', 'afc', 'cf', 'sc', 'ac', 'as', 'ssc', 'sv', 'fk', 'sk', 'cd', 'sd', 'ud',
+    'rc', 'rcd', 'ca', 'sl', 'bsc', 'tsg', 'vfb', 'vfl', 'club', 'calcio', 'the',
+}
+
+_NON_WORD_RE = re.compile(r'[^a-z0-9]+')
+
+
+def club_key(name):
+    text = unicodedata.normalize('NFKD', name or '').encode('ascii', 'ignore').decode().lower().strip()
+    for _ in range(3):
+        text = CLUB_ALIASES.get(text, text)
+    text = _NON_WORD_RE.sub(' ', text).strip()
+    text = CLUB_ALIASES.get(text, text)
+    tokens = [
+        token for token in _NON_WORD_RE.sub(' ', text).split()
+        if token not in _AFFIXES and not token.isdigit()
+    ]
+    return ' '.join(tokens)
+
+
+class ClubResolver:
+    def __init__(self, clubs):
+        self._by_key = {}
+        self._by_token = defaultdict(set)
+        self._token_counts = {}
+        ambiguous = set()
+        for club_id, name in clubs:
+            key = club_key(name)
+            if not key:
+                continue
+            if key in self._by_key and self._by_key[key] != club_id:
+                ambiguous.add(key)
+            self._by_key.setdefault(key, club_id)
+            tokens = key.split()
+            self._token_counts[club_id] = len(tokens)
+            for token in tokens:
+                self._by_token[token].add(club_id)
+        for key in ambiguous:
+            del self._by_key[key]
+        self._cache = {}
+
+    def resolve_key(self, key):
+        if key not in self._cache:
+            self._cache[key] = self._resolve_key(key)
+        return self._cache[key]
+
+    def _resolve_key(self, key):
+        if not key:
+            return None
+        if key in self._by_key:
+            return self._by_key[key]
+        postings = [self._by_token.get(token) for token in key.split()]
+        if not all(postings):
+            return None
+        candidates = set.intersection(*postings)
+        if len(candidates) <= 1:
+            return next(iter(candidates), None)
+        fewest = min(self._token_counts[c] for c in candidates)
+        best = [c for c in candidates if self._token_counts[c] == fewest]
+        return best[0] if len(best) == 1 else None
+
+
+def field_links(value, resolver):
+    links = {}
+    for name in (value or '').split(','):
+        key = club_key(name.strip())
+        if key and key not in links:
+            links[key] = resolver.resolve_key(key)
+    return links
+
+
+def populate_club_links(apps, schema_editor):
+    """
+    Link every club name on existing claims, with its reference club if
+    the name resolves.
+    """
+    Claim = apps.get_model('claims', 'Claim')
+    ClaimClub = apps.get_model('claims', 'ClaimClub')
+    ReferenceClub = apps.get_model('claims', 'ReferenceClub')
+
+    resolver = ClubResolver(ReferenceClub.objects.values_list('id', 'name'))
+    links = []
+    for claim_id, from_club, to_club in Claim.objects.order_by('id').values_list('id', 'from_club', 'to_club').iterator(chunk_size=2000):
+        for direction, value in (('from', from_club), ('to', to_club)):
+            links.extend(
+                ClaimClub(claim_id=claim_id, direction=direction, name_key=key, club_id=club_id)
+                for key, club_id in field_links(value, resolver).items()
+            )
+        if len(links) >= 20000:
+            ClaimClub.objects.bulk_create(links)
+            links = []
+    ClaimClub.objects.bulk_create(links)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('claims', '0012_updated_at_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClaimClub',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name_key', models.CharField(help_text='Comparison key of the club name', max_length=500)),
+                ('direction', models.CharField(choices=[('from', 'From'), ('to', 'To')], max_length=4)),
+                ('claim', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='club_links', to='claims.claim')),
+                ('club', models.ForeignKey(blank=True, help_text='Empty when the name does not resolve to a reference club', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='claim_links', to='claims.referenceclub')),
+            ],
+            options={
+                'verbose_name': 'Claim Club',
+                'verbose_name_plural': 'Claim Clubs',
+            },
+        ),
+        migrations.AddField(
+            model_name='claim',
+            name='clubs',
+            field=models.ManyToManyField(blank=True, related_name='claims', through='claims.ClaimClub', to='claims.referenceclub'),
+        ),
+        migrations.AddIndex(
+            model_name='claimclub',
+            index=models.Index(fields=['club', 'direction'], name='claims_clai_club_id_51f4c2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='claimclub',
+            index=models.Index(fields=['name_key', 'direction'], name='claims_clai_name_ke_9a7fe0_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='claimclub',
+            unique_together={('claim', 'name_key', 'direction')},
+        ),
+        migrations.RunPython(populate_club_links, migrations.RunPython.noop),
+    ]
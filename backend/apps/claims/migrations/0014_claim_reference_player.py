@@ -0,0 +1,24 @@
+# Generated by Django 5.0.1 on 2026-10-17 05:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('claims', '0013_claim_clubs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='claim',
+            name='reference_player',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='claims', to='claims.referenceplayer'),
+        ),
+        migrations.AddField(
+            model_name='story',
+            name='reference_player',
+            field=models.ForeignKey(blank=True, help_text='Canonical player, when the seeding claim resolved to one', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='stories', to='claims.referenceplayer'),
+        ),
+    ]
@@ -0,0 +1,89 @@
+# Generated by Django 5.0.1 on 2026-10-17 05:24
+
+import hashlib
+import re
+import zlib
+
+import django.db.models.deletion
+import numpy as np
+from django.db import migrations, models
+
+# Frozen copy of near_duplicates.band_keys() with its default parameters, so
+# neither code changes nor the NEAR_DUPLICATE_* settings change what this
+# migration writes. Deployments with other band settings must run
+# backfill_near_duplicate_index, as after any change to them.
+SHINGLE_SIZE = 4
+NUM_BANDS = 32
+ROWS_PER_BAND = 3
+
+_PRIME = (1 << 31) - 1
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _coefficients(count, salt):
+    values = [
+        int.from_bytes(hashlib.blake2b(f'{salt}{i}'.encode(), digest_size=8).digest(), 'little') % (_PRIME - 1) + 1
+        for i in range(count)
+    ]
+    return np.array(values, dtype=np.uint64)[:, None]
+
+
+_A = _coefficients(NUM_BANDS * ROWS_PER_BAND, 'a')
+_B = _coefficients(NUM_BANDS * ROWS_PER_BAND, 'b')
+
+
+def band_keys(text):
+    text = _WHITESPACE_RE.sub(' ', (text or '').lower()).strip()
+    if len(text) <= SHINGLE_SIZE:
+        grams = {text} if text else set()
+    else:
+        grams = {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+    if not grams:
+        return []
+    hashes = np.fromiter((zlib.crc32(g.encode()) for g in grams), dtype=np.uint64, count=len(grams))
+    signature = ((_A * (hashes % _PRIME) + _B) % _PRIME).min(axis=1)
+    rows = signature.astype('<u8').reshape(NUM_BANDS, ROWS_PER_BAND)
+    return [
+        int.from_bytes(
+            hashlib.blake2b(band.to_bytes(2, 'little') + row.tobytes(), digest_size=8).digest(),
+            'little', signed=True,
+        )
+        for band, row in enumerate(rows)
+    ]
+
+
+def populate_bands(apps, schema_editor):
+    """Hash the text of every existing claim, in batches."""
+    Claim = apps.get_model('claims', 'Claim')
+    ClaimTextBand = apps.get_model('claims', 'ClaimTextBand')
+
+    bands = []
+    for claim_id, text in Claim.objects.order_by('id').values_list('id', 'claim_text').iterator(chunk_size=2000):
+        bands.extend(ClaimTextBand(claim_id=claim_id, key=key) for key in dict.fromkeys(band_keys(text)))
+        if len(bands) >= 20000:
+            ClaimTextBand.objects.bulk_create(bands)
+            bands = []
+    ClaimTextBand.objects.bulk_create(bands)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('claims', '0014_claim_reference_player'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClaimTextBand',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.BigIntegerField(db_index=True)),
+                ('claim', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='text_bands', to='claims.claim')),
+            ],
+            options={
+                'verbose_name': 'Claim Text Band',
+                'verbose_name_plural': 'Claim Text Bands',
+            },
+        ),
+        migrations.RunPython(populate_bands, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.0.1 on 2026-10-17 09:12
+
+import hashlib
+import re
+import unicodedata
+
+from django.db import migrations, models
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+# Frozen copies of claim_ingest.normalize() and content_hash(), so later
+# changes to the live functions cannot change what this migration writes
+def normalize(value):
+    value = unicodedata.normalize('NFKC', value or '').casefold()
+    return _WHITESPACE_RE.sub(' ', value).strip()
+
+
+def content_hash(journalist_name, player_name, from_club, to_club, claim_text):
+    parts = (journalist_name, player_name, from_club, to_club, claim_text)
+    return hashlib.sha256('\x1f'.join(normalize(part) for part in parts).encode()).hexdigest()
+
+
+def populate_content_hashes(apps, schema_editor):
+    """Hash every existing claim; a repeat of an earlier claim keeps no hash."""
+    Claim = apps.get_model('claims', 'Claim')
+
+    seen = set()
+    batch = []
+    rows = (
+        Claim.objects.order_by('id')
+        .values_list('id', 'journalist__name', 'player_name', 'from_club', 'to_club', 'claim_text')
+        .iterator(chunk_size=2000)
+    )
+    for claim_id, *fields in rows:
+        digest = content_hash(*fields)
+        if digest in seen:
+            continue
+        seen.add(digest)
+        batch.append(Claim(id=claim_id, content_hash=digest))
+        if len(batch) >= 2000:
+            Claim.objects.bulk_update(batch, ['content_hash'])
+            batch = []
+    Claim.objects.bulk_update(batch, ['content_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('claims', '0015_claim_text_band'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='claim',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True),
+        ),
+        migrations.RunPython(populate_content_hashes, migrations.RunPython.noop),
+    ]
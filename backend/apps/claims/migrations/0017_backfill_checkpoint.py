@@ -0,0 +1,31 @@
+# Generated by Django 5.0.1 on 2026-10-17 06:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('claims', '0016_claim_content_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BackfillCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text="e.g. 'bbc-gossip'", max_length=100, unique=True)),
+                ('pages', models.IntegerField(default=0, help_text='Index pages the URLs were collected from')),
+                ('urls', models.JSONField(default=list, help_text='Article URLs to process, in order')),
+                ('articles_done', models.IntegerField(default=0)),
+                ('claims_created', models.IntegerField(default=0)),
+                ('started_at', models.DateTimeField()),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Backfill Checkpoint',
+                'verbose_name_plural': 'Backfill Checkpoints',
+            },
+        ),
+    ]
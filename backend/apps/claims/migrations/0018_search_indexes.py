@@ -0,0 +1,130 @@
+# Generated by Django 5.0.1 on 2026-10-17 06:31
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# Frozen copies of what services.search queries against: the PostgreSQL GIN
+# expressions must stay identical to PostgresSearchBackend.document_sql(),
+# and the SQLite mirrors to SQLiteFTSBackend.mirror_sql().
+
+POSTGRES_INDEXES = [
+    (
+        'CREATE INDEX IF NOT EXISTS "claims_claim_search_idx" ON "claims_claim" USING gin ((setweight(to_tsvector(\'simple\'::regconfig, coalesce("player_name"::text, \'\') || \' \' || coalesce("to_club"::text, \'\') || \' \' || coalesce("from_club"::text, \'\')), \'A\') || setweight(to_tsvector(\'simple\'::regconfig, coalesce("claim_text"::text, \'\')), \'B\')))',
+        'DROP INDEX IF EXISTS "claims_claim_search_idx"',
+    ),
+    (
+        'CREATE INDEX IF NOT EXISTS "claims_claim_player_name_trgm_idx" ON "claims_claim" USING gin ("player_name" gin_trgm_ops)',
+        'DROP INDEX IF EXISTS "claims_claim_player_name_trgm_idx"',
+    ),
+    (
+        'CREATE INDEX IF NOT EXISTS "claims_journalist_search_idx" ON "claims_journalist" USING gin ((setweight(to_tsvector(\'simple\'::regconfig, coalesce("name"::text, \'\') || \' \' || coalesce("twitter_handle"::text, \'\')), \'A\') || setweight(to_tsvector(\'simple\'::regconfig, coalesce("publications"::text, \'\')), \'B\')))',
+        'DROP INDEX IF EXISTS "claims_journalist_search_idx"',
+    ),
+    (
+        'CREATE INDEX IF NOT EXISTS "claims_journalist_name_trgm_idx" ON "claims_journalist" USING gin ("name" gin_trgm_ops)',
+        'DROP INDEX IF EXISTS "claims_journalist_name_trgm_idx"',
+    ),
+    (
+        'CREATE INDEX IF NOT EXISTS "claims_referenceplayer_search_idx" ON "claims_referenceplayer" USING gin ((setweight(to_tsvector(\'simple\'::regconfig, coalesce("name"::text, \'\')), \'A\') || setweight(to_tsvector(\'simple\'::regconfig, coalesce("current_club_name"::text, \'\')), \'B\')))',
+        'DROP INDEX IF EXISTS "claims_referenceplayer_search_idx"',
+    ),
+    (
+        'CREATE INDEX IF NOT EXISTS "claims_referenceplayer_name_trgm_idx" ON "claims_referenceplayer" USING gin ("name" gin_trgm_ops)',
+        'DROP INDEX IF EXISTS "claims_referenceplayer_name_trgm_idx"',
+    ),
+]
+
+SQLITE_MIRRORS = [
+    (
+        'claims_claim_fts',
+        "CREATE VIRTUAL TABLE IF NOT EXISTS claims_claim_fts USING fts5(player_name, to_club, from_club, claim_text, content='claims_claim', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+        [
+            'CREATE TRIGGER IF NOT EXISTS claims_claim_fts_ai AFTER INSERT ON claims_claim BEGIN INSERT INTO claims_claim_fts(rowid, player_name, to_club, from_club, claim_text) VALUES (new.id, new.player_name, new.to_club, new.from_club, new.claim_text); END',
+            "CREATE TRIGGER IF NOT EXISTS claims_claim_fts_ad AFTER DELETE ON claims_claim BEGIN INSERT INTO claims_claim_fts(claims_claim_fts, rowid, player_name, to_club, from_club, claim_text) VALUES ('delete', old.id, old.player_name, old.to_club, old.from_club, old.claim_text); END",
+            "CREATE TRIGGER IF NOT EXISTS claims_claim_fts_au AFTER UPDATE OF player_name, to_club, from_club, claim_text ON claims_claim BEGIN INSERT INTO claims_claim_fts(claims_claim_fts, rowid, player_name, to_club, from_club, claim_text) VALUES ('delete', old.id, old.player_name, old.to_club, old.from_club, old.claim_text); INSERT INTO claims_claim_fts(rowid, player_name, to_club, from_club, claim_text) VALUES (new.id, new.player_name, new.to_club, new.from_club, new.claim_text); END",
+        ],
+    ),
+    (
+        'claims_journalist_fts',
+        "CREATE VIRTUAL TABLE IF NOT EXISTS claims_journalist_fts USING fts5(name, twitter_handle, publications, content='claims_journalist', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+        [
+            'CREATE TRIGGER IF NOT EXISTS claims_journalist_fts_ai AFTER INSERT ON claims_journalist BEGIN INSERT INTO claims_journalist_fts(rowid, name, twitter_handle, publications) VALUES (new.id, new.name, new.twitter_handle, new.publications); END',
+            "CREATE TRIGGER IF NOT EXISTS claims_journalist_fts_ad AFTER DELETE ON claims_journalist BEGIN INSERT INTO claims_journalist_fts(claims_journalist_fts, rowid, name, twitter_handle, publications) VALUES ('delete', old.id, old.name, old.twitter_handle, old.publications); END",
+            "CREATE TRIGGER IF NOT EXISTS claims_journalist_fts_au AFTER UPDATE OF name, twitter_handle, publications ON claims_journalist BEGIN INSERT INTO claims_journalist_fts(claims_journalist_fts, rowid, name, twitter_handle, publications) VALUES ('delete', old.id, old.name, old.twitter_handle, old.publications); INSERT INTO claims_journalist_fts(rowid, name, twitter_handle, publications) VALUES (new.id, new.name, new.twitter_handle, new.publications); END",
+        ],
+    ),
+    (
+        'claims_referenceplayer_fts',
+        "CREATE VIRTUAL TABLE IF NOT EXISTS claims_referenceplayer_fts USING fts5(name, current_club_name, content='claims_referenceplayer', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+        [
+            'CREATE TRIGGER IF NOT EXISTS claims_referenceplayer_fts_ai AFTER INSERT ON claims_referenceplayer BEGIN INSERT INTO claims_referenceplayer_fts(rowid, name, current_club_name) VALUES (new.id, new.name, new.current_club_name); END',
+            "CREATE TRIGGER IF NOT EXISTS claims_referenceplayer_fts_ad AFTER DELETE ON claims_referenceplayer BEGIN INSERT INTO claims_referenceplayer_fts(claims_referenceplayer_fts, rowid, name, current_club_name) VALUES ('delete', old.id, old.name, old.current_club_name); END",
+            "CREATE TRIGGER IF NOT EXISTS claims_referenceplayer_fts_au AFTER UPDATE OF name, current_club_name ON claims_referenceplayer BEGIN INSERT INTO claims_referenceplayer_fts(claims_referenceplayer_fts, rowid, name, current_club_name) VALUES ('delete', old.id, old.name, old.current_club_name); INSERT INTO claims_referenceplayer_fts(rowid, name, current_club_name) VALUES (new.id, new.name, new.current_club_name); END",
+        ],
+    ),
+]
+
+
+class PostgresTrigramExtension(TrigramExtension):
+    """TrigramExtension whose reverse is skipped off PostgreSQL, as its forward is (Django 5.0)."""
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+class VendorRunSQL(migrations.RunSQL):
+    """RunSQL that only runs on one database vendor (and on SQLite, only with FTS5)."""
+
+    def __init__(self, vendor, *args, **kwargs):
+        self.vendor = vendor
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, args, kwargs = super().deconstruct()
+        return name, [self.vendor, *args], kwargs
+
+    def applies_to(self, connection):
+        if connection.vendor != self.vendor:
+            return False
+        if self.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.execute('PRAGMA compile_options')
+                # Without FTS5, search falls back to ICONTAINS
+                return any(row[0] == 'ENABLE_FTS5' for row in cursor.fetchall())
+        return True
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if self.applies_to(schema_editor.connection):
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if self.applies_to(schema_editor.connection):
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+def sqlite_mirror(table, create_table, triggers):
+    """Create one FTS5 mirror and its triggers, then fill it from the table."""
+    names = [f'{table}_ai', f'{table}_ad', f'{table}_au']
+    return VendorRunSQL(
+        'sqlite',
+        [create_table, *triggers, f"INSERT INTO {table}({table}) VALUES ('rebuild')"],
+        [*(f'DROP TRIGGER IF EXISTS {name}' for name in names), f'DROP TABLE IF EXISTS {table}'],
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('claims', '0017_backfill_checkpoint'),
+    ]
+
+    operations = [
+        PostgresTrigramExtension(),
+        VendorRunSQL(
+            'postgresql',
+            [sql for sql, _ in POSTGRES_INDEXES],
+            [reverse_sql for _, reverse_sql in POSTGRES_INDEXES],
+        ),
+        *(sqlite_mirror(*mirror) for mirror in SQLITE_MIRRORS),
+    ]
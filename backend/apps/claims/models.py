@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.utils.text import slugify
 
 
@@ -26,6 +26,27 @@ class Journalist(models.Model):
         help_text="Percentage of original scoops that were first to report"
     )
 
+    # Claim counters (kept in sync by claim signals, see services/claim_counters.py)
+    total_claims = models.IntegerField(default=0, editable=False)
+    validated_claims = models.IntegerField(default=0, editable=False)
+    pending_claims = models.IntegerField(default=0, editable=False)
+    true_claims = models.IntegerField(default=0, editable=False)
+    false_claims = models.IntegerField(default=0, editable=False)
+    partially_true_claims = models.IntegerField(default=0, editable=False)
+    original_scoops = models.IntegerField(default=0, editable=False)
+    first_to_report_count = models.IntegerField(default=0, editable=False)
+
+    COUNTER_FIELDS = (
+        'total_claims',
+        'validated_claims',
+        'pending_claims',
+        'true_claims',
+        'false_claims',
+        'partially_true_claims',
+        'original_scoops',
+        'first_to_report_count',
+    )
+
     # Metadata
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -46,6 +67,13 @@ class Journalist(models.Model):
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.name)
+        # Counters only change through F() updates; a full save from a
+        # stale instance must not overwrite them
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                f.name for f in self._meta.concrete_fields
+                if not f.primary_key and f.name not in self.COUNTER_FIELDS
+            ]
         super().save(*args, **kwargs)
 
 
@@ -116,6 +144,21 @@ class Claim(models.Model):
     player_name = models.CharField(max_length=500, blank=True)
     from_club = models.CharField(max_length=500, blank=True)
     to_club = models.CharField(max_length=500, blank=True)
+    # Canonical clubs resolved from from_club/to_club (see services/club_resolver.py)
+    clubs = models.ManyToManyField(
+        'ReferenceClub',
+        through='ClaimClub',
+        related_name='claims',
+        blank=True,
+    )
+    # Canonical player resolved from player_name (see services/player_resolver.py)
+    reference_player = models.ForeignKey(
+        'ReferencePlayer',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='claims',
+    )
     transfer_fee = models.CharField(
         max_length=100,
         blank=True,
@@ -166,6 +209,16 @@ class Claim(models.Model):
         help_text="Was this journalist first to report this story?"
     )
 
+    # Normalised hash of journalist, player, clubs and text, kept in step with
+    # edits; unique so re-ingesting a claim is a no-op (see services/claim_ingest.py)
+    content_hash = models.CharField(
+        max_length=64,
+        unique=True,
+        null=True,
+        blank=True,
+        editable=False,
+    )
+
     # Metadata
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -173,8 +226,13 @@ class Claim(models.Model):
     class Meta:
         ordering = ['-claim_date']
         indexes = [
-            models.Index(fields=['-claim_date']),
-            models.Index(fields=['validation_status', '-claim_date']),
+            # Keyset pagination seeks on (date, id); see apps.claims.pagination
+            models.Index(fields=['-claim_date', '-id']),
+            models.Index(fields=['-validation_date', '-id']),
+            models.Index(fields=['validation_status', '-claim_date', '-id']),
+            models.Index(fields=['journalist', '-claim_date', '-id']),
+            # max(updated_at) is part of the conditional GET validators
+            models.Index(fields=['updated_at']),
             models.Index(fields=['player_name']),
         ]
         verbose_name = 'Claim'
@@ -183,6 +241,23 @@ class Claim(models.Model):
     def __str__(self):
         return f"{self.journalist.name} - {self.player_name or 'Claim'} ({self.claim_date.strftime('%Y-%m-%d')})"
 
+    # Fields the content hash is computed from
+    CONTENT_FIELDS = ('journalist', 'player_name', 'from_club', 'to_club', 'claim_text')
+
+    def save(self, *args, **kwargs):
+        # The pre_save signal rehashes edited content; a partial save of those
+        # fields must write the new hash too
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {*update_fields} & {*self.CONTENT_FIELDS, 'journalist_id'}:
+            kwargs['update_fields'] = {*update_fields, 'content_hash'}
+        # Journalist counters are adjusted in post_save; commit them together
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            return super().delete(*args, **kwargs)
+
 
 class ScoreHistory(models.Model):
     """Track journalist score changes over time for analytics"""
@@ -372,3 +447,239 @@ class ReferencePlayer(models.Model):
     def __str__(self):
         club = self.current_club_name or 'No Club'
         return f"{self.name} ({club})"
+
+
+class ClaimClub(models.Model):
+    """A club named in a claim's from_club or to_club text.
+
+    Every name gets a link keyed by its comparison key (see
+    services.club_resolver.club_key), and names that resolve also point
+    at their ReferenceClub. Club filters read only this table. Kept in sync
+    by claim signals; backfill_claim_clubs relinks every claim.
+    """
+
+    DIRECTION_FROM = 'from'
+    DIRECTION_TO = 'to'
+
+    DIRECTION_CHOICES = [
+        (DIRECTION_FROM, 'From'),
+        (DIRECTION_TO, 'To'),
+    ]
+
+    claim = models.ForeignKey(
+        Claim,
+        on_delete=models.CASCADE,
+        related_name='club_links',
+    )
+    club = models.ForeignKey(
+        ReferenceClub,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='claim_links',
+        help_text="Empty when the name does not resolve to a reference club",
+    )
+    name_key = models.CharField(max_length=500, help_text="Comparison key of the club name")
+    direction = models.CharField(max_length=4, choices=DIRECTION_CHOICES)
+
+    class Meta:
+        unique_together = [['claim', 'name_key', 'direction']]
+        indexes = [
+            models.Index(fields=['club', 'direction']),
+            models.Index(fields=['name_key', 'direction']),
+        ]
+        verbose_name = 'Claim Club'
+        verbose_name_plural = 'Claim Clubs'
+
+    def __str__(self):
+        club = self.club.name if self.club_id else self.name_key
+        return f"Claim #{self.claim_id} {self.direction} {club}"
+
+
+class ClaimTextBand(models.Model):
+    """One locality-sensitive hash band of a claim's text.
+
+    Claims with a band key in common are near-duplicate candidates (see
+    services.near_duplicates). Kept in sync by claim signals;
+    backfill_near_duplicate_index re-hashes every claim.
+    """
+
+    claim = models.ForeignKey(
+        Claim,
+        on_delete=models.CASCADE,
+        related_name='text_bands',
+    )
+    key = models.BigIntegerField(db_index=True)
+
+    class Meta:
+        verbose_name = 'Claim Text Band'
+        verbose_name_plural = 'Claim Text Bands'
+
+    def __str__(self):
+        return f"Claim #{self.claim_id} band {self.key}"
+
+
+# ---------------------------------------------------------------------------
+# Story index — persisted grouping of claims about the same confirmed transfer
+# ---------------------------------------------------------------------------
+
+class Story(models.Model):
+    """A confirmed transfer story (player + destination) and the claims about it.
+
+    Stories are seeded from confirmed-true claims and maintained
+    incrementally by StoryIndex as claims are created, edited or validated.
+    """
+
+    player_name = models.CharField(max_length=500)
+    to_club = models.CharField(max_length=500, blank=True)
+    player_key = models.CharField(
+        max_length=200,
+        db_index=True,
+        help_text="Lowercased player surname used to find candidate claims",
+    )
+    reference_player = models.ForeignKey(
+        'ReferencePlayer',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='stories',
+        help_text="Canonical player, when the seeding claim resolved to one",
+    )
+    claims = models.ManyToManyField(Claim, related_name='stories', blank=True)
+    reporter_count = models.IntegerField(
+        default=0,
+        help_text="Number of distinct journalists who reported this story",
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['player_name']
+        indexes = [
+            models.Index(fields=['player_key']),
+            models.Index(fields=['updated_at']),
+        ]
+        verbose_name = 'Story'
+        verbose_name_plural = 'Stories'
+
+    def __str__(self):
+        return f"{self.player_name} → {self.to_club or '?'} ({self.reporter_count} reporters)"
+
+
+class StoryReport(models.Model):
+    """A journalist's rank within a story, by date of their earliest claim.
+
+    Only stories with two or more reporters have reports — speed is only
+    meaningful when multiple journalists cover the same story.
+    """
+
+    story = models.ForeignKey(
+        Story,
+        on_delete=models.CASCADE,
+        related_name='reports',
+    )
+    journalist = models.ForeignKey(
+        Journalist,
+        on_delete=models.CASCADE,
+        related_name='story_reports',
+    )
+    first_claim = models.ForeignKey(
+        Claim,
+        on_delete=models.CASCADE,
+        related_name='story_reports',
+    )
+    first_reported_at = models.DateTimeField()
+    position = models.IntegerField(help_text="1-based rank among the story's reporters")
+    earliness = models.FloatField(help_text="1.0 for the first reporter, 0.0 for the last")
+
+    class Meta:
+        ordering = ['story', 'position']
+        unique_together = [['story', 'journalist']]
+        indexes = [
+            models.Index(fields=['journalist', 'story']),
+        ]
+        verbose_name = 'Story Report'
+        verbose_name_plural = 'Story Reports'
+
+    def __str__(self):
+        return f"{self.journalist.name} #{self.position} on {self.story.player_name}"
+
+
+class DirtyJournalist(models.Model):
+    """A journalist whose scores need recomputing.
+
+    Claim saves mark journalists here instead of rescoring inline. The
+    process_score_queue worker rescores each queued journalist once per
+    batch, after changes have been quiet for the debounce window.
+    """
+
+    journalist = models.OneToOneField(
+        Journalist,
+        on_delete=models.CASCADE,
+        related_name='score_queue_entry',
+    )
+    first_marked_at = models.DateTimeField(help_text="When the journalist was first queued")
+    last_marked_at = models.DateTimeField(
+        db_index=True,
+        help_text="Most recent change; processing waits until this is quiet",
+    )
+    record_history = models.BooleanField(
+        default=False,
+        help_text="A validated claim changed, so record a ScoreHistory entry",
+    )
+
+    class Meta:
+        ordering = ['first_marked_at']
+        verbose_name = 'Dirty Journalist'
+        verbose_name_plural = 'Dirty Journalists'
+
+    def __str__(self):
+        return f"{self.journalist.name} (queued {self.first_marked_at:%Y-%m-%d %H:%M:%S})"
+
+
+class BackfillCheckpoint(models.Model):
+    """Progress of a resumable backfill (see scrapers/gossip_backfill.py).
+
+    The article URLs are stored when a run starts, and each article written
+    advances the counters in the same transaction as its claims. A rerun
+    picks up an unfinished checkpoint and skips the articles that already
+    have a ScrapedArticle.
+    """
+
+    name = models.CharField(max_length=100, unique=True, help_text="e.g. 'bbc-gossip'")
+    pages = models.IntegerField(default=0, help_text="Index pages the URLs were collected from")
+    urls = models.JSONField(default=list, help_text="Article URLs to process, in order")
+    articles_done = models.IntegerField(default=0)
+    claims_created = models.IntegerField(default=0)
+    started_at = models.DateTimeField()
+    completed_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Backfill Checkpoint'
+        verbose_name_plural = 'Backfill Checkpoints'
+
+    def __str__(self):
+        state = 'done' if self.completed_at else f'{self.articles_done}/{len(self.urls)}'
+        return f"{self.name} ({state})"
+
+
+class DataVersion(models.Model):
+    """A counter bumped whenever the data behind cached responses changes.
+
+    Held in the database rather than the cache so the web and worker
+    processes see the same value whatever cache backend each one uses
+    (see services.response_cache).
+    """
+
+    name = models.CharField(max_length=100, unique=True, help_text="e.g. 'claims'")
+    version = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Data Version'
+        verbose_name_plural = 'Data Versions'
+
+    def __str__(self):
+        return f"{self.name} v{self.version}"
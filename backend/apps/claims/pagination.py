@@ -0,0 +1,194 @@
+"""Pagination for the claim feeds.
+
+Page-number pagination runs a COUNT(*) and an OFFSET scan on every page,
+which get slower the deeper a client scrolls. Keyset (cursor) pagination
+instead seeks to the last row seen on (claim_date, id) or
+(validation_date, id), using the matching composite index, so every page
+costs the same at any depth.
+
+Cursor mode is opt-in: pass ?cursor= (empty for the first page) and follow
+the returned next/previous links. Without it, responses keep the usual
+page-number format with a count.
+"""
+
+import base64
+import json
+from datetime import datetime
+from urllib import parse
+
+from django.db import connection
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+# Date fields a keyset page can be ordered by; ties are broken by id
+KEYSET_FIELDS = ('claim_date', 'validation_date')
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination on (<date field>, id), in the queryset's own direction.
+
+    NULL dates keep the database's native placement (last when descending
+    on SQLite, first on PostgreSQL), and cursors step across them.
+    """
+
+    page_size = api_settings.PAGE_SIZE
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.field, self.descending = self.get_ordering(queryset)
+        self.queryset_model = queryset.model
+
+        cursor = self.decode_cursor(request)
+        self.cursor = cursor
+        reverse = cursor is not None and cursor['reverse']
+
+        descending = self.descending != reverse
+        queryset = queryset.order_by(*self._order_by(descending))
+        if cursor is not None:
+            queryset = queryset.filter(self._after(cursor, descending))
+
+        # Fetch one extra row to learn whether another page follows
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        if reverse:
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True},
+                'previous': {'type': 'string', 'nullable': True},
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_ordering(self, queryset):
+        """The (field, descending) key the queryset is ordered by."""
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        first = ordering[0] if ordering else None
+        if isinstance(first, str) and first.lstrip('-') in KEYSET_FIELDS:
+            return first.lstrip('-'), first.startswith('-')
+        raise ValidationError({
+            self.cursor_query_param: (
+                f"Cursor pagination requires ordering by {' or '.join(KEYSET_FIELDS)}."
+            ),
+        })
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            # Past the end of the feed: start again from the first page
+            return replace_query_param(self.base_url, self.cursor_query_param, '')
+        return self._link(self.page[0], reverse=True)
+
+    def _order_by(self, descending):
+        if descending:
+            return f'-{self.field}', '-id'
+        return self.field, 'id'
+
+    def _after(self, cursor, descending):
+        """Rows strictly after the cursor position in the given order."""
+        value, pk = cursor['value'], cursor['id']
+        past = 'lt' if descending else 'gt'
+        null = Q(**{f'{self.field}__isnull': True})
+        # Plain ORDER BY keeps the database's own NULL placement, so the
+        # composite index still serves the sort
+        nulls_last = connection.features.nulls_order_largest != descending
+
+        if value is None:
+            after_nulls = null & Q(**{f'id__{past}': pk})
+            return after_nulls if nulls_last else after_nulls | ~null
+
+        # The redundant bound on the date lets the index range scan start at the cursor
+        condition = Q(**{f'{self.field}__{past}e': value}) & (
+            Q(**{f'{self.field}__{past}': value})
+            | Q(**{self.field: value, f'id__{past}': pk})
+        )
+        if nulls_last and self.queryset_model._meta.get_field(self.field).null:
+            return condition | null
+        return condition
+
+    def _link(self, row, reverse):
+        value = getattr(row, self.field)
+        payload = {
+            'value': value.isoformat() if value is not None else None,
+            'id': row.pk,
+            'reverse': reverse,
+        }
+        token = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(parse.unquote(token).encode()))
+            value = payload['value']
+            return {
+                'value': datetime.fromisoformat(value) if value is not None else None,
+                'id': int(payload['id']),
+                'reverse': bool(payload['reverse']),
+            }
+        except (TypeError, ValueError, KeyError):
+            raise NotFound('Invalid cursor')
+
+
+class ClaimFeedPagination(PageNumberPagination):
+    """
+    Page-number pagination that switches to keyset pagination when the
+    request carries a cursor parameter.
+    """
+
+    keyset_class = KeysetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if self.keyset_class.cursor_query_param in request.query_params:
+            self.keyset = self.keyset_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
@@ -168,19 +168,32 @@ def extract_author(url: str) -> str | None:
         _author_cache[url] = None
         return None
 
-    soup = BeautifulSoup(resp.text, 'html.parser')
+    author = parse_author(resp.text)
+    if author:
+        logger.info("Extracted author '%s' from %s", author, url)
+    else:
+        logger.debug("No author found at %s", url)
+
+    _author_cache[url] = author
+    return author
+
+
+def parse_author(html: str) -> str | None:
+    """The author named in a fetched article, or None."""
+    soup = BeautifulSoup(html, 'html.parser')
 
     # Try extraction strategies in priority order
-    author = (
+    return (
         _extract_from_json_ld(soup)
         or _extract_from_meta_tags(soup)
         or _extract_from_byline_selectors(soup)
     )
 
-    if author:
-        logger.info("Extracted author '%s' from %s", author, url)
-    else:
-        logger.debug("No author found at %s", url)
 
+def cache_author(url: str, author: str | None) -> None:
+    """Record an author fetched elsewhere (the async backfill) for extract_author()."""
     _author_cache[url] = author
-    return author
+
+
+def is_author_cached(url: str) -> bool:
+    return url in _author_cache
@@ -5,6 +5,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+from apps.claims.services.phrase_matcher import phrase_pattern
+
 logger = logging.getLogger(__name__)
 
 TRANSFER_KEYWORDS = [
@@ -21,10 +23,7 @@ TRANSFER_KEYWORDS = [
     'want', 'pursue', 'chase', 'enquiry', 'inquiry',
 ]
 
-_KEYWORD_PATTERN = re.compile(
-    r'\b(' + '|'.join(re.escape(kw) for kw in TRANSFER_KEYWORDS) + r')\b',
-    re.IGNORECASE,
-)
+_KEYWORD_PATTERN = phrase_pattern(TRANSFER_KEYWORDS, word_boundaries=True, flags=re.IGNORECASE)
 
 
 @dataclass
@@ -0,0 +1,253 @@
+"""Concurrent, resumable backfill of BBC gossip columns.
+
+scrape_claims --pages N used to fetch every index page, gossip column and
+cited source article one after another with blocking requests. This
+engine fetches them with one httpx.AsyncClient instead:
+
+- Requests run concurrently, at most GOSSIP_BACKFILL_HOST_CONCURRENCY at
+  a time per host, so the BBC and each cited publication see bounded load.
+- Up to GOSSIP_BACKFILL_PREFETCH columns ahead of the writer are fetched
+  and parsed, together with the source articles their bylines come from.
+  So fetching overlaps with writing, and create_claims_from_gossip finds
+  every author already cached.
+- Columns are written one at a time, in index order, each in its own
+  transaction. The ORM calls run through sync_to_async in the calling
+  thread.
+- A BackfillCheckpoint row keeps the article URLs and the progress. An
+  interrupted run resumes where it stopped: written columns have a
+  ScrapedArticle and are skipped, and the index is not fetched again.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+
+import httpx
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.claims.models import BackfillCheckpoint, ScrapedArticle
+from apps.claims.scrapers.author_extractor import _is_social_media_url, cache_author, is_author_cached, parse_author
+from apps.claims.scrapers.gossip_scraper import (
+    REQUEST_HEADERS,
+    create_claims_from_gossip,
+    gossip_index_page_url,
+    parse_gossip_column,
+    parse_gossip_index,
+)
+from apps.claims.services.bulk_updates import bulk_claim_updates
+from apps.claims.services.club_gazetteer import ClubGazetteer
+from apps.claims.services.reference_name_index import ReferenceNameIndex
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_NAME = 'bbc-gossip'
+
+# Seconds, as for the blocking requests
+COLUMN_TIMEOUT = 30
+AUTHOR_TIMEOUT = 10
+
+
+@dataclass
+class BackfillResult:
+    articles: int = 0  # columns written in this run
+    claims: int = 0
+    skipped: int = 0  # columns already written, or without rumours
+    failed: int = 0  # columns that could not be fetched; retried on resume
+    resumed: bool = False
+
+
+class _HostLimiter:
+    """One semaphore per host."""
+
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def __call__(self, url: str) -> asyncio.Semaphore:
+        host = httpx.URL(url).host
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self._limit)
+        return self._semaphores[host]
+
+
+class _Fetcher:
+    def __init__(self, client: httpx.AsyncClient, gazetteer: ClubGazetteer):
+        self._client = client
+        self._gazetteer = gazetteer
+        self._limiter = _HostLimiter(settings.GOSSIP_BACKFILL_HOST_CONCURRENCY)
+        self._authors: dict[str, asyncio.Task] = {}
+
+    async def get(self, url: str, timeout: float) -> str:
+        async with self._limiter(url):
+            response = await self._client.get(url, timeout=timeout)
+        response.raise_for_status()
+        return response.text
+
+    async def article_urls(self, pages: int) -> list[str]:
+        """find_gossip_urls_from_index(), with the index pages fetched together."""
+        htmls = await asyncio.gather(*(self.get(gossip_index_page_url(page), COLUMN_TIMEOUT) for page in range(1, pages + 1)))
+        seen = set()
+        urls = []
+        for page, html in enumerate(htmls, 1):
+            found = [href for href in dict.fromkeys(parse_gossip_index(html)) if href not in seen]
+            logger.info("Page %d: found %d gossip article links", page, len(found))
+            if not found:
+                break  # No more pages
+            seen.update(found)
+            urls.extend(found)
+        return urls
+
+    async def column(self, url: str) -> list[dict]:
+        """The column's rumours, once the authors of their sources are cached."""
+        html = await self.get(url, COLUMN_TIMEOUT)
+        rumours = await asyncio.to_thread(parse_gossip_column, html, self._gazetteer)
+        sources = {r['source_url'] for r in rumours if r.get('source_url')}
+        for source_url in sources:
+            if source_url not in self._authors:
+                self._authors[source_url] = asyncio.ensure_future(self._author(source_url))
+        await asyncio.gather(*(self._authors[source_url] for source_url in sources))
+        return rumours
+
+    async def _author(self, url: str) -> None:
+        # Same outcomes as extract_author(), which then reads them from its cache
+        if is_author_cached(url) or _is_social_media_url(url):
+            return
+        try:
+            html = await self.get(url, AUTHOR_TIMEOUT)
+        except Exception:
+            logger.debug("Failed to fetch %s for author extraction", url)
+            cache_author(url, None)
+            return
+        author = await asyncio.to_thread(parse_author, html)
+        if author:
+            logger.info("Extracted author '%s' from %s", author, url)
+        cache_author(url, author)
+
+
+def _start(pages: int, restart: bool) -> tuple[BackfillCheckpoint, bool]:
+    """The checkpoint to work on, and whether it resumes an earlier run."""
+    checkpoint, created = BackfillCheckpoint.objects.get_or_create(
+        name=CHECKPOINT_NAME, defaults={'started_at': timezone.now()},
+    )
+    if not created and not restart and checkpoint.completed_at is None and checkpoint.pages == pages and checkpoint.urls:
+        return checkpoint, True
+    checkpoint.pages = pages
+    checkpoint.urls = []
+    checkpoint.articles_done = 0
+    checkpoint.claims_created = 0
+    checkpoint.started_at = timezone.now()
+    checkpoint.completed_at = None
+    checkpoint.save()
+    return checkpoint, False
+
+
+def _save_urls(checkpoint: BackfillCheckpoint, urls: list[str]) -> None:
+    checkpoint.urls = urls
+    checkpoint.save(update_fields=['urls', 'updated_at'])
+
+
+def _pending(urls: list[str]) -> list[str]:
+    done = set()
+    for start in range(0, len(urls), 500):
+        done.update(ScrapedArticle.objects.filter(url__in=urls[start:start + 500]).values_list('url', flat=True))
+    return [url for url in urls if url not in done]
+
+
+def _write(checkpoint: BackfillCheckpoint, url: str, rumours: list[dict]) -> int:
+    # The column's claims and the checkpoint commit together, so a resume
+    # never finds a half-written column
+    with transaction.atomic():
+        count = create_claims_from_gossip(url, rumours=rumours)
+        BackfillCheckpoint.objects.filter(pk=checkpoint.pk).update(
+            articles_done=F('articles_done') + 1,
+            claims_created=F('claims_created') + count,
+            updated_at=timezone.now(),
+        )
+    return count
+
+
+def _complete(checkpoint: BackfillCheckpoint) -> None:
+    BackfillCheckpoint.objects.filter(pk=checkpoint.pk).update(completed_at=timezone.now())
+
+
+async def _run(pages: int, restart: bool, progress) -> BackfillResult:
+    checkpoint, resumed = await sync_to_async(_start)(pages, restart)
+    result = BackfillResult(resumed=resumed)
+
+    # Loaded here, so parsing in worker threads needs no database access
+    gazetteer = await sync_to_async(ClubGazetteer.current)()
+    await sync_to_async(ReferenceNameIndex.current)()
+
+    async with httpx.AsyncClient(headers=REQUEST_HEADERS, follow_redirects=True) as client:
+        fetcher = _Fetcher(client, gazetteer)
+        urls = checkpoint.urls
+        if not resumed:
+            urls = await fetcher.article_urls(pages)
+            await sync_to_async(_save_urls)(checkpoint, urls)
+
+        pending = await sync_to_async(_pending)(urls)
+        result.skipped = len(urls) - len(pending)
+        logger.info("Backfilling %d of %d gossip columns", len(pending), len(urls))
+
+        ahead = deque()
+        queued = iter(pending)
+
+        def top_up():
+            while len(ahead) < settings.GOSSIP_BACKFILL_PREFETCH:
+                url = next(queued, None)
+                if url is None:
+                    return
+                ahead.append((url, asyncio.ensure_future(fetcher.column(url))))
+
+        top_up()
+        try:
+            while ahead:
+                url, task = ahead.popleft()
+                top_up()
+                try:
+                    rumours = await task
+                except Exception as e:
+                    logger.warning("Failed to fetch gossip column %s: %s", url, e)
+                    result.failed += 1
+                    if progress:
+                        await sync_to_async(progress)(url, None, e)
+                    continue
+
+                count = await sync_to_async(_write)(checkpoint, url, rumours)
+                if count or rumours:
+                    result.articles += 1
+                else:
+                    result.skipped += 1
+                result.claims += count
+                if progress:
+                    await sync_to_async(progress)(url, count, None)
+        finally:
+            # A failed write stops the run; the checkpoint keeps the place
+            for _, task in ahead:
+                task.cancel()
+
+    if not result.failed:
+        await sync_to_async(_complete)(checkpoint)
+    return result
+
+
+def run_gossip_backfill(pages: int, restart: bool = False, progress=None) -> BackfillResult:
+    """
+    Backfill the gossip columns listed on N pages of the BBC gossip index.
+
+    Args:
+        pages: Index pages to collect column URLs from
+        restart: Start over instead of resuming an unfinished run
+        progress: Optional callable(url, claims_created, error), called
+            after each column in the calling thread
+
+    Counters, stories and scores are updated once, at the end (see
+    bulk_updates).
+    """
+    with bulk_claim_updates():
+        return async_to_sync(_run)(pages, restart, progress)
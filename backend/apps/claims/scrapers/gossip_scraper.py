@@ -5,10 +5,18 @@ from datetime import date, timedelta
 import feedparser
 import httpx
 from bs4 import BeautifulSoup
+from django.db import transaction
+from django.db.models import Q
 
 from apps.claims.classifiers import classify_claim_confidence, classify_club_direction, detect_negative_claim
-from apps.claims.models import Claim, Journalist, ReferencePlayer, ScrapedArticle
+from apps.claims.models import Claim, ReferencePlayer, ScrapedArticle
 from apps.claims.scrapers.author_extractor import extract_author
+from apps.claims.services.club_gazetteer import ClubGazetteer
+from apps.claims.services.claim_ingest import insert_claims
+from apps.claims.services.journalist_resolver import JournalistResolver
+from apps.claims.services.near_duplicates import flag_near_duplicates
+from apps.claims.services.player_resolver import PlayerResolver
+from apps.claims.services.reference_name_index import ReferenceNameIndex
 
 logger = logging.getLogger(__name__)
 
@@ -210,6 +218,14 @@ WAYBACK_PREFIX = re.compile(r'https?://web\.archive\.org/web/\d+[/*]?')
 
 BBC_GOSSIP_INDEX = 'https://www.bbc.com/sport/football/gossip'
 
+REQUEST_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
+        'AppleWebKit/537.36 (KHTML, like Gecko) '
+        'Chrome/120.0.0.0 Safari/537.36'
+    ),
+}
+
 # Pattern to match source citation at end of paragraph, e.g. "(Mirror),external" or "(Teamtalk)"
 SOURCE_PATTERN = re.compile(r'\(([^)]+)\)\s*,?\s*external\s*$')
 
@@ -316,40 +332,56 @@ NOT_PLAYERS = {
 } | set(CLUBS.keys())
 
 
+# Text each pattern above cannot match without. Most paragraphs lack one
+# or more, and these checks cost a fraction of the name patterns they skip
+_AGE_CUE = re.compile(r',\s*\d|\d-year-old')  # PLAYER_WITH_AGE
+_POSITION_CUE = re.compile(  # POSITIONAL_PLAYER, NATIONALITY_POSITIONAL
+    r'forward|midfielder|defender|goalkeeper|striker|winger|'
+    r'right-back|left-back|centre-back|full-back|wing-back|'
+    r'skipper|captain|boss|manager'
+)
+_POSSESSIVE_CUE = "'s"  # POSSESSIVE_PLAYER
+
+
 def _extract_players(text: str) -> list[str]:
-    """Extract player names from gossip paragraph text."""
+    """Extract player names from gossip paragraph text.
+
+    Patterns whose cue is missing from the text are skipped.
+    """
     players = []
+    has_position = _POSITION_CUE.search(text) is not None
 
-    # First try age-based patterns (most reliable)
-    for m in PLAYER_WITH_AGE.finditer(text):
-        name = (m.group(1) or m.group(2) or '').strip()
-        if name and name.lower() not in NOT_PLAYERS:
+    def add(name):
+        name = name.strip()
+        if name and name.lower() not in NOT_PLAYERS and name not in players:
             players.append(name)
 
+    # First try age-based patterns (most reliable)
+    if _AGE_CUE.search(text):
+        for m in PLAYER_WITH_AGE.finditer(text):
+            name = (m.group(1) or m.group(2) or '').strip()
+            if name and name.lower() not in NOT_PLAYERS:
+                players.append(name)
+
     # Then try positional patterns
-    for m in POSITIONAL_PLAYER.finditer(text):
-        name = m.group(1).strip()
-        if name and name.lower() not in NOT_PLAYERS and name not in players:
-            players.append(name)
+    if has_position:
+        for m in POSITIONAL_PLAYER.finditer(text):
+            add(m.group(1))
 
     # Sentence-subject pattern: "Alex Oxlade-Chamberlain says he..."
     m = SENTENCE_SUBJECT.match(text)
     if m:
-        name = m.group(1).strip()
-        if name and name.lower() not in NOT_PLAYERS and name not in players:
-            players.append(name)
+        add(m.group(1))
 
     # Possessive pattern: "Marcus Rashford's Barcelona future"
-    for m in POSSESSIVE_PLAYER.finditer(text):
-        name = m.group(1).strip()
-        if name and name.lower() not in NOT_PLAYERS and name not in players:
-            players.append(name)
+    if _POSSESSIVE_CUE in text:
+        for m in POSSESSIVE_PLAYER.finditer(text):
+            add(m.group(1))
 
     # Nationality + position: "England forward Marcus Rashford"
-    for m in NATIONALITY_POSITIONAL.finditer(text):
-        name = m.group(1).strip()
-        if name and name.lower() not in NOT_PLAYERS and name not in players:
-            players.append(name)
+    if has_position:
+        for m in NATIONALITY_POSITIONAL.finditer(text):
+            add(m.group(1))
 
     # Reference DB fallback: scan text for known player names
     if not players:
@@ -358,44 +390,12 @@ def _extract_players(text: str) -> list[str]:
     return players
 
 
-# Module-level cache for the reference name index
-_ref_name_index: dict[str, list[str]] | None = None
-
-
-def _build_ref_name_index() -> dict[str, list[str]]:
-    """Build a last-name → full-names lookup from the reference database.
-
-    Returns a dict mapping lowercased last name to list of full names.
-    Only includes non-manager players. Cached at module level.
-    """
-    global _ref_name_index
-    if _ref_name_index is not None:
-        return _ref_name_index
-
-    if not ReferencePlayer.objects.exists():
-        _ref_name_index = {}
-        return _ref_name_index
-
-    index: dict[str, list[str]] = {}
-    for name in ReferencePlayer.objects.filter(is_manager=False).values_list('name', flat=True):
-        parts = name.split()
-        if len(parts) < 2:
-            continue
-        last = parts[-1].lower()
-        if len(last) < 3:  # Skip very short surnames to avoid false matches
-            continue
-        index.setdefault(last, []).append(name)
-
-    _ref_name_index = index
-    return _ref_name_index
-
-
 def _extract_players_from_reference(text: str) -> list[str]:
     """Scan text for player names that exist in the reference database.
 
     Used as a fallback when regex patterns don't find any names.
     """
-    index = _build_ref_name_index()
+    index = ReferenceNameIndex.current()
     if not index:
         return []
 
@@ -431,20 +431,51 @@ def _resolve_player(name: str) -> tuple[ReferencePlayer | None, bool]:
         return (None, False)
 
 
+def _find_reference_players(names) -> dict[str, ReferencePlayer]:
+    """_resolve_player() lookups for many names in one query.
+
+    Returns a mapping of lowercased name -> first matching ReferencePlayer.
+    """
+    query = Q()
+    for name in set(names):
+        query |= Q(name__iexact=name)
+    if not query:
+        return {}
+    found = {}
+    for ref in ReferencePlayer.objects.filter(query).order_by('name', 'pk'):
+        found.setdefault(ref.name.lower(), ref)
+    return found
+
+
 def _resolve_players_with_reference(
     extracted_names: list[str],
+    references: dict[str, ReferencePlayer] | None = None,
+    resolver: PlayerResolver | None = None,
 ) -> list[dict]:
     """Validate extracted player names against the reference database.
 
+    Args:
+        extracted_names: Player names found in the text.
+        references: Optional result of _find_reference_players() covering
+            these names, to save a query per name.
+        resolver: Optional PlayerResolver, to save a query per call.
+
     Returns a list of dicts with keys:
         name: str (best canonical name)
         current_club: str (from reference data, or '')
         from_reference: bool (True if matched in DB)
+        reference_player_id: int or None (the ReferencePlayer the name
+            resolves to for Claim.reference_player)
     Filters out names that match known managers.
     """
+    resolver = resolver or PlayerResolver.current()
     results = []
     for name in extracted_names:
-        ref, is_manager = _resolve_player(name)
+        if references is None:
+            ref, is_manager = _resolve_player(name)
+        else:
+            ref = references.get(name.lower())
+            is_manager = bool(ref and ref.is_manager)
         if is_manager:
             logger.debug("Skipping manager: %s", name)
             continue
@@ -453,6 +484,7 @@ def _resolve_players_with_reference(
                 'name': ref.name,
                 'current_club': ref.current_club_name or '',
                 'from_reference': True,
+                'reference_player_id': resolver.resolve(ref.name),
             })
         else:
             # No match in reference DB — keep the extracted name as-is
@@ -460,6 +492,7 @@ def _resolve_players_with_reference(
                 'name': name,
                 'current_club': '',
                 'from_reference': False,
+                'reference_player_id': resolver.resolve(name),
             })
     return results
 
@@ -531,17 +564,13 @@ def _extract_fee(text: str) -> str:
     return ''
 
 
-def _extract_clubs(text: str) -> list[str]:
-    """Extract club names mentioned in text."""
-    text_lower = text.lower()
-    found = []
-    # Sort by key length descending so "Newcastle United" matches before "Newcastle"
-    for club_lower, club_name in sorted(CLUBS.items(), key=lambda x: len(x[0]), reverse=True):
-        if club_lower in text_lower:
-            # Avoid duplicates like "Newcastle" and "Newcastle United"
-            if not any(club_name in existing or existing in club_name for existing in found):
-                found.append(club_name)
-    return found
+def _extract_clubs(text: str, gazetteer: ClubGazetteer | None = None) -> list[str]:
+    """Extract club names mentioned in text, longest name first.
+
+    Pass a gazetteer when extracting from many texts, so one run uses
+    one gazetteer throughout.
+    """
+    return (gazetteer or ClubGazetteer.current()).clubs(text)
 
 
 def find_gossip_url_from_rss() -> str | None:
@@ -567,38 +596,15 @@ def find_gossip_urls_from_index(pages: int = 3) -> list[str]:
 
     Returns a list of full article URLs, most recent first.
     """
-    headers = {
-        'User-Agent': (
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
-            'AppleWebKit/537.36 (KHTML, like Gecko) '
-            'Chrome/120.0.0.0 Safari/537.36'
-        ),
-    }
-
     seen = set()
     urls = []
 
     for page in range(1, pages + 1):
-        page_url = BBC_GOSSIP_INDEX if page == 1 else f'{BBC_GOSSIP_INDEX}?page={page}'
-        resp = httpx.get(page_url, headers=headers, follow_redirects=True, timeout=30)
+        resp = httpx.get(gossip_index_page_url(page), headers=REQUEST_HEADERS, follow_redirects=True, timeout=30)
         resp.raise_for_status()
 
-        soup = BeautifulSoup(resp.text, 'html.parser')
         page_count = 0
-
-        for a in soup.find_all('a', href=True):
-            href = a['href']
-            # Gossip articles live at /sport/football/articles/{id}
-            if '/sport/football/articles/' not in href:
-                continue
-            # Skip comment anchor links like ...#comments
-            if '#' in href:
-                continue
-
-            # Normalise to full URL
-            if href.startswith('/'):
-                href = f'https://www.bbc.com{href}'
-
+        for href in parse_gossip_index(resp.text):
             if href not in seen:
                 seen.add(href)
                 urls.append(href)
@@ -613,6 +619,30 @@ def find_gossip_urls_from_index(pages: int = 3) -> list[str]:
     return urls
 
 
+def gossip_index_page_url(page: int) -> str:
+    return BBC_GOSSIP_INDEX if page == 1 else f'{BBC_GOSSIP_INDEX}?page={page}'
+
+
+def parse_gossip_index(html: str) -> list[str]:
+    """The gossip article URLs linked from one index page, in page order."""
+    soup = BeautifulSoup(html, 'html.parser')
+    hrefs = []
+    for a in soup.find_all('a', href=True):
+        href = a['href']
+        # Gossip articles live at /sport/football/articles/{id}
+        if '/sport/football/articles/' not in href:
+            continue
+        # Skip comment anchor links like ...#comments
+        if '#' in href:
+            continue
+
+        # Normalise to full URL
+        if href.startswith('/'):
+            href = f'https://www.bbc.com{href}'
+        hrefs.append(href)
+    return hrefs
+
+
 def _extract_article_date(soup: BeautifulSoup):
     """Extract publication date from BBC article HTML.
 
@@ -652,19 +682,17 @@ def scrape_gossip_column(url: str) -> list[dict]:
         claim_text, source_publication, clubs_mentioned, player_names,
         article_date (datetime or None)
     """
-    headers = {
-        'User-Agent': (
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
-            'AppleWebKit/537.36 (KHTML, like Gecko) '
-            'Chrome/120.0.0.0 Safari/537.36'
-        ),
-    }
-    response = httpx.get(url, headers=headers, follow_redirects=True, timeout=30)
+    response = httpx.get(url, headers=REQUEST_HEADERS, follow_redirects=True, timeout=30)
     response.raise_for_status()
+    return parse_gossip_column(response.text)
+
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+def parse_gossip_column(html: str, gazetteer: ClubGazetteer | None = None) -> list[dict]:
+    """The rumours of a fetched gossip column (see scrape_gossip_column)."""
+    soup = BeautifulSoup(html, 'html.parser')
     article_date = _extract_article_date(soup)
     paragraphs = soup.find_all('p')
+    gazetteer = gazetteer or ClubGazetteer.current()
 
     rumours = []
     for p in paragraphs:
@@ -694,7 +722,7 @@ def scrape_gossip_column(url: str) -> list[dict]:
         # The claim text is everything before the source citation
         claim_text = SOURCE_PATTERN.sub('', text).strip().rstrip(',').strip()
 
-        clubs = _extract_clubs(claim_text)
+        clubs = _extract_clubs(claim_text, gazetteer)
         players = _extract_players(claim_text)
 
         rumours.append({
@@ -710,53 +738,18 @@ def scrape_gossip_column(url: str) -> list[dict]:
     return rumours
 
 
-def _get_or_create_source(name: str, publication: str = '') -> 'Journalist':
-    """Get or create a Journalist record for a source.
-
-    Args:
-        name: The journalist name (or publication name as fallback).
-        publication: The publication name, used when name is an actual
-            journalist that differs from the publication.
-
-    Handles slug collisions by appending a suffix.
-    """
-    from django.utils.text import slugify
-
-    try:
-        return Journalist.objects.get(name=name)
-    except Journalist.DoesNotExist:
-        pass
-
-    slug = slugify(name)
-    # If slug already taken by a different name, make it unique
-    if Journalist.objects.filter(slug=slug).exists():
-        slug = slugify(f"{name}-source")
-
-    # When we have a real journalist name distinct from the publication,
-    # set publications to the publication. Otherwise fall back to the name.
-    if publication and publication != name:
-        pubs = [publication]
-    else:
-        pubs = [name]
-
-    return Journalist.objects.create(
-        name=name,
-        slug=slug,
-        publications=pubs,
-    )
-
-
-def create_claims_from_gossip(url: str, dry_run: bool = False, claim_date=None) -> int:
+def create_claims_from_gossip(url: str, dry_run: bool = False, claim_date=None, rumours=None) -> int:
     """Full pipeline: scrape gossip column -> create Claim records.
 
     Args:
         url: The gossip column URL to scrape.
         dry_run: If True, don't create records, just log.
         claim_date: Date for the claims. Defaults to now if not provided.
+        rumours: The column's rumours if already fetched (as by the async
+            backfill); scraped from url otherwise.
 
     Returns the number of claims created.
     """
-    from difflib import SequenceMatcher
     from django.utils import timezone as tz
 
     fallback_date = claim_date or tz.now()
@@ -766,7 +759,8 @@ def create_claims_from_gossip(url: str, dry_run: bool = False, claim_date=None)
         logger.info("Already scraped: %s", url)
         return 0
 
-    rumours = scrape_gossip_column(url)
+    if rumours is None:
+        rumours = scrape_gossip_column(url)
 
     if not rumours:
         logger.warning("No rumours found at %s", url)
@@ -809,22 +803,15 @@ def create_claims_from_gossip(url: str, dry_run: bool = False, claim_date=None)
             )
         return len(rumours)
 
-    # Save ScrapedArticle
-    raw_content = '\n\n'.join(r['claim_text'] for r in rumours)
-    scraped = ScrapedArticle.objects.create(
-        url=url,
-        source_type='web',
-        source_name='BBC Sport Gossip Column',
-        raw_content=raw_content,
-    )
-
-    claims_created = 0
-
     # Check if reference data is available (non-empty table)
     has_reference_data = ReferencePlayer.objects.exists()
     if has_reference_data:
         logger.info("Reference player data available — using for validation")
+        # Every name on the page is looked up in one query
+        references = _find_reference_players(name for r in rumours for name in r['player_names'])
+        resolver = PlayerResolver.current()
 
+    parsed = []
     for rumour in rumours:
         claim_text = rumour['claim_text']
         clubs = rumour['clubs_mentioned']
@@ -833,8 +820,9 @@ def create_claims_from_gossip(url: str, dry_run: bool = False, claim_date=None)
         # Resolve players against reference database (validates names,
         # filters managers, provides current club)
         if has_reference_data and players:
-            resolved = _resolve_players_with_reference(players)
+            resolved = _resolve_players_with_reference(players, references, resolver)
             players = [r['name'] for r in resolved]
+            reference_player_id = resolved[0]['reference_player_id'] if resolved else None
             # Use reference current_club to inform from_club if NLP missed it
             ref_current_club = next(
                 (r['current_club'] for r in resolved if r['current_club']),
@@ -842,6 +830,7 @@ def create_claims_from_gossip(url: str, dry_run: bool = False, claim_date=None)
             )
         else:
             ref_current_club = ''
+            reference_player_id = None
 
         # Determine to_club / from_club using directional language analysis
         from_club, to_club = classify_club_direction(claim_text, clubs)
@@ -852,19 +841,20 @@ def create_claims_from_gossip(url: str, dry_run: bool = False, claim_date=None)
             from_club = ref_current_club
 
         player_name = players[0] if players else ''
+        parsed.append((rumour, claim_text, player_name, reference_player_id, from_club, to_club))
+
+    # Dedup: skip rumours very similar to a claim from the last 7 days (or
+    # to an earlier rumour on this page), checked for the whole page at once
+    cutoff = tz.now() - timedelta(days=7)
+    duplicates = flag_near_duplicates(
+        [(claim_text, player_name) for _, claim_text, player_name, *_ in parsed],
+        Claim.objects.filter(claim_date__gte=cutoff),
+    )
 
-        # Dedup: skip if very similar claim exists in last 7 days
-        cutoff = tz.now() - timedelta(days=7)
-        is_dup = False
-        existing = Claim.objects.filter(claim_date__gte=cutoff)
-        if player_name:
-            existing = existing.filter(player_name__iexact=player_name)
-        for ec in existing:
-            if SequenceMatcher(None, claim_text.lower(), ec.claim_text.lower()).ratio() > 0.85:
-                is_dup = True
-                break
-
-        if is_dup:
+    rows = []
+    sources = {}
+    for (rumour, claim_text, player_name, reference_player_id, from_club, to_club), duplicate in zip(parsed, duplicates):
+        if duplicate:
             logger.debug("Skipping duplicate: %s", claim_text[:60])
             continue
 
@@ -884,18 +874,18 @@ def create_claims_from_gossip(url: str, dry_run: bool = False, claim_date=None)
         source_url = rumour.get('source_url', '')
         author = extract_author(source_url) if source_url else None
         journalist_name = author or pub_name or 'BBC Sport'
-        journalist = _get_or_create_source(journalist_name, publication=pub_name)
+        sources.setdefault(journalist_name, pub_name)
 
         # Use the original source URL, not the BBC gossip column URL
         article_url = rumour.get('source_url') or url
 
-        Claim.objects.create(
-            journalist=journalist,
+        rows.append((journalist_name, dict(
             claim_text=claim_text,
             publication=pub_name or 'BBC Sport',
             article_url=article_url,
             claim_date=rumour.get('article_date') or fallback_date,
             player_name=player_name,
+            reference_player_id=reference_player_id,
             from_club=from_club,
             to_club=to_club,
             transfer_fee=_extract_fee(claim_text),
@@ -903,12 +893,24 @@ def create_claims_from_gossip(url: str, dry_run: bool = False, claim_date=None)
             is_transfer_negative=is_negative,
             source_type='original',
             validation_status='pending',
+        )))
+
+    journalists = JournalistResolver.current().resolve_many(sources)
+
+    # The article is only marked scraped together with its claims
+    with transaction.atomic():
+        scraped = ScrapedArticle.objects.create(
+            url=url,
+            source_type='web',
+            source_name='BBC Sport Gossip Column',
+            raw_content='\n\n'.join(r['claim_text'] for r in rumours),
         )
-        claims_created += 1
+        created = insert_claims([Claim(journalist=journalists[name], **fields) for name, fields in rows])
+        claims_created = len(created)
 
-    scraped.processed = True
-    scraped.claims_created = claims_created
-    scraped.save(update_fields=['processed', 'claims_created'])
+        scraped.processed = True
+        scraped.claims_created = claims_created
+        scraped.save(update_fields=['processed', 'claims_created'])
 
     logger.info("Created %d claims from BBC gossip column", claims_created)
     return claims_created
@@ -1,9 +1,9 @@
 import logging
 import re
 from datetime import datetime, timedelta, timezone
-from difflib import SequenceMatcher
 
 import httpx
+from django.db import transaction
 
 from apps.claims.classifiers import classify_claim_confidence, classify_club_direction
 from apps.claims.models import Claim, ScrapedArticle
@@ -11,8 +11,12 @@ from apps.claims.scrapers.author_extractor import _is_social_media_url, extract_
 from apps.claims.scrapers.gossip_scraper import (
     _extract_clubs,
     _extract_players,
-    _get_or_create_source,
 )
+from apps.claims.services.claim_ingest import insert_claims
+from apps.claims.services.club_gazetteer import ClubGazetteer
+from apps.claims.services.journalist_resolver import JournalistResolver
+from apps.claims.services.near_duplicates import flag_near_duplicates
+from apps.claims.services.phrase_matcher import phrase_pattern
 
 logger = logging.getLogger(__name__)
 
@@ -26,15 +30,18 @@ SOURCE_TAG_START = re.compile(r'^\s*\[([^\]]+)\]')
 SOURCE_TAG_ANY = re.compile(r'\[[^\]]+\]')
 
 # Transfer-related keywords in titles
-TRANSFER_KEYWORDS = re.compile(
-    r'\b(?:sign|signing|transfer|deal|move|join|joining|loan|loaned|'
-    r'bid|offer|agree|agreement|interested|target|pursue|want|'
-    r'close to|set to|expected to|confirm|announce|official|'
-    r'negotiate|negotiation|fee|contract|swap|swap deal|'
-    r'depart|departure|leave|leaving|exit|release|sell|sold|'
-    r'approach|enquiry|inquiry|reject|accept|complete|done deal|'
-    r'medical|personal terms|agree terms|here we go)\b',
-    re.IGNORECASE,
+TRANSFER_KEYWORDS = phrase_pattern(
+    [
+        'sign', 'signing', 'transfer', 'deal', 'move', 'join', 'joining', 'loan', 'loaned',
+        'bid', 'offer', 'agree', 'agreement', 'interested', 'target', 'pursue', 'want',
+        'close to', 'set to', 'expected to', 'confirm', 'announce', 'official',
+        'negotiate', 'negotiation', 'fee', 'contract', 'swap', 'swap deal',
+        'depart', 'departure', 'leave', 'leaving', 'exit', 'release', 'sell', 'sold',
+        'approach', 'enquiry', 'inquiry', 'reject', 'accept', 'complete', 'done deal',
+        'medical', 'personal terms', 'agree terms', 'here we go',
+    ],
+    word_boundaries=True,
+    flags=re.IGNORECASE,
 )
 
 # Posts with these source tags are not transfer rumours
@@ -69,6 +76,7 @@ def scrape_reddit_soccer(pages: int = 2) -> list[dict]:
     posts = []
     seen_urls = set()
     after = None
+    gazetteer = ClubGazetteer.current()
 
     for page_num in range(pages):
         params = {'limit': 100, 'raw_json': 1}
@@ -91,7 +99,7 @@ def scrape_reddit_soccer(pages: int = 2) -> list[dict]:
         for child in children:
             if child.get('kind') != 't3':
                 continue
-            post = _parse_json_post(child['data'])
+            post = _parse_json_post(child['data'], gazetteer)
             if post and post['source_url'] not in seen_urls:
                 seen_urls.add(post['source_url'])
                 posts.append(post)
@@ -106,7 +114,7 @@ def scrape_reddit_soccer(pages: int = 2) -> list[dict]:
     return posts
 
 
-def _parse_json_post(post_data: dict) -> dict | None:
+def _parse_json_post(post_data: dict, gazetteer: ClubGazetteer | None = None) -> dict | None:
     """Parse a Reddit JSON post object into a transfer rumour dict.
 
     Returns None if the post is not transfer-related or has no source tag.
@@ -152,7 +160,7 @@ def _parse_json_post(post_data: dict) -> dict | None:
     if created_utc:
         post_date = datetime.fromtimestamp(created_utc, tz=timezone.utc)
 
-    clubs = _extract_clubs(claim_text)
+    clubs = _extract_clubs(claim_text, gazetteer)
     players = _extract_players(claim_text)
 
     return {
@@ -196,40 +204,25 @@ def create_claims_from_reddit(
             )
         return len(posts)
 
-    # Record the scrape
-    scrape_url = f'reddit:r/soccer:{datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")}'
-    raw_content = '\n\n'.join(p['claim_text'] for p in posts)
-    scraped = ScrapedArticle.objects.create(
-        url=scrape_url,
-        source_type='reddit',
-        source_name='Reddit r/soccer',
-        raw_content=raw_content,
-    )
+    parsed = []
+    for post in posts:
+        claim_text = post['claim_text']
+        from_club, to_club = classify_club_direction(claim_text, post['clubs_mentioned'])
+        player_name = post['player_names'][0] if post['player_names'] else ''
+        parsed.append((post, claim_text, player_name, from_club, to_club))
 
-    claims_created = 0
+    # Dedup: skip posts very similar to a claim from the last 7 days (or to
+    # an earlier post in this scrape), checked for all posts at once
     cutoff = tz.now() - timedelta(days=7)
+    duplicates = flag_near_duplicates(
+        [(claim_text, player_name) for _, claim_text, player_name, *_ in parsed],
+        Claim.objects.filter(claim_date__gte=cutoff),
+    )
 
-    for post in posts:
-        claim_text = post['claim_text']
-        clubs = post['clubs_mentioned']
-        players = post['player_names']
-
-        from_club, to_club = classify_club_direction(claim_text, clubs)
-        player_name = players[0] if players else ''
-
-        # Dedup: skip if very similar claim exists in last 7 days
-        is_dup = False
-        existing = Claim.objects.filter(claim_date__gte=cutoff)
-        if player_name:
-            existing = existing.filter(player_name__iexact=player_name)
-        for ec in existing:
-            if SequenceMatcher(
-                None, claim_text.lower(), ec.claim_text.lower()
-            ).ratio() > 0.85:
-                is_dup = True
-                break
-
-        if is_dup:
+    rows = []
+    sources = {}
+    for (post, claim_text, player_name, from_club, to_club), duplicate in zip(parsed, duplicates):
+        if duplicate:
             logger.debug("Skipping duplicate: %s", claim_text[:60])
             continue
 
@@ -240,10 +233,9 @@ def create_claims_from_reddit(
         if source_url and not _is_social_media_url(source_url):
             author = extract_author(source_url)
         journalist_name = author or pub_name
-        journalist = _get_or_create_source(journalist_name, publication=pub_name)
+        sources.setdefault(journalist_name, pub_name)
 
-        Claim.objects.create(
-            journalist=journalist,
+        rows.append((journalist_name, dict(
             claim_text=claim_text,
             publication=pub_name,
             article_url=post['source_url'],
@@ -255,12 +247,25 @@ def create_claims_from_reddit(
             certainty_level=certainty,
             source_type='original',
             validation_status='pending',
+        )))
+
+    journalists = JournalistResolver.current().resolve_many(sources)
+
+    # Record the scrape together with its claims
+    with transaction.atomic():
+        scrape_url = f'reddit:r/soccer:{datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")}'
+        scraped = ScrapedArticle.objects.create(
+            url=scrape_url,
+            source_type='reddit',
+            source_name='Reddit r/soccer',
+            raw_content='\n\n'.join(p['claim_text'] for p in posts),
         )
-        claims_created += 1
+        created = insert_claims([Claim(journalist=journalists[name], **fields) for name, fields in rows])
+        claims_created = len(created)
 
-    scraped.processed = True
-    scraped.claims_created = claims_created
-    scraped.save(update_fields=['processed', 'claims_created'])
+        scraped.processed = True
+        scraped.claims_created = claims_created
+        scraped.save(update_fields=['processed', 'claims_created'])
 
     logger.info("Created %d claims from r/soccer", claims_created)
     return claims_created
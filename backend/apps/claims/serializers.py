@@ -1,19 +1,19 @@
+from django.db import IntegrityError
 from django.utils import timezone
-from django.utils.text import slugify
 from rest_framework import serializers
 from apps.claims.models import Journalist, Claim, ScoreHistory, Transfer, ReferenceClub, ReferencePlayer
 from apps.claims.services.scoring import ScoringService
 from apps.claims.classifiers import classify_claim_confidence, classify_club_direction
 from apps.claims.scrapers.gossip_scraper import _extract_clubs
+from apps.claims.services.claim_ingest import claim_exists, content_hash
+from apps.claims.services.journalist_resolver import JournalistResolver
 
 
 class JournalistListSerializer(serializers.ModelSerializer):
-    """Lightweight serializer for journalist lists and leaderboards"""
+    """Lightweight serializer for journalist lists and leaderboards
 
-    total_claims = serializers.SerializerMethodField()
-    validated_claims = serializers.SerializerMethodField()
-    true_claims = serializers.SerializerMethodField()
-    false_claims = serializers.SerializerMethodField()
+    Claim counts are read from Journalist's counter columns.
+    """
 
     class Meta:
         model = Journalist
@@ -32,37 +32,17 @@ class JournalistListSerializer(serializers.ModelSerializer):
             'false_claims',
         ]
 
-    def get_total_claims(self, obj):
-        return obj.claims.count()
-
-    def get_validated_claims(self, obj):
-        return obj.claims.exclude(validation_status='pending').count()
-
-    def get_true_claims(self, obj):
-        return obj.claims.filter(validation_status='confirmed_true').count()
-
-    def get_false_claims(self, obj):
-        return obj.claims.filter(validation_status='proven_false').count()
-
 
 class JournalistDetailSerializer(serializers.ModelSerializer):
     """Detailed serializer for journalist profile pages with full statistics"""
 
-    # Statistics
-    total_claims = serializers.SerializerMethodField()
-    validated_claims = serializers.SerializerMethodField()
-    pending_claims = serializers.SerializerMethodField()
-    true_claims = serializers.SerializerMethodField()
-    false_claims = serializers.SerializerMethodField()
-    partially_true_claims = serializers.SerializerMethodField()
+    # Statistics (claim counts are Journalist's counter columns)
     accuracy_rate = serializers.DecimalField(
         source='truthfulness_score',
         max_digits=5,
         decimal_places=2,
         read_only=True
     )
-    original_scoops = serializers.SerializerMethodField()
-    first_to_report_count = serializers.SerializerMethodField()
 
     class Meta:
         model = Journalist
@@ -89,33 +69,6 @@ class JournalistDetailSerializer(serializers.ModelSerializer):
             'updated_at',
         ]
 
-    def get_total_claims(self, obj):
-        return obj.claims.count()
-
-    def get_validated_claims(self, obj):
-        return obj.claims.exclude(validation_status='pending').count()
-
-    def get_pending_claims(self, obj):
-        return obj.claims.filter(validation_status='pending').count()
-
-    def get_true_claims(self, obj):
-        return obj.claims.filter(validation_status='confirmed_true').count()
-
-    def get_false_claims(self, obj):
-        return obj.claims.filter(validation_status='proven_false').count()
-
-    def get_partially_true_claims(self, obj):
-        return obj.claims.filter(validation_status='partially_true').count()
-
-    def get_original_scoops(self, obj):
-        return obj.claims.filter(source_type='original').count()
-
-    def get_first_to_report_count(self, obj):
-        return obj.claims.filter(
-            source_type='original',
-            is_first_claim=True
-        ).count()
-
 
 class ClaimSerializer(serializers.ModelSerializer):
     """Serializer for claims with journalist information"""
@@ -186,20 +139,7 @@ class ClaimSerializer(serializers.ModelSerializer):
 
 def _get_or_create_journalist(name):
     """Get or create a Journalist record by name."""
-    try:
-        return Journalist.objects.get(name=name)
-    except Journalist.DoesNotExist:
-        pass
-
-    slug = slugify(name)
-    if Journalist.objects.filter(slug=slug).exists():
-        slug = slugify(f"{name}-source")
-
-    return Journalist.objects.create(
-        name=name,
-        slug=slug,
-        publications=[name],
-    )
+    return JournalistResolver.current().resolve(name)
 
 
 class ClaimWriteSerializer(serializers.ModelSerializer):
@@ -268,6 +208,17 @@ class ClaimWriteSerializer(serializers.ModelSerializer):
                 validated_data['from_club'] = from_club
                 validated_data['to_club'] = to_club
 
+        digest = content_hash(
+            journalist.name,
+            validated_data.get('player_name', ''),
+            validated_data.get('from_club', ''),
+            validated_data.get('to_club', ''),
+            claim_text,
+        )
+        if claim_exists(digest):
+            raise serializers.ValidationError('This claim has already been recorded.')
+        validated_data['content_hash'] = digest
+
         return super().create(validated_data)
 
     def update(self, instance, validated_data):
@@ -275,7 +226,23 @@ class ClaimWriteSerializer(serializers.ModelSerializer):
         if journalist_name:
             instance.journalist = _get_or_create_journalist(journalist_name)
 
-        return super().update(instance, validated_data)
+        digest = content_hash(
+            instance.journalist.name,
+            validated_data.get('player_name', instance.player_name),
+            validated_data.get('from_club', instance.from_club),
+            validated_data.get('to_club', instance.to_club),
+            validated_data.get('claim_text', instance.claim_text),
+        )
+        if Claim.objects.filter(content_hash=digest).exclude(pk=instance.pk).exists():
+            raise serializers.ValidationError('This claim has already been recorded.')
+
+        try:
+            return super().update(instance, validated_data)
+        except IntegrityError:
+            # Another request stored the same content first
+            if not claim_exists(digest):
+                raise
+            raise serializers.ValidationError('This claim has already been recorded.')
 
     def to_representation(self, instance):
         return ClaimSerializer(instance).data
@@ -0,0 +1,139 @@
+"""Batch scoring — rescores every journalist with vectorized group-bys.
+
+Claims and story memberships are pulled as columnar arrays instead of
+model instances, so a full rescore costs two scans and one bulk_update
+rather than a query and a save per journalist.
+
+Truthfulness is the number of confirmed true claims per journalist.
+Speed is the average story earliness per journalist: within each story,
+journalists are ranked by their earliest claim (claim_date, then id) and
+earliness = (N - rank) / (N - 1) for N reporters; stories with fewer than
+two reporters are skipped. This matches the ranks held in the story index.
+
+On PostgreSQL the speed ranking runs in the database with window
+functions instead (see sql_earliness).
+"""
+
+import logging
+from decimal import Decimal
+
+import numpy as np
+from django.db import connection
+from django.utils import timezone
+
+from apps.claims.models import Claim, Journalist, Story
+from apps.claims.services import sql_earliness
+from apps.claims.services.response_cache import bump_data_version
+
+logger = logging.getLogger(__name__)
+
+
+def _truth_counts(size):
+    """Confirmed true claims per journalist id, as an array indexed by id."""
+    journalist_ids = np.fromiter(
+        Claim.objects
+        .filter(validation_status=Claim.STATUS_CONFIRMED_TRUE)
+        .values_list('journalist_id', flat=True)
+        .iterator(chunk_size=10000),
+        dtype=np.int64,
+    )
+    return np.bincount(journalist_ids, minlength=size)
+
+
+def _speed_averages(size):
+    """
+    Average earliness per journalist id from story memberships.
+
+    Returns (sum of earliness, number of ranked stories), both indexed by id.
+    """
+    rows = (
+        Story.claims.through.objects
+        .order_by('story_id', 'claim__claim_date', 'claim_id')
+        .values_list('story_id', 'claim__journalist_id')
+        .iterator(chunk_size=10000)
+    )
+    flat = np.fromiter((value for row in rows for value in row), dtype=np.int64)
+    story_ids = flat[0::2]
+    journalist_ids = flat[1::2]
+
+    totals = np.zeros(size, dtype=np.float64)
+    counts = np.zeros(size, dtype=np.int64)
+    if not len(story_ids):
+        return totals, counts
+
+    # Keep each journalist's earliest claim per story; rows are already in
+    # (story, date, id) order, so the first occurrence of a pair is its earliest.
+    pair = story_ids * size + journalist_ids
+    _, first = np.unique(pair, return_index=True)
+    first.sort()
+    story_ids = story_ids[first]
+    journalist_ids = journalist_ids[first]
+
+    # Rank within each story = offset from the story's first row
+    starts = np.flatnonzero(np.r_[True, story_ids[1:] != story_ids[:-1]])
+    lengths = np.diff(np.r_[starts, len(story_ids)])
+    ranks = np.arange(len(story_ids)) - np.repeat(starts, lengths)
+    n = np.repeat(lengths, lengths)
+
+    ranked = n >= 2
+    earliness = (n[ranked] - 1 - ranks[ranked]) / (n[ranked] - 1)
+
+    totals += np.bincount(journalist_ids[ranked], weights=earliness, minlength=size)
+    counts += np.bincount(journalist_ids[ranked], minlength=size)
+    return totals, counts
+
+
+def _speed_averages_sql(size):
+    """Same as _speed_averages, ranked in the database (see sql_earliness)."""
+    totals = np.zeros(size, dtype=np.float64)
+    counts = np.zeros(size, dtype=np.int64)
+    for jid, (story_count, earliness, _) in sql_earliness.rank_aggregates('journalist').items():
+        totals[jid] = earliness * story_count
+        counts[jid] = story_count
+    return totals, counts
+
+
+def score_all_journalists():
+    """
+    Recompute truthfulness and speed for every journalist.
+
+    Only journalists whose scores changed are written, in one bulk_update.
+    Does not record score history.
+
+    Returns the number of journalists scored.
+    """
+    journalists = list(Journalist.objects.only('id', 'truthfulness_score', 'speed_score', 'updated_at'))
+    if not journalists:
+        return 0
+
+    size = max(j.id for j in journalists) + 1
+    truth = _truth_counts(size)
+    if connection.vendor == 'postgresql':
+        # Rank with window functions in the database; no membership rows cross the wire
+        totals, counts = _speed_averages_sql(size)
+    else:
+        totals, counts = _speed_averages(size)
+
+    now = timezone.now()
+    changed = []
+    for journalist in journalists:
+        jid = journalist.id
+        truthfulness = Decimal(int(truth[jid]))
+        if counts[jid]:
+            speed = Decimal(float(totals[jid] / counts[jid]) * 100).quantize(Decimal('0.01'))
+        else:
+            speed = Decimal('0.00')
+
+        if journalist.truthfulness_score != truthfulness or journalist.speed_score != speed:
+            journalist.truthfulness_score = truthfulness
+            journalist.speed_score = speed
+            journalist.updated_at = now
+            changed.append(journalist)
+
+    Journalist.objects.bulk_update(
+        changed, ['truthfulness_score', 'speed_score', 'updated_at'], batch_size=1000,
+    )
+    if changed:
+        bump_data_version()
+    logger.info("Batch scored %d journalists (%d changed)", len(journalists), len(changed))
+    return len(journalists)
@@ -0,0 +1,206 @@
+"""Bulk mode for maintenance runs that write many claims.
+
+By default every claim save re-fetches the old row in pre_save, updates
+the story index and queues a rescore. Inside bulk_claim_updates() the
+claim signals only record what was touched. On exit the work runs once:
+
+1. The touched journalists' claim counters are recounted with one
+   aggregate query.
+2. Touched claims with player changes are re-resolved to their
+   ReferencePlayer, which the story index joins on.
+3. Stories of deleted claims are re-ranked, and touched claims are
+   re-indexed. Above BULK_REINDEX_THRESHOLD claims the whole index is
+   rebuilt instead.
+4. Touched claims with club changes are relinked to their ReferenceClubs.
+5. Touched claims with text changes are re-hashed for near-duplicate lookup.
+6. The touched journalists, and those whose story ranks moved, are
+   rescored with grouped queries. After a full index rebuild every
+   journalist is rescored in one batch instead (see batch_scoring).
+7. One ScoreHistory row is inserted per journalist with validated changes,
+   all in a single bulk_create.
+
+Usage:
+    with bulk_claim_updates():
+        for claim in claims:
+            ...
+            claim.save()
+
+    @bulk_claim_updates()
+    def handle(self, *args, **options):
+        ...
+
+Queryset .update() calls bypass signals, so callers should pass the
+affected claims to note_claims() inside the block.
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+
+from apps.claims.models import Claim
+
+logger = logging.getLogger(__name__)
+
+# Above this many touched claims, rebuilding the story index is cheaper
+# than re-indexing claim by claim
+BULK_REINDEX_THRESHOLD = 1000
+
+# Claim fields that decide story membership and rank (matches signals.STORY_FIELDS)
+_STORY_UPDATE_FIELDS = {'player_name', 'to_club', 'claim_date', 'journalist', 'journalist_id', 'validation_status'}
+
+# Claim fields resolved to ClaimClub links
+_CLUB_UPDATE_FIELDS = {'from_club', 'to_club'}
+
+# Claim fields resolved to Claim.reference_player
+_PLAYER_UPDATE_FIELDS = {'player_name'}
+
+# Claim fields hashed into ClaimTextBand
+_TEXT_UPDATE_FIELDS = {'claim_text'}
+
+# Ids per IN (...) list, within database parameter limits
+_CHUNK_SIZE = 2000
+
+_state = threading.local()
+
+
+def bulk_mode_active() -> bool:
+    """Whether the current thread is inside bulk_claim_updates()."""
+    return getattr(_state, 'depth', 0) > 0
+
+
+def record_claim_save(claim, update_fields=None) -> None:
+    """Record a claim saved in bulk mode (called from the post_save signal)."""
+    if update_fields is None or not _STORY_UPDATE_FIELDS.isdisjoint(update_fields):
+        _state.claim_ids.add(claim.pk)
+    if update_fields is None or not _CLUB_UPDATE_FIELDS.isdisjoint(update_fields):
+        _state.club_claim_ids.add(claim.pk)
+    if update_fields is None or not _PLAYER_UPDATE_FIELDS.isdisjoint(update_fields):
+        _state.player_claim_ids.add(claim.pk)
+    if update_fields is None or not _TEXT_UPDATE_FIELDS.isdisjoint(update_fields):
+        _state.text_claim_ids.add(claim.pk)
+    _state.journalist_ids.add(claim.journalist_id)
+    if claim.validation_status != Claim.STATUS_PENDING or claim.is_first_claim:
+        _state.history_ids.add(claim.journalist_id)
+
+
+def record_previous_journalist(journalist_id) -> None:
+    """Record the journalist a claim saved in bulk mode belonged to (called from pre_save)."""
+    _state.journalist_ids.add(journalist_id)
+
+
+def record_claim_delete(claim, story_ids) -> None:
+    """Record a claim deleted in bulk mode (called from the post_delete signal)."""
+    _state.story_ids.update(story_ids)
+    _state.journalist_ids.add(claim.journalist_id)
+
+
+def note_claims(claims, text_indexed=False) -> None:
+    """
+    Record claims changed without signals, e.g. by a queryset .update().
+
+    Accepts a Claim queryset. Must be called inside bulk_claim_updates().
+    Pass text_indexed=True when the claims' near-duplicate bands are
+    already current, so they are not re-hashed on exit.
+    """
+    if not bulk_mode_active():
+        raise RuntimeError('note_claims() must be called inside bulk_claim_updates()')
+    for claim_id, journalist_id in claims.values_list('id', 'journalist_id'):
+        _state.claim_ids.add(claim_id)
+        _state.club_claim_ids.add(claim_id)
+        _state.player_claim_ids.add(claim_id)
+        if not text_indexed:
+            _state.text_claim_ids.add(claim_id)
+        _state.journalist_ids.add(journalist_id)
+
+
+@contextmanager
+def bulk_claim_updates():
+    """
+    Defer per-claim signal work until the end of the block.
+
+    Blocks can be nested; the deferred work runs when the outermost exits,
+    including when it exits with an exception, since the saves that did
+    happen are already committed.
+    """
+    depth = getattr(_state, 'depth', 0)
+    if depth == 0:
+        _state.claim_ids = set()
+        _state.club_claim_ids = set()
+        _state.player_claim_ids = set()
+        _state.text_claim_ids = set()
+        _state.journalist_ids = set()
+        _state.history_ids = set()
+        _state.story_ids = set()
+    _state.depth = depth + 1
+
+    try:
+        yield
+    finally:
+        _state.depth -= 1
+        if _state.depth == 0:
+            touched = (
+                _state.claim_ids, _state.club_claim_ids, _state.player_claim_ids, _state.text_claim_ids,
+                _state.journalist_ids, _state.history_ids, _state.story_ids,
+            )
+            _state.claim_ids = _state.club_claim_ids = _state.player_claim_ids = _state.text_claim_ids = None
+            _state.journalist_ids = None
+            _state.history_ids = _state.story_ids = None
+            _flush(*touched)
+
+
+def _flush(claim_ids, club_claim_ids, player_claim_ids, text_claim_ids, journalist_ids, history_ids, story_ids):
+    from apps.claims.services import claim_counters, club_resolver, near_duplicates, player_resolver
+    from apps.claims.services.response_cache import bump_data_version
+    from apps.claims.services.scoring import ScoringService
+    from apps.claims.services.story_index import StoryIndex
+
+    if not (claim_ids or club_claim_ids or player_claim_ids or text_claim_ids or journalist_ids or story_ids):
+        return
+
+    # Saves were not diffed per row, so recount rather than adjust
+    for ids in _chunks(journalist_ids):
+        claim_counters.rebuild(ids)
+
+    for ids in _chunks(player_claim_ids):
+        changed = player_resolver.sync_claim_players(
+            Claim.objects.filter(id__in=ids).only('id', 'player_name', 'reference_player_id')
+        )
+        # A new player id can move the claim between stories
+        claim_ids.update(changed)
+
+    # Journalists whose rank in a story moved need their speed rescored too
+    rescore_ids = set(journalist_ids)
+    if story_ids:
+        rescore_ids |= StoryIndex.remove_stories(story_ids)
+
+    rebuilt = len(claim_ids) > BULK_REINDEX_THRESHOLD
+    if rebuilt:
+        StoryIndex.rebuild()
+    else:
+        for claim in Claim.objects.filter(id__in=claim_ids):
+            rescore_ids |= StoryIndex.index_claim(claim)
+
+    for ids in _chunks(club_claim_ids):
+        club_resolver.sync_claim_clubs(Claim.objects.filter(id__in=ids).only('id', 'from_club', 'to_club'))
+
+    for ids in _chunks(text_claim_ids):
+        near_duplicates.index_claims(Claim.objects.filter(id__in=ids).only('id', 'claim_text'))
+
+    if rebuilt:
+        # Every story was re-ranked
+        rescored = ScoringService.update_all_journalist_scores()
+    else:
+        rescored = sum(ScoringService.update_scores(ids) for ids in _chunks(rescore_ids))
+    recorded = ScoringService.record_score_history(history_ids)
+    bump_data_version()
+
+    logger.info(
+        "Bulk update: re-indexed %d claims, rescored %d journalists, recorded %d history entries",
+        len(claim_ids), rescored, recorded,
+    )
+
+
+def _chunks(ids):
+    ids = sorted(ids)
+    for start in range(0, len(ids), _CHUNK_SIZE):
+        yield ids[start:start + _CHUNK_SIZE]
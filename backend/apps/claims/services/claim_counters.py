@@ -0,0 +1,136 @@
+"""Denormalised claim counters on Journalist.
+
+Each claim contributes to a fixed set of counters (total, pending, true,
+...). Claim signals apply the difference between a claim's old and new
+contribution with F() expressions, inside the claim's save transaction,
+so list and profile responses can read the columns directly.
+
+rebuild() recomputes every counter from the claims in one aggregate
+query, for reconciliation and after bulk writes.
+"""
+
+import logging
+from collections import Counter, defaultdict
+
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from apps.claims.models import Claim, Journalist
+from apps.claims.services.response_cache import bump_data_version
+
+logger = logging.getLogger(__name__)
+
+# Counter field -> condition a claim must meet to be counted
+COUNTER_FILTERS = {
+    'total_claims': Q(),
+    'validated_claims': ~Q(validation_status=Claim.STATUS_PENDING),
+    'pending_claims': Q(validation_status=Claim.STATUS_PENDING),
+    'true_claims': Q(validation_status=Claim.STATUS_CONFIRMED_TRUE),
+    'false_claims': Q(validation_status=Claim.STATUS_PROVEN_FALSE),
+    'partially_true_claims': Q(validation_status=Claim.STATUS_PARTIALLY_TRUE),
+    'original_scoops': Q(source_type=Claim.SOURCE_ORIGINAL),
+    'first_to_report_count': Q(source_type=Claim.SOURCE_ORIGINAL, is_first_claim=True),
+}
+
+
+def counter_state(claim):
+    """The claim fields that decide its counters, with its journalist."""
+    return (claim.journalist_id, claim.validation_status, claim.source_type, claim.is_first_claim)
+
+
+def _contribution(validation_status, source_type, is_first_claim):
+    original = source_type == Claim.SOURCE_ORIGINAL
+    return {
+        'total_claims': 1,
+        'validated_claims': int(validation_status != Claim.STATUS_PENDING),
+        'pending_claims': int(validation_status == Claim.STATUS_PENDING),
+        'true_claims': int(validation_status == Claim.STATUS_CONFIRMED_TRUE),
+        'false_claims': int(validation_status == Claim.STATUS_PROVEN_FALSE),
+        'partially_true_claims': int(validation_status == Claim.STATUS_PARTIALLY_TRUE),
+        'original_scoops': int(original),
+        'first_to_report_count': int(original and is_first_claim),
+    }
+
+
+def _adjust(journalist_id, deltas):
+    changes = {field: F(field) + delta for field, delta in deltas.items() if delta}
+    if journalist_id and changes:
+        Journalist.objects.filter(pk=journalist_id).update(**changes, updated_at=timezone.now())
+
+
+def apply_change(previous, current):
+    """
+    Move a claim's contribution from its previous state to its current one.
+
+    Args:
+        previous: counter_state() before the change, or None for a new claim
+        current: counter_state() after the change, or None for a deleted claim
+    """
+    if previous == current:
+        return
+
+    old = _contribution(*previous[1:]) if previous else {}
+    new = _contribution(*current[1:]) if current else {}
+    old_jid = previous[0] if previous else None
+    new_jid = current[0] if current else None
+
+    if old_jid == new_jid:
+        _adjust(new_jid, {f: new.get(f, 0) - old.get(f, 0) for f in COUNTER_FILTERS})
+    else:
+        _adjust(old_jid, {f: -n for f, n in old.items()})
+        _adjust(new_jid, new)
+
+
+def add_claims(claims):
+    """Add the contribution of new claims, with one update per journalist."""
+    totals = defaultdict(Counter)
+    for claim in claims:
+        journalist_id, *state = counter_state(claim)
+        totals[journalist_id].update(_contribution(*state))
+    for journalist_id, deltas in totals.items():
+        _adjust(journalist_id, deltas)
+
+
+def rebuild(journalist_ids=None):
+    """
+    Recompute counters from the claims with one aggregate query.
+
+    Args:
+        journalist_ids: Limit to these journalists (default: all)
+
+    Returns the number of journalists whose counters were corrected.
+    """
+    claims = Claim.objects.all()
+    journalists = Journalist.objects.only('id', 'updated_at', *Journalist.COUNTER_FIELDS)
+    if journalist_ids is not None:
+        claims = claims.filter(journalist_id__in=journalist_ids)
+        journalists = journalists.filter(id__in=journalist_ids)
+
+    counts = {
+        row.pop('journalist_id'): row
+        for row in (
+            claims
+            .values('journalist_id')
+            .annotate(**{
+                field: Count('id', filter=condition)
+                for field, condition in COUNTER_FILTERS.items()
+            })
+        )
+    }
+
+    now = timezone.now()
+    changed = []
+    for journalist in journalists:
+        row = counts.get(journalist.id, {})
+        values = {field: row.get(field, 0) for field in Journalist.COUNTER_FIELDS}
+        if any(getattr(journalist, f) != v for f, v in values.items()):
+            for field, value in values.items():
+                setattr(journalist, field, value)
+            journalist.updated_at = now
+            changed.append(journalist)
+
+    Journalist.objects.bulk_update(changed, (*Journalist.COUNTER_FIELDS, 'updated_at'), batch_size=1000)
+    if changed:
+        bump_data_version()
+        logger.info("Corrected claim counters for %d journalists", len(changed))
+    return len(changed)
@@ -3,18 +3,11 @@ import logging
 from django.utils import timezone
 
 from apps.claims.models import Claim, Journalist
+from apps.claims.services.claim_ingest import insert_claim
+from apps.claims.services.journalist_resolver import JournalistResolver
 
 logger = logging.getLogger(__name__)
 
-# Map journalist names to known Twitter handles
-KNOWN_JOURNALISTS = {
-    'Fabrizio Romano': {'twitter': '@FabrizioRomano'},
-    'David Ornstein': {'twitter': '@David_Ornstein'},
-    'Florian Plettenberg': {'twitter': '@Plettigoal'},
-    'Matteo Moretto': {'twitter': '@MatteMoretto'},
-    'Ben Jacobs': {'twitter': '@JacobsBen'},
-}
-
 
 class ClaimCreator:
     """Creates Journalist and Claim records from extracted claim data."""
@@ -27,7 +20,8 @@ class ClaimCreator:
     ) -> Claim | None:
         """Create a Claim record from extracted data.
 
-        Returns the created Claim, or None if creation failed.
+        Returns the created Claim, or None if creation failed or the same
+        claim is already stored.
         """
         journalist_name = claim_data.get('journalist_name', '').strip()
         if not journalist_name:
@@ -58,7 +52,7 @@ class ClaimCreator:
         if source_type not in ['original', 'citing']:
             source_type = 'original'
 
-        claim = Claim.objects.create(
+        claim = insert_claim(
             journalist=journalist,
             cited_journalist=cited_journalist,
             claim_text=claim_text,
@@ -73,6 +67,8 @@ class ClaimCreator:
             source_type=source_type,
             validation_status='pending',
         )
+        if claim is None:
+            return None
 
         logger.info(
             "Created claim #%d: %s → %s (%s)",
@@ -87,17 +83,9 @@ class ClaimCreator:
         self, name: str, publication: str = ''
     ) -> Journalist:
         """Get or create a Journalist, updating publications if needed."""
-        journalist, created = Journalist.objects.get_or_create(
-            name=name,
-            defaults={
-                'publications': [publication] if publication else [],
-                'twitter_handle': KNOWN_JOURNALISTS.get(name, {}).get('twitter', ''),
-            },
-        )
+        journalist = JournalistResolver.current().resolve(name, publication)
 
-        if created:
-            logger.info("Created new journalist: %s", name)
-        elif publication and publication not in (journalist.publications or []):
+        if publication and publication not in (journalist.publications or []):
             journalist.publications = (journalist.publications or []) + [publication]
             journalist.save(update_fields=['publications'])
             logger.info("Added publication '%s' to journalist %s", publication, name)
@@ -0,0 +1,160 @@
+"""Idempotent claim ingestion keyed by a normalised content hash.
+
+Every claim gets a content_hash when it is first saved: a SHA-256 over its
+journalist, player, clubs and text, each case-folded with whitespace
+collapsed. The column is unique, so the same claim cannot be stored twice
+however many times (or how concurrently) a source is re-scraped.
+
+An exact repeat costs one indexed probe (claim_exists). Only claims that
+are not exact repeats need the fuzzy near-duplicate check.
+
+insert_claim() stores one claim through save(), so the claim signals run.
+insert_claims() stores a scraped page at once: one probe for the whole
+batch, one bulk_create, and the signals' incremental work done for the
+batch together (or left to an enclosing bulk_claim_updates() block).
+
+Editing a claim's content rehashes it (see signals.set_content_hash). A
+claim left an exact repeat of another, by an edit or because it was stored
+before the column existed, has no hash.
+"""
+
+import hashlib
+import logging
+import re
+import unicodedata
+
+from django.db import IntegrityError, transaction
+
+from apps.claims.models import Claim
+from apps.claims.services import claim_counters, club_resolver, near_duplicates, player_resolver
+from apps.claims.services.bulk_updates import bulk_mode_active, note_claims
+from apps.claims.services.response_cache import bump_data_version
+from apps.claims.services.score_queue import ScoreQueue
+from apps.claims.services.story_index import StoryIndex
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Content hashes per IN (...) list when probing a batch
+_PROBE_SIZE = 500
+
+
+def normalize(value: str) -> str:
+    """Case-folded, NFKC-normalised, with whitespace runs collapsed."""
+    value = unicodedata.normalize('NFKC', value or '').casefold()
+    return _WHITESPACE_RE.sub(' ', value).strip()
+
+
+def content_hash(journalist_name: str, player_name: str, from_club: str, to_club: str, claim_text: str) -> str:
+    """The content hash of a claim with these fields."""
+    parts = (journalist_name, player_name, from_club, to_club, claim_text)
+    return hashlib.sha256('\x1f'.join(normalize(part) for part in parts).encode()).hexdigest()
+
+
+def claim_content_hash(claim) -> str:
+    """The content hash of a Claim instance (its journalist must be set)."""
+    return content_hash(
+        claim.journalist.name, claim.player_name, claim.from_club, claim.to_club, claim.claim_text,
+    )
+
+
+def claim_exists(digest: str) -> bool:
+    return Claim.objects.filter(content_hash=digest).exists()
+
+
+def insert_claim(**fields) -> Claim | None:
+    """
+    Create a claim unless one with the same content is already stored.
+
+    Returns the new claim, or None when it was an exact repeat. A
+    concurrent insert of the same content loses on the unique constraint
+    and is treated as a repeat too.
+    """
+    claim = Claim(**fields)
+    claim.content_hash = claim_content_hash(claim)
+    if claim_exists(claim.content_hash):
+        logger.debug("Skipping exact repeat: %s", claim.claim_text[:60])
+        return None
+    return claim if _save_new(claim) else None
+
+
+def insert_claims(claims) -> list[Claim]:
+    """
+    Store the unsaved claims that are not exact repeats, in one transaction.
+
+    The claims' journalists must be set. Their hashes are probed together,
+    repeats within the batch are dropped, and the rest are written with one
+    bulk_create. bulk_create sends no signals, so the same work is done
+    here for the batch: counters, club and player links, near-duplicate
+    bands and story index, with the journalists queued for rescoring.
+    Inside bulk_claim_updates() the claims are only recorded, and the
+    block's exit does that work for everything it touched.
+
+    If another writer stores one of the claims first, the bulk insert fails
+    on the unique constraint and the batch is saved row by row instead.
+
+    Returns the claims stored.
+    """
+    pending = {}
+    for claim in claims:
+        claim.content_hash = claim.content_hash or claim_content_hash(claim)
+        pending.setdefault(claim.content_hash, claim)
+
+    hashes = list(pending)
+    for start in range(0, len(hashes), _PROBE_SIZE):
+        for digest in Claim.objects.filter(
+            content_hash__in=hashes[start:start + _PROBE_SIZE],
+        ).values_list('content_hash', flat=True):
+            del pending[digest]
+
+    new = list(pending.values())
+    if not new:
+        return []
+
+    try:
+        with transaction.atomic():
+            created = Claim.objects.bulk_create(new)
+            if bulk_mode_active():
+                # Hashed now rather than on exit, so the next batch of a long
+                # bulk_claim_updates() block can find these as near-duplicates
+                near_duplicates.index_claims(created)
+                note_claims(Claim.objects.filter(id__in=[claim.pk for claim in created]), text_indexed=True)
+            else:
+                _index_new_claims(created)
+    except IntegrityError:
+        logger.info("Batch lost a race on the content hash; saving %d claims one by one", len(new))
+        # Row by row, the claim signals do the work
+        return [claim for claim in new if _save_new(claim)]
+    return created
+
+
+def _index_new_claims(claims) -> None:
+    """What the claim signals do for a new claim, for a batch at once."""
+    claim_counters.add_claims(claims)
+    club_resolver.sync_claim_clubs(claims)
+    near_duplicates.index_claims(claims)
+    # Before story indexing, which joins on the player
+    player_resolver.sync_claim_players(claims)
+
+    affected = StoryIndex.index_new_claims(claims)
+    rescore = {
+        claim.journalist_id for claim in claims
+        if claim.validation_status != Claim.STATUS_PENDING or claim.is_first_claim
+    }
+    ScoreQueue.mark(rescore, record_history=True)
+    ScoreQueue.mark(affected - rescore)
+    bump_data_version()
+
+
+def _save_new(claim) -> bool:
+    try:
+        # Claim.save() runs in its own transaction (a savepoint when nested),
+        # so a conflict leaves any outer transaction usable
+        claim.save(force_insert=True)
+    except IntegrityError:
+        if not claim_exists(claim.content_hash):
+            raise
+        logger.debug("Skipping exact repeat (concurrent insert): %s", claim.claim_text[:60])
+        return False
+    return True
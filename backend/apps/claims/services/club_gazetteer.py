@@ -0,0 +1,205 @@
+"""Recognise club names in free text.
+
+The gazetteer holds every name a club is written as:
+
+1. The hand-picked names in gossip_scraper.CLUBS, with their display form.
+2. Their aliases (see validator.CLUB_ALIASES), shown as the club they
+   stand for ("Man Utd" -> "Manchester United").
+3. ReferenceClub names, in full ("Stade Rennais FC") and without affixes
+   like "FC" when at least two words remain ("Stade Rennais"). Single-word
+   short forms are left to CLUBS, since on their own they are too often
+   places or ordinary words.
+
+Names are stored as a trie of word tokens, compared case- and
+accent-insensitively. A scan walks the text's tokens once, taking the
+longest name starting at each token, so matches always fall on word
+boundaries ("Roma" does not match inside "Romano"). A one-word name that
+is also an ordinary word ("Nice", "Wolves") only matches when the text
+capitalises it, so "a nice move" names no club.
+"""
+
+import re
+import threading
+import time
+import unicodedata
+
+from django.db.models import Count, Max
+
+from apps.claims.models import ReferenceClub
+from apps.claims.services.club_resolver import _AFFIXES
+from apps.claims.services.validator import CLUB_ALIASES
+
+_TOKEN_RE = re.compile(r'\w+')
+
+# Aliases too common in prose to mark a club on their own ("a real chance")
+_PROSE_ALIASES = {'real', 'inter'}
+
+# One-word names that are also ordinary words, matched only when capitalised
+_COMMON_WORDS = {'nice', 'lens', 'wolves', 'rangers', 'celtic', 'hearts', 'sporting', 'spurs'}
+
+# How long current() trusts its gazetteer before checking the reference clubs
+_RECHECK_SECONDS = 60
+
+_END = None  # trie key holding the display name of a name ending here
+
+
+def _fold(token: str) -> str:
+    token = token.lower()
+    if not token.isascii():
+        token = unicodedata.normalize('NFKD', token).encode('ascii', 'ignore').decode()
+    return token
+
+
+def name_tokens(name: str) -> tuple[str, ...]:
+    """The folded word tokens a name is matched by."""
+    return tuple(t for t in (_fold(m.group()) for m in _TOKEN_RE.finditer(name or '')) if t)
+
+
+def _canonical(name: str) -> str:
+    # Aliases can chain ("inter" -> "inter milan" -> "fc internazionale milano")
+    text = name.lower()
+    for _ in range(3):
+        text = CLUB_ALIASES.get(text, text)
+    return text
+
+
+class ClubGazetteer:
+    """Club name recognition over a token trie."""
+
+    _lock = threading.Lock()
+    _current = None
+    _fingerprint = None
+    _checked_at = None
+
+    def __init__(self, clubs, reference_names=()):
+        """
+        Args:
+            clubs: Mapping of lowercased name -> display name, tried first
+                (gossip_scraper.CLUBS)
+            reference_names: Iterable of ReferenceClub names
+        """
+        self._trie = {}
+        self._ranks = {}  # display name -> order of preference, for ties
+        rank = 0
+
+        display_by_canonical = {}
+        for club_lower, display in clubs.items():
+            self._add(club_lower, display, rank)
+            display_by_canonical.setdefault(_canonical(club_lower), (display, rank))
+            rank += 1
+
+        reference_names = list(reference_names)
+        for name in reference_names:
+            display_by_canonical.setdefault(_canonical(name), (name, rank))
+            rank += 1
+
+        for alias in CLUB_ALIASES:
+            if alias not in _PROSE_ALIASES and _canonical(alias) in display_by_canonical:
+                self._add(alias, *display_by_canonical[_canonical(alias)])
+
+        short_forms = {}
+        for name in reference_names:
+            tokens = name_tokens(name)
+            self._add_tokens(tokens, name, display_by_canonical[_canonical(name)][1])
+            short = tuple(t for t in tokens if t not in _AFFIXES and not t.isdigit())
+            if len(short) >= 2 and short != tokens:
+                short_forms.setdefault(short, set()).add(name)
+
+        # A short form shared by two reference clubs cannot be told apart
+        for tokens, names in short_forms.items():
+            if len(names) == 1:
+                name = next(iter(names))
+                self._add_tokens(tokens, name, display_by_canonical[_canonical(name)][1])
+
+    @classmethod
+    def current(cls):
+        """
+        The shared gazetteer, rebuilt when the reference clubs change.
+
+        The reference clubs are checked at most every _RECHECK_SECONDS, so
+        per-claim callers do not query the database each time.
+        """
+        # Imported here: the scraper module imports this one
+        from apps.claims.scrapers.gossip_scraper import CLUBS
+
+        with cls._lock:
+            now = time.monotonic()
+            if cls._current is not None and now - cls._checked_at < _RECHECK_SECONDS:
+                return cls._current
+            agg = ReferenceClub.objects.aggregate(count=Count('id'), latest=Max('updated_at'))
+            fingerprint = (agg['count'], agg['latest'])
+            if cls._current is None or cls._fingerprint != fingerprint:
+                cls._current = cls(CLUBS, ReferenceClub.objects.values_list('name', flat=True))
+                cls._fingerprint = fingerprint
+            cls._checked_at = now
+            return cls._current
+
+    def _add(self, name, display, rank):
+        self._add_tokens(name_tokens(name), display, rank)
+
+    def _add_tokens(self, tokens, display, rank):
+        if not tokens:
+            return
+        node = self._trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        # The first name to claim a spelling keeps it (CLUBS before references)
+        node.setdefault(_END, display)
+        self._ranks.setdefault(display, rank)
+
+    def spans(self, text: str) -> list[tuple[int, int, str]]:
+        """
+        (start, end, display name) of each club mention, left to right.
+
+        Mentions do not overlap; at each token the longest name wins.
+        """
+        tokens = list(_TOKEN_RE.finditer(text or ''))
+        words = [_fold(m.group()) for m in tokens]
+        found = []
+        i = 0
+        while i < len(words):
+            node = self._trie
+            longest = None
+            j = i
+            while j < len(words) and words[j] in node:
+                node = node[words[j]]
+                j += 1
+                if _END in node and (j > i + 1 or self._names_club(tokens[i].group(), words[i])):
+                    longest = (j, node[_END])
+            if longest:
+                end, display = longest
+                found.append((tokens[i].start(), tokens[end - 1].end(), display))
+                i = end
+            else:
+                i += 1
+        return found
+
+    @staticmethod
+    def _names_club(written, word):
+        """Whether a one-word match is a club name rather than an ordinary word."""
+        return word not in _COMMON_WORDS or written[0].isupper()
+
+    def clubs(self, text: str) -> list[str]:
+        """
+        The distinct clubs mentioned, longest name first.
+
+        Each club is named by its display name when the text spells it that
+        way, and as written otherwise ("Man Utd", "Paris St Germain"), so
+        callers can still find the name in the text (classify_club_direction
+        does). ClubResolver maps either form to the same ReferenceClub.
+
+        A name contained in a longer one found in the same text
+        ("Newcastle" next to "Newcastle United") is taken to be the same club.
+        """
+        names = {}
+        for start, end, display in self.spans(text):
+            written = text[start:end]
+            if written.lower() == display.lower():
+                names[display] = display
+            else:
+                names.setdefault(display, written)
+        found = []
+        for display, name in sorted(names.items(), key=lambda item: (-len(item[1]), self._ranks[item[0]])):
+            if not any(name in existing or existing in name for existing in found):
+                found.append(name)
+        return found
@@ -0,0 +1,254 @@
+"""Resolve free-text club names on claims to canonical ReferenceClub rows.
+
+Claims store clubs as scraped text ("Man Utd", "Arsenal, Chelsea"). The
+resolver maps each name to a ReferenceClub id:
+
+1. Names are reduced to a key: lowercased, accents and punctuation
+   stripped, aliases applied (see validator.CLUB_ALIASES), and affixes
+   like "FC" or "1899" dropped. So "Arsenal FC" and "arsenal" share a key.
+2. An exact key match wins.
+3. Otherwise the reference club whose key tokens contain the name's
+   tokens ("Brighton" -> "Brighton & Hove Albion") is used. The club with
+   the fewest tokens wins, and a tie is treated as ambiguous.
+
+Links are stored in ClaimClub, one row per (claim, name key, direction),
+with the ReferenceClub id when the name resolves. A name that does not
+resolve still has its key, so club_filter() is an indexed lookup on the
+link table for every club name instead of an ICONTAINS scan of claims.
+"""
+
+import logging
+import re
+import threading
+import unicodedata
+from collections import defaultdict
+
+from django.db.models import Count, Max, Q
+
+from apps.claims.models import Claim, ClaimClub, ReferenceClub
+from apps.claims.services.validator import CLUB_ALIASES
+
+logger = logging.getLogger(__name__)
+
+# Tokens that carry no identity in club names ("FC Porto", "AC Milan", "Hertha BSC")
+_AFFIXES = {
+    'fc', 'afc', 'cf', 'sc', 'ac', 'as', 'ssc', 'sv', 'fk', 'sk', 'cd', 'sd', 'ud',
+    'rc', 'rcd', 'ca', 'sl', 'bsc', 'tsg', 'vfb', 'vfl', 'club', 'calcio', 'the',
+}
+
+_NON_WORD_RE = re.compile(r'[^a-z0-9]+')
+
+# Resolved names kept per resolver (club query params are user input)
+_CACHE_LIMIT = 50000
+
+
+def club_key(name: str) -> str:
+    """Reduce a club name to its comparison key."""
+    text = unicodedata.normalize('NFKD', name or '').encode('ascii', 'ignore').decode().lower().strip()
+    # Aliases are written with punctuation ("paris st-germain") and can chain
+    # ("inter" -> "inter milan" -> "fc internazionale milano")
+    for _ in range(3):
+        text = CLUB_ALIASES.get(text, text)
+    text = _NON_WORD_RE.sub(' ', text).strip()
+    text = CLUB_ALIASES.get(text, text)
+    tokens = [
+        token for token in _NON_WORD_RE.sub(' ', text).split()
+        if token not in _AFFIXES and not token.isdigit()
+    ]
+    return ' '.join(tokens)
+
+
+def split_clubs(value: str) -> list[str]:
+    """Split a club field that may hold a comma-separated list."""
+    return [part.strip() for part in (value or '').split(',') if part.strip()]
+
+
+class ClubResolver:
+    """Name -> ReferenceClub id lookups over an in-memory key index."""
+
+    _lock = threading.Lock()
+    _current = None
+    _fingerprint = None
+
+    def __init__(self, clubs):
+        """
+        Args:
+            clubs: Iterable of (id, name) pairs
+        """
+        self._by_key = {}
+        self._by_token = defaultdict(set)
+        self._token_counts = {}
+        ambiguous = set()
+
+        for club_id, name in clubs:
+            key = club_key(name)
+            if not key:
+                continue
+            if key in self._by_key and self._by_key[key] != club_id:
+                ambiguous.add(key)
+            self._by_key.setdefault(key, club_id)
+            tokens = key.split()
+            self._token_counts[club_id] = len(tokens)
+            for token in tokens:
+                self._by_token[token].add(club_id)
+
+        # Two reference clubs with the same key cannot be told apart by name
+        for key in ambiguous:
+            del self._by_key[key]
+        self._cache = {}
+
+    @classmethod
+    def current(cls):
+        """The shared resolver, rebuilt when the reference clubs change."""
+        agg = ReferenceClub.objects.aggregate(count=Count('id'), latest=Max('updated_at'))
+        fingerprint = (agg['count'], agg['latest'])
+        with cls._lock:
+            if cls._current is None or cls._fingerprint != fingerprint:
+                cls._current = cls(ReferenceClub.objects.values_list('id', 'name'))
+                cls._fingerprint = fingerprint
+            return cls._current
+
+    def resolve(self, name: str) -> int | None:
+        """The ReferenceClub id for one club name, or None."""
+        return self.resolve_key(club_key(name))
+
+    def resolve_key(self, key: str) -> int | None:
+        """The ReferenceClub id for a club_key(), or None."""
+        if key not in self._cache:
+            if len(self._cache) >= _CACHE_LIMIT:
+                self._cache.clear()
+            self._cache[key] = self._resolve_key(key)
+        return self._cache[key]
+
+    def candidates(self, key: str) -> set[int]:
+        """
+        Every club a key could name: its exact match, else each club whose
+        key tokens contain all of the key's tokens.
+        """
+        if not key:
+            return set()
+        if key in self._by_key:
+            return {self._by_key[key]}
+        postings = [self._by_token.get(token) for token in key.split()]
+        if not all(postings):
+            return set()
+        return set.intersection(*postings)
+
+    def _resolve_key(self, key):
+        candidates = self.candidates(key)
+        if len(candidates) <= 1:
+            return next(iter(candidates), None)
+
+        fewest = min(self._token_counts[c] for c in candidates)
+        best = [c for c in candidates if self._token_counts[c] == fewest]
+        return best[0] if len(best) == 1 else None
+
+
+def field_links(value: str, resolver) -> dict[str, int | None]:
+    """name key -> ReferenceClub id (or None) for each club named in a field."""
+    links = {}
+    for name in split_clubs(value):
+        key = club_key(name)
+        if key and key not in links:
+            links[key] = resolver.resolve_key(key)
+    return links
+
+
+def claim_links(claim, resolver) -> set[tuple[int, str, str, int | None]]:
+    """The (claim_id, direction, name_key, club_id) links a claim should have."""
+    links = set()
+    for direction, value in ((ClaimClub.DIRECTION_FROM, claim.from_club), (ClaimClub.DIRECTION_TO, claim.to_club)):
+        for key, club_id in field_links(value, resolver).items():
+            links.add((claim.pk, direction, key, club_id))
+    return links
+
+
+def sync_claim_clubs(claims, resolver=None):
+    """
+    Bring the ClaimClub links of the given claims in line with their text.
+
+    Only the difference is written: stale links are deleted and missing
+    ones inserted, each in one query.
+
+    Returns (created, deleted) counts.
+    """
+    claims = list(claims)
+    if not claims:
+        return 0, 0
+    resolver = resolver or ClubResolver.current()
+
+    desired = set()
+    for claim in claims:
+        desired |= claim_links(claim, resolver)
+
+    existing = {
+        tuple(link): link_id
+        for link_id, *link in ClaimClub.objects.filter(
+            claim_id__in=[claim.pk for claim in claims],
+        ).values_list('id', 'claim_id', 'direction', 'name_key', 'club_id')
+    }
+
+    stale = [link_id for link, link_id in existing.items() if link not in desired]
+    if stale:
+        ClaimClub.objects.filter(id__in=stale).delete()
+
+    missing = [
+        ClaimClub(claim_id=claim_id, direction=direction, name_key=key, club_id=club_id)
+        for claim_id, direction, key, club_id in desired - existing.keys()
+    ]
+    ClaimClub.objects.bulk_create(missing, ignore_conflicts=True)
+    return len(missing), len(stale)
+
+
+def backfill(batch_size=2000):
+    """
+    Relink every claim, batch by batch.
+
+    Returns (claims, created, deleted) counts.
+    """
+    resolver = ClubResolver.current()
+    totals = [0, 0, 0]
+    batch = []
+
+    def flush():
+        created, deleted = sync_claim_clubs(batch, resolver)
+        totals[0] += len(batch)
+        totals[1] += created
+        totals[2] += deleted
+        batch.clear()
+
+    for claim in Claim.objects.only('id', 'from_club', 'to_club').order_by('id').iterator(chunk_size=batch_size):
+        batch.append(claim)
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+
+    logger.info("Relinked clubs for %d claims (%d links created, %d deleted)", *totals)
+    return tuple(totals)
+
+
+def club_links_for(club: str):
+    """
+    ClaimClub rows naming the club in a query parameter.
+
+    Links whose name has the same key match, and so do links to any
+    reference club the name could mean ("Manchester" covers both
+    Manchester clubs, as a text search would).
+    """
+    key = club_key(club)
+    condition = Q(name_key=key)
+    club_ids = ClubResolver.current().candidates(key)
+    if club_ids:
+        condition |= Q(club_id__in=club_ids)
+    return ClaimClub.objects.filter(condition)
+
+
+def club_filter(club: str):
+    """
+    A filter for claims involving the club named by a query parameter.
+
+    Usage:
+        Claim.objects.filter(club_filter('Arsenal'))
+    """
+    return Q(id__in=club_links_for(club).values('claim_id'))
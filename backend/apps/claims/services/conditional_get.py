@@ -0,0 +1,78 @@
+"""Conditional GET (ETag / Last-Modified) for read-only API views.
+
+The validator is the claims data version (see services.response_cache),
+which every write to claims, journalists, scores, stories and transfers
+bumps after commit. Reading it is one unique-index lookup, shared with
+the response cache for the rest of the request. If the client's
+If-None-Match matches, the view answers 304 before any serializer or
+scoring code runs.
+
+Last-Modified is the time of the latest bump, sent so clients and CDNs
+can show freshness. If-Modified-Since alone is not trusted to answer 304.
+"""
+
+import functools
+import hashlib
+
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+from apps.claims.services.response_cache import current_data_version
+
+
+def family_validators(family, request=None):
+    """
+    Compute (etag, last_modified) for a resource family.
+
+    The family only namespaces the tag; every family moves with the
+    claims data version.
+    """
+    version, last_modified = current_data_version(request)
+    etag = hashlib.md5(f'{family}:{version}'.encode()).hexdigest()
+    return etag, last_modified
+
+
+def _etag_matches(header, etag):
+    if not header:
+        return False
+    if header.strip() == '*':
+        return True
+    candidates = {tag.strip().removeprefix('W/') for tag in header.split(',')}
+    return quote_etag(etag) in candidates
+
+
+def conditional_get(family):
+    """
+    Answer GET requests with 304 when the client already has the current data.
+
+    Usage:
+        @conditional_get('journalists')
+        def list(self, request, *args, **kwargs):
+            return super().list(request, *args, **kwargs)
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(self, request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(self, request, *args, **kwargs)
+
+            etag, last_modified = family_validators(family, request)
+            # The same URL renders differently per format (JSON vs browsable API)
+            renderer = getattr(request, 'accepted_renderer', None)
+            if renderer is not None:
+                etag = f'{etag}-{renderer.format}'
+            headers = {'ETag': f'W/{quote_etag(etag)}'}
+            if last_modified is not None:
+                headers['Last-Modified'] = http_date(last_modified.timestamp())
+
+            if _etag_matches(request.headers.get('If-None-Match'), etag):
+                return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+            response = view(self, request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                for header, value in headers.items():
+                    response[header] = value
+            return response
+        return wrapper
+    return decorator
@@ -1,14 +1,14 @@
 import logging
 from datetime import timedelta
-from difflib import SequenceMatcher
 
 from django.utils import timezone
 
 from apps.claims.models import Claim
+from apps.claims.services.claim_ingest import claim_exists, content_hash
+from apps.claims.services.near_duplicates import SIMILARITY_THRESHOLD, find_near_duplicate
 
 logger = logging.getLogger(__name__)
 
-SIMILARITY_THRESHOLD = 0.85
 DEDUP_WINDOW_DAYS = 30
 
 
@@ -18,9 +18,10 @@ class Deduplicator:
     def is_duplicate(self, claim_data: dict) -> bool:
         """Check if a claim is a duplicate of an existing one.
 
-        A claim is considered duplicate if there's an existing claim from
-        the same journalist about the same player/club combination with
-        >85% text similarity within the last 30 days.
+        A claim is considered duplicate if the same claim is already stored
+        (same content hash), or if there's an existing claim from the same
+        journalist about the same player/club combination with >85% text
+        similarity within the last 30 days.
         """
         journalist_name = claim_data.get('journalist_name', '')
         player_name = claim_data.get('player_name', '')
@@ -31,6 +32,11 @@ class Deduplicator:
         if not journalist_name or not claim_text:
             return False
 
+        # Exact repeats need one indexed probe and no similarity check
+        if claim_exists(content_hash(journalist_name, player_name, from_club, to_club, claim_text)):
+            logger.info("Exact duplicate: '%s'", claim_text[:60])
+            return True
+
         cutoff = timezone.now() - timedelta(days=DEDUP_WINDOW_DAYS)
 
         # Find existing claims from same journalist about same player/club
@@ -46,16 +52,15 @@ class Deduplicator:
         if from_club:
             existing = existing.filter(from_club__iexact=from_club)
 
-        # Check text similarity
-        for claim in existing:
-            ratio = SequenceMatcher(None, claim_text.lower(), claim.claim_text.lower()).ratio()
-            if ratio > SIMILARITY_THRESHOLD:
-                logger.info(
-                    "Duplicate found (%.0f%% similar): '%s' matches existing claim #%d",
-                    ratio * 100,
-                    claim_text[:60],
-                    claim.id,
-                )
-                return True
+        # Check text similarity against the near-duplicate candidates only
+        claim, ratio = find_near_duplicate(claim_text, existing, SIMILARITY_THRESHOLD)
+        if claim is not None:
+            logger.info(
+                "Duplicate found (%.0f%% similar): '%s' matches existing claim #%d",
+                ratio * 100,
+                claim_text[:60],
+                claim.id,
+            )
+            return True
 
         return False
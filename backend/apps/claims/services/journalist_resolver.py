@@ -0,0 +1,187 @@
+"""Resolve journalist and source names to Journalist rows, creating them as needed.
+
+Scrapers, ClaimCreator and the claim API all attribute claims by name, and
+the same few publications and reporters come up on almost every claim.
+The resolver keeps recently used journalists in a per-process LRU cache.
+resolve_many() checks the cached ones with a single primary-key query,
+which drops any another process has since renamed or deleted. It looks up
+the other names with one IN query, then creates the missing ones with one
+bulk_create (ON CONFLICT DO NOTHING) and re-reads them.
+
+Creation is race-safe. When two scrapers create the same name, one insert
+is ignored and both read back the same row. When a slug is taken by a
+different name, the next candidate slug is tried.
+
+Cached rows are also dropped straight away when their journalist is saved
+or deleted in this process (see signals).
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.text import slugify
+
+from apps.claims.models import Journalist
+from apps.claims.services.response_cache import bump_data_version
+
+logger = logging.getLogger(__name__)
+
+# Map journalist names to known Twitter handles
+KNOWN_JOURNALISTS = {
+    'Fabrizio Romano': {'twitter': '@FabrizioRomano'},
+    'David Ornstein': {'twitter': '@David_Ornstein'},
+    'Florian Plettenberg': {'twitter': '@Plettigoal'},
+    'Matteo Moretto': {'twitter': '@MatteMoretto'},
+    'Ben Jacobs': {'twitter': '@JacobsBen'},
+}
+
+# Insert attempts for new journalists; each slug lost to a concurrent writer costs one
+_MAX_CREATE_ROUNDS = 5
+
+
+def _slug_candidates(name: str):
+    """Slugs to try for a new journalist, in order."""
+    base = slugify(name) or 'journalist'
+    yield base
+    yield slugify(f"{name}-source") or f'{base}-source'
+    n = 2
+    while True:
+        yield f'{base}-{n}'
+        n += 1
+
+
+class JournalistResolver:
+    """Name -> Journalist lookups with an in-process LRU cache."""
+
+    _lock = threading.Lock()
+    _current = None
+
+    def __init__(self, max_size: int | None = None):
+        self.max_size = max_size or settings.JOURNALIST_CACHE_SIZE
+        self._cache: OrderedDict[str, Journalist] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    @classmethod
+    def current(cls):
+        """The resolver shared by this process."""
+        with cls._lock:
+            if cls._current is None:
+                cls._current = cls()
+            return cls._current
+
+    def resolve(self, name: str, publication: str = '') -> Journalist:
+        """The journalist with this exact name, created if missing."""
+        return self.resolve_many({name: publication})[name]
+
+    def resolve_many(self, names) -> dict[str, Journalist]:
+        """
+        Resolve many names at once.
+
+        Args:
+            names: Journalist names, or a mapping of name -> publication.
+                The publication is recorded on journalists created here.
+                Without one, the name itself is used, as for sources named
+                after their publication.
+
+        Returns a mapping of name -> Journalist.
+        """
+        if not isinstance(names, Mapping):
+            names = dict.fromkeys(names, '')
+
+        found = {}
+        with self._cache_lock:
+            for name in names:
+                journalist = self._cache.get(name)
+                if journalist is not None:
+                    self._cache.move_to_end(name)
+                    found[name] = journalist
+
+        if found:
+            # Another process may have renamed or deleted a cached journalist;
+            # handing it out would fail on the claim's foreign key
+            current = set(
+                Journalist.objects.filter(pk__in=[j.pk for j in found.values()]).values_list('pk', 'name')
+            )
+            for name, journalist in list(found.items()):
+                if (journalist.pk, name) not in current:
+                    del found[name]
+                    self.forget(journalist)
+
+        missing = [name for name in names if name not in found]
+        if missing:
+            fetched = {j.name: j for j in Journalist.objects.filter(name__in=missing)}
+            to_create = {name: names[name] for name in missing if name not in fetched}
+            if to_create:
+                fetched.update(self._create(to_create))
+            found.update(fetched)
+            self._remember(fetched.values())
+
+        return found
+
+    def forget(self, journalist: Journalist) -> None:
+        """Drop a journalist from the cache (it was changed or deleted)."""
+        with self._cache_lock:
+            for name in [name for name, cached in self._cache.items() if cached.pk == journalist.pk]:
+                del self._cache[name]
+
+    def clear(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _remember(self, journalists) -> None:
+        with self._cache_lock:
+            for journalist in journalists:
+                self._cache[journalist.name] = journalist
+                self._cache.move_to_end(journalist.name)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def _create(self, publications: dict[str, str]) -> dict[str, Journalist]:
+        """Create the named journalists; returns them by name."""
+        created = {}
+        candidates = {name: _slug_candidates(name) for name in publications}
+        slugs = {name: next(candidates[name]) for name in publications}
+        for _ in range(_MAX_CREATE_ROUNDS):
+            # Move every slug taken by another journalist (or by another
+            # name in this batch) on to its next candidate
+            while True:
+                taken = set(Journalist.objects.filter(slug__in=slugs.values()).values_list('slug', flat=True))
+                claimed = set()
+                moved = False
+                for name in slugs:
+                    while slugs[name] in taken or slugs[name] in claimed:
+                        slugs[name] = next(candidates[name])
+                        moved = True
+                    claimed.add(slugs[name])
+                if not moved:
+                    break
+
+            with transaction.atomic():
+                Journalist.objects.bulk_create(
+                    [
+                        Journalist(
+                            name=name,
+                            slug=slugs[name],
+                            publications=[publications[name] or name],
+                            twitter_handle=KNOWN_JOURNALISTS.get(name, {}).get('twitter', ''),
+                        )
+                        for name in slugs
+                    ],
+                    ignore_conflicts=True,
+                )
+            # Rows inserted by a concurrent writer are read back as well
+            for journalist in Journalist.objects.filter(name__in=list(slugs)):
+                created[journalist.name] = journalist
+                del slugs[journalist.name]
+            if not slugs:
+                break
+        else:
+            raise RuntimeError(f"Could not create journalists: {', '.join(slugs)}")
+
+        logger.info("Resolved %d new journalist name(s): %s", len(created), ', '.join(created))
+        bump_data_version()
+        return created
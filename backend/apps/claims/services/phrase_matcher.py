@@ -0,0 +1,104 @@
+"""Multi-phrase matching in one regex pass.
+
+Checking a text for hundreds of phrases with `phrase in text` scans the
+text once per phrase. PhraseMatcher compiles every phrase into a single
+regex shaped like a trie: phrases sharing a prefix share its branch
+("deal agreed", "deal done" -> "deal (?:agreed|done)"), so each text
+position is tested against a handful of first characters rather than
+every phrase.
+
+At each position the trie regex reports the longest phrase starting there.
+Any shorter phrase starting at the same position is a prefix of it, so
+every phrase in the text is either reported or a substring of a reported
+phrase. Each phrase's labels therefore include the labels of the phrases
+it contains, and a scan reports exactly the labels whose phrases occur in
+the text, the same as testing every phrase with `in`.
+"""
+
+import re
+from collections import defaultdict
+
+_END = ''  # trie key marking the end of a phrase
+
+
+def trie_regex(phrases) -> str:
+    """
+    A regex source matching any of the phrases, as literals.
+
+    Where one phrase is a prefix of another the longer one is preferred.
+    """
+    trie = {}
+    for phrase in phrases:
+        if not phrase:
+            continue
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[_END] = {}
+    return _node_regex(trie)
+
+
+def _node_regex(node) -> str:
+    branches = [re.escape(char) + _node_regex(child) for char, child in sorted(node.items()) if char != _END]
+    if not branches:
+        return ''
+    if len(branches) == 1 and _END not in node:
+        return branches[0]
+    group = f"(?:{'|'.join(branches)})"
+    # A phrase ends here; the optional group is greedy, so longer phrases win
+    return group + '?' if _END in node else group
+
+
+def phrase_pattern(phrases, word_boundaries=False, flags=0) -> re.Pattern:
+    """
+    Compile phrases into one trie-shaped pattern for search().
+
+    With word_boundaries, a phrase only matches as whole words, like
+    r'\\b(?:a|b|c)\\b'.
+    """
+    source = trie_regex(sorted(set(phrases)))
+    if word_boundaries:
+        source = rf'\b(?:{source})\b'
+    return re.compile(source, flags)
+
+
+class PhraseMatcher:
+    """
+    Finds which labels' phrases occur in a text, in one pass.
+
+    Usage:
+        matcher = PhraseMatcher([('here we go', 'tier_1'), ('in talks', 'tier_3')])
+        matcher.labels('... here we go! ...')  # -> frozenset({'tier_1'})
+    """
+
+    def __init__(self, labelled_phrases):
+        """
+        Args:
+            labelled_phrases: Iterable of (phrase, label) pairs. Phrases are
+                matched case-sensitively, so lowercase both them and the text.
+        """
+        own = defaultdict(set)
+        for phrase, label in labelled_phrases:
+            if phrase:
+                own[phrase].add(label)
+
+        # A reported phrase stands for every phrase it contains
+        self._labels = {
+            phrase: frozenset().union(*(labels for other, labels in own.items() if other in phrase))
+            for phrase in own
+        }
+        self._pattern = re.compile(trie_regex(sorted(own)))
+
+    def phrases(self, text: str) -> set[str]:
+        """The longest phrase starting at each position where one does."""
+        found = set()
+        search = self._pattern.search
+        match = search(text)
+        while match:
+            found.add(match.group())
+            match = search(text, match.start() + 1)
+        return found
+
+    def labels(self, text: str) -> frozenset:
+        """Every label with at least one phrase occurring in the text."""
+        return frozenset().union(*(self._labels[phrase] for phrase in self.phrases(text)))
@@ -0,0 +1,133 @@
+"""Resolve free-text player names on claims to canonical ReferencePlayer rows.
+
+Claims store the player as scraped text. A name resolves to a
+ReferencePlayer id when exactly one reference player (managers excluded)
+has the same name, compared case-, accent- and punctuation-insensitively,
+so "Kylian Mbappe" and "Kylian Mbappé" resolve alike. Shared names
+("Danilo") are ambiguous and do not resolve.
+
+The result is stored on Claim.reference_player, so story grouping,
+validation and timelines can compare integer keys. Names that do not
+resolve keep a NULL key, and callers fall back to fuzzy name matching
+for them (see validator.same_player).
+"""
+
+import logging
+import re
+import threading
+import unicodedata
+
+from django.db.models import Count, Max
+from django.utils import timezone
+
+from apps.claims.models import Claim, ReferencePlayer
+
+logger = logging.getLogger(__name__)
+
+_NON_WORD_RE = re.compile(r'[^a-z0-9]+')
+
+
+def player_name_key(name: str) -> str:
+    """Reduce a player name to its comparison key."""
+    text = unicodedata.normalize('NFKD', name or '').encode('ascii', 'ignore').decode().lower()
+    return _NON_WORD_RE.sub(' ', text).strip()
+
+
+class PlayerResolver:
+    """Name -> ReferencePlayer id lookups over an in-memory key index."""
+
+    _lock = threading.Lock()
+    _current = None
+    _fingerprint = None
+
+    def __init__(self, players):
+        """
+        Args:
+            players: Iterable of (id, name) pairs
+        """
+        self._by_key = {}
+        ambiguous = set()
+        for player_id, name in players:
+            key = player_name_key(name)
+            if not key:
+                continue
+            if key in self._by_key and self._by_key[key] != player_id:
+                ambiguous.add(key)
+            self._by_key.setdefault(key, player_id)
+
+        # Two reference players with the same name cannot be told apart
+        for key in ambiguous:
+            del self._by_key[key]
+
+    @classmethod
+    def current(cls):
+        """The shared resolver, rebuilt when the reference players change."""
+        agg = ReferencePlayer.objects.aggregate(count=Count('id'), latest=Max('updated_at'))
+        fingerprint = (agg['count'], agg['latest'])
+        with cls._lock:
+            if cls._current is None or cls._fingerprint != fingerprint:
+                cls._current = cls(
+                    ReferencePlayer.objects.filter(is_manager=False).values_list('id', 'name')
+                )
+                cls._fingerprint = fingerprint
+            return cls._current
+
+    def resolve(self, name: str) -> int | None:
+        """The ReferencePlayer id for one player name, or None."""
+        return self._by_key.get(player_name_key(name))
+
+
+def sync_claim_players(claims, resolver=None) -> list[int]:
+    """
+    Bring the reference_player of the given claims in line with their
+    player_name. Only claims whose key changes are written, in one query.
+
+    Returns the ids of the claims that changed.
+    """
+    claims = list(claims)
+    if not claims:
+        return []
+    resolver = resolver or PlayerResolver.current()
+
+    now = timezone.now()
+    changed = []
+    for claim in claims:
+        player_id = resolver.resolve(claim.player_name)
+        if claim.reference_player_id != player_id:
+            claim.reference_player_id = player_id
+            claim.updated_at = now
+            changed.append(claim)
+
+    Claim.objects.bulk_update(changed, ['reference_player', 'updated_at'])
+    return [claim.pk for claim in changed]
+
+
+def backfill(batch_size=2000):
+    """
+    Re-resolve every claim's player, batch by batch.
+
+    Returns (claims, changed) counts.
+    """
+    resolver = PlayerResolver.current()
+    totals = [0, 0]
+    batch = []
+
+    def flush():
+        totals[0] += len(batch)
+        totals[1] += len(sync_claim_players(batch, resolver))
+        batch.clear()
+
+    for claim in (
+        Claim.objects
+        .only('id', 'player_name', 'reference_player_id')
+        .order_by('id')
+        .iterator(chunk_size=batch_size)
+    ):
+        batch.append(claim)
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+
+    logger.info("Re-resolved players for %d claims (%d changed)", *totals)
+    return tuple(totals)
@@ -0,0 +1,229 @@
+"""Surname -> full-name index of reference players, shared through a file.
+
+The gossip scraper falls back to this index when its patterns find no
+player: each capitalised word in the text is looked up as a surname, and
+the full names it maps to are checked against the text.
+
+At 100k reference players, building the index as a dict costs every
+worker and management command a scan of the players table at start-up
+and a private copy in memory. So import_reference_data writes it once to
+a compact binary file (settings.REFERENCE_NAME_INDEX_PATH). Every process
+maps that file read-only, so the pages are shared through the OS page
+cache, and a lookup is a binary search over the sorted surnames.
+
+File layout (uint32 values in native byte order):
+
+    header      magic, format, byte order, key count, name count,
+                player count, latest player update (microseconds)
+    key_offsets n_keys + 1 offsets of each surname in the key blob
+    name_starts n_keys + 1 index of each surname's first name
+    name_offsets n_names + 1 offsets of each name in the name blob
+    key blob    UTF-8 surnames, sorted bytewise
+    name blob   UTF-8 full names, grouped by surname
+
+The file is replaced atomically. Its stamp is the reference players'
+count and latest updated_at when it was written. Processes may not share
+a filesystem (each Heroku dyno has its own), so current() compares the
+stamp with the database, at most every _RECHECK_SECONDS, and rewrites
+a stale file. A re-import anywhere therefore reaches every process.
+"""
+
+import logging
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from array import array
+from datetime import datetime, timedelta, timezone
+
+from django.conf import settings
+from django.db.models import Count, Max
+
+from apps.claims.models import ReferencePlayer
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b'VRNI'
+_FORMAT = 2
+_BYTE_ORDER = {'little': 1, 'big': 2}[sys.byteorder]
+# magic, format, byte order, n_keys, n_names, player count, latest update
+_HEADER = struct.Struct('=4sHHIIQQ')
+
+# How long current() trusts the open index before checking the database
+_RECHECK_SECONDS = 60
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Surnames shorter than this match too many unrelated words
+MIN_SURNAME_LENGTH = 3
+
+
+def index_path() -> str:
+    return str(settings.REFERENCE_NAME_INDEX_PATH)
+
+
+def reference_fingerprint() -> tuple[int, int]:
+    """(count, latest updated_at in microseconds) of the reference players."""
+    agg = ReferencePlayer.objects.aggregate(count=Count('id'), latest=Max('updated_at'))
+    latest = agg['latest']
+    return agg['count'], (latest - _EPOCH) // timedelta(microseconds=1) if latest else 0
+
+
+def build_entries() -> dict[str, list[str]]:
+    """Lowercased surname -> full names of the non-manager reference players."""
+    index: dict[str, list[str]] = {}
+    for name in ReferencePlayer.objects.filter(is_manager=False).values_list('name', flat=True):
+        parts = name.split()
+        if len(parts) < 2:
+            continue
+        last = parts[-1].lower()
+        if len(last) < MIN_SURNAME_LENGTH:
+            continue
+        index.setdefault(last, []).append(name)
+    return index
+
+
+def write_index(path: str | None = None) -> int:
+    """
+    Write the index file from the reference players.
+
+    Returns the number of surnames written.
+    """
+    path = path or index_path()
+    # Read first: players changed during the build leave the file stale
+    fingerprint = reference_fingerprint()
+    entries = build_entries()
+    keys = sorted(entries, key=lambda key: key.encode())
+
+    key_offsets, name_starts, name_offsets = array('I', [0]), array('I', [0]), array('I', [0])
+    key_blob, name_blob = bytearray(), bytearray()
+    for key in keys:
+        key_blob += key.encode()
+        key_offsets.append(len(key_blob))
+        for name in entries[key]:
+            name_blob += name.encode()
+            name_offsets.append(len(name_blob))
+        name_starts.append(len(name_offsets) - 1)
+
+    header = _HEADER.pack(_MAGIC, _FORMAT, _BYTE_ORDER, len(keys), len(name_offsets) - 1, *fingerprint)
+
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.reference_names.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for part in (header, key_offsets, name_starts, name_offsets, key_blob, name_blob):
+                f.write(part)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    logger.info("Wrote reference name index: %d surnames, %d names", len(keys), len(name_offsets) - 1)
+    return len(keys)
+
+
+class ReferenceNameIndex:
+    """Read-only surname lookups over a mapped index file."""
+
+    _lock = threading.Lock()
+    _current = None
+    _file_id = None
+    _checked_at = None
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < _HEADER.size:
+            raise ValueError(f"Truncated reference name index: {path}")
+        magic, fmt, byte_order, n_keys, n_names, *stamp = _HEADER.unpack_from(self._map)
+        self.stamp = tuple(stamp)
+        if magic != _MAGIC or fmt != _FORMAT or byte_order != _BYTE_ORDER:
+            raise ValueError(f"Not a reference name index in this format: {path}")
+
+        view = memoryview(self._map)
+        pos = _HEADER.size
+
+        def uint32s(count):
+            nonlocal pos
+            values = view[pos:pos + 4 * count].cast('I')
+            pos += 4 * count
+            return values
+
+        self._key_offsets = uint32s(n_keys + 1)
+        self._name_starts = uint32s(n_keys + 1)
+        self._name_offsets = uint32s(n_names + 1)
+        self._key_base = pos
+        self._name_base = pos + self._key_offsets[n_keys]
+        self._n_keys = n_keys
+
+    @classmethod
+    def current(cls):
+        """
+        The shared index, rewritten when its stamp does not match the
+        reference players in the database.
+
+        The database is checked at most every _RECHECK_SECONDS. A missing
+        or unreadable file is rewritten too.
+        """
+        path = index_path()
+        with cls._lock:
+            now = time.monotonic()
+            if cls._current is not None and now - cls._checked_at < _RECHECK_SECONDS:
+                return cls._current
+
+            index = cls._open(path)
+            if index is None or index.stamp != reference_fingerprint():
+                write_index(path)
+                index = cls._open(path)
+            cls._current = index
+            cls._checked_at = now
+            return index
+
+    @classmethod
+    def _open(cls, path):
+        """The index in the file (the open one if unchanged), or None if missing or unreadable."""
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        file_id = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if cls._current is not None and cls._file_id == file_id:
+            return cls._current
+        try:
+            index = cls(path)
+        except ValueError:
+            logger.warning("Rewriting unreadable reference name index %s", path)
+            return None
+        cls._file_id = file_id
+        return index
+
+    def __len__(self):
+        return self._n_keys
+
+    def _key(self, i):
+        start = self._key_base + self._key_offsets[i]
+        return self._map[start:self._key_base + self._key_offsets[i + 1]]
+
+    def get(self, surname: str, default=()):
+        """Full names of the players with this lowercased surname."""
+        target = surname.encode()
+        lo, hi = 0, self._n_keys
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == self._n_keys or self._key(lo) != target:
+            return default
+
+        names = []
+        for j in range(self._name_starts[lo], self._name_starts[lo + 1]):
+            start = self._name_base + self._name_offsets[j]
+            names.append(self._map[start:self._name_base + self._name_offsets[j + 1]].decode())
+        return names
@@ -0,0 +1,128 @@
+"""Versioned response cache for aggregate endpoints.
+
+Every cached response is keyed by a global claims data version held in
+the DataVersion table. Claim, journalist, score and transfer writes bump
+the version (after the transaction commits), so every cached entry is
+invalidated exactly when the data changes. Old entries are never read
+again and age out via RESPONSE_CACHE_TIMEOUT.
+
+A request reads the version once (see current_data_version), so a cache
+hit behind conditional_get costs that single unique-index lookup.
+
+The version lives in the database, not the cache, because the web and
+worker processes may not share a cache: on Heroku each dyno has its own
+filesystem. The bump is a single UPDATE, so it is atomic across
+processes, and any cache backend is safe for the responses themselves.
+"""
+
+import functools
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from rest_framework.response import Response
+
+from apps.claims.models import DataVersion
+
+DATA_VERSION_NAME = 'claims'
+
+
+def _initial_version():
+    # Time-based, so a recreated row starts above any earlier value
+    return int(time.time() * 1000)
+
+
+def _read_data_version():
+    row = (
+        DataVersion.objects.filter(name=DATA_VERSION_NAME)
+        .values_list('version', 'updated_at')
+        .first()
+    )
+    if row is None:
+        DataVersion.objects.bulk_create(
+            [DataVersion(name=DATA_VERSION_NAME, version=_initial_version())],
+            ignore_conflicts=True,
+        )
+        row = DataVersion.objects.values_list('version', 'updated_at').get(name=DATA_VERSION_NAME)
+    return row
+
+
+def current_data_version(request=None):
+    """
+    (version, updated_at) of the claims data.
+
+    With a request, the row is read once and reused by every decorator
+    that handles the same request.
+    """
+    if request is None:
+        return _read_data_version()
+    state = getattr(request, '_claims_data_version', None)
+    if state is None:
+        state = request._claims_data_version = _read_data_version()
+    return state
+
+
+def get_data_version(request=None) -> int:
+    """Current claims data version."""
+    return current_data_version(request)[0]
+
+
+def _bump():
+    updated = DataVersion.objects.filter(name=DATA_VERSION_NAME).update(
+        version=F('version') + 1,
+        updated_at=timezone.now(),
+    )
+    if not updated:
+        _read_data_version()
+
+
+def bump_data_version() -> None:
+    """Invalidate all cached responses once the current transaction commits."""
+    transaction.on_commit(_bump)
+
+
+def cached_response(prefix, timeout=None):
+    """
+    Cache a GET view's 200 response data under the current data version.
+
+    The key covers the prefix, the data version and the sorted query
+    parameters, so each filter combination is cached separately.
+
+    Usage:
+        @action(detail=False, methods=['get'])
+        @cached_response('leaderboard')
+        def leaderboard(self, request):
+            ...
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(self, request, *args, **kwargs):
+            if request.method != 'GET':
+                return view(self, request, *args, **kwargs)
+
+            params = '&'.join(
+                f'{key}={value}'
+                for key in sorted(request.query_params)
+                for value in request.query_params.getlist(key)
+            )
+            digest = hashlib.md5(params.encode()).hexdigest()
+            key = f'claims:response:{get_data_version(request)}:{prefix}:{digest}'
+
+            data = cache.get(key)
+            if data is not None:
+                return Response(data)
+
+            response = view(self, request, *args, **kwargs)
+            if response.status_code == 200:
+                cache.set(
+                    key,
+                    response.data,
+                    timeout if timeout is not None else settings.RESPONSE_CACHE_TIMEOUT,
+                )
+            return response
+        return wrapper
+    return decorator
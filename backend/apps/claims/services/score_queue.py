@@ -0,0 +1,101 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.claims.models import DirtyJournalist, Journalist
+from apps.claims.services.scoring import ScoringService
+
+logger = logging.getLogger(__name__)
+
+
+class ScoreQueue:
+    """
+    DB-backed queue of journalists whose scores need recomputing.
+
+    Marking a journalist that is already queued only bumps last_marked_at,
+    so a burst of claim changes collapses into one entry. An entry is due
+    once it has been quiet for SCORE_QUEUE_DEBOUNCE_SECONDS, or has waited
+    SCORE_QUEUE_MAX_DELAY_SECONDS in total so a steady stream of changes
+    cannot starve it.
+    """
+
+    @staticmethod
+    def mark(journalist_ids, record_history=False):
+        """
+        Queue journalists for rescoring.
+
+        Args:
+            journalist_ids: Iterable of journalist ids
+            record_history: Record a ScoreHistory entry when they are rescored
+                (set when a validated claim changed, not for rank-only changes)
+        """
+        journalist_ids = {jid for jid in journalist_ids if jid}
+        if not journalist_ids:
+            return
+
+        now = timezone.now()
+        # An existing entry keeps its first_marked_at, and keeps record_history
+        # if set, since rank-only marks do not overwrite it.
+        update_fields = ['last_marked_at', 'record_history'] if record_history else ['last_marked_at']
+        DirtyJournalist.objects.bulk_create(
+            [
+                DirtyJournalist(
+                    journalist_id=jid,
+                    first_marked_at=now,
+                    last_marked_at=now,
+                    record_history=record_history,
+                )
+                for jid in sorted(journalist_ids)
+            ],
+            update_conflicts=True,
+            unique_fields=['journalist'],
+            update_fields=update_fields,
+        )
+
+    @staticmethod
+    def due(now=None, debounce=None, max_delay=None):
+        """Queue entries ready to be processed."""
+        now = now or timezone.now()
+        if debounce is None:
+            debounce = settings.SCORE_QUEUE_DEBOUNCE_SECONDS
+        if max_delay is None:
+            max_delay = settings.SCORE_QUEUE_MAX_DELAY_SECONDS
+
+        return DirtyJournalist.objects.filter(
+            Q(last_marked_at__lte=now - timedelta(seconds=debounce))
+            | Q(first_marked_at__lte=now - timedelta(seconds=max_delay))
+        )
+
+    @staticmethod
+    def process(debounce=None, max_delay=None):
+        """
+        Rescore every due journalist once and remove them from the queue.
+
+        Journalists with record_history get a full update with a ScoreHistory
+        entry; the rest only need their speed scores refreshed from the index.
+        Entries marked again while the batch runs stay queued.
+
+        Returns the number of journalists rescored.
+        """
+        now = timezone.now()
+        entries = list(ScoreQueue.due(now, debounce, max_delay).values_list('journalist_id', 'record_history'))
+        if not entries:
+            return 0
+
+        full = [jid for jid, record_history in entries if record_history]
+        speed_only = [jid for jid, record_history in entries if not record_history]
+
+        for journalist in Journalist.objects.filter(id__in=full):
+            ScoringService.update_journalist_scores(journalist)
+        ScoringService.refresh_speed_scores(speed_only)
+
+        DirtyJournalist.objects.filter(
+            journalist_id__in=[jid for jid, _ in entries],
+            last_marked_at__lte=now,
+        ).delete()
+
+        logger.info("Rescored %d queued journalists (%d with history)", len(entries), len(full))
+        return len(entries)
@@ -1,9 +1,10 @@
 from collections import defaultdict
 from decimal import Decimal
 
-from django.db.models import Q
+from django.db.models import Avg, Count
+from django.utils import timezone
 
-from apps.claims.services.validator import players_match, clubs_match
+from apps.claims.services.response_cache import bump_data_version
 
 
 class ScoringService:
@@ -41,196 +42,108 @@ class ScoringService:
 
         Final score = average earliness * 100
 
+        Ranks are read from the persisted story index (see StoryIndex).
+
         Returns Decimal 0.00-100.00
         """
-        story_earliness, _ = ScoringService._compute_story_earliness()
-
-        journalist_id = journalist.id
-        if journalist_id not in story_earliness:
-            return Decimal('0.00')
+        from apps.claims.models import StoryReport
 
-        scores = story_earliness[journalist_id]
-        if not scores:
+        avg = (
+            StoryReport.objects
+            .filter(journalist=journalist)
+            .aggregate(avg=Avg('earliness'))['avg']
+        )
+        if avg is None:
             return Decimal('0.00')
 
-        avg = sum(scores) / len(scores)
         return Decimal(avg * 100).quantize(Decimal('0.01'))
 
     @staticmethod
-    def _compute_story_earliness():
+    def refresh_speed_scores(journalist_ids):
         """
-        Compute earliness scores for ALL journalists across all confirmed stories.
-
-        Returns dict: journalist_id -> list of earliness floats (one per story)
+        Re-read speed scores from the story index for the given journalists.
 
-        This is cached at the class level during a single scoring run to avoid
-        recomputing for every journalist.
+        Used when a claim changes another journalist's rank within a story.
+        Does not record score history.
         """
-        from apps.claims.models import Claim
+        from apps.claims.models import Journalist, StoryReport
 
-        # 1. Find all confirmed true stories (unique player+to_club combos)
-        confirmed = (
-            Claim.objects
-            .filter(validation_status='confirmed_true')
-            .exclude(player_name='')
-            .values_list('player_name', 'to_club')
-            .distinct()
-        )
+        if not journalist_ids:
+            return 0
 
-        # Build unique stories using fuzzy matching
-        stories = []  # list of (player_name, to_club) canonical pairs
-        for player, club in confirmed:
-            if not player:
-                continue
-            # Check if this matches an existing story
-            found = False
-            for sp, sc in stories:
-                if players_match(player, sp) and (clubs_match(club, sc) if club and sc else True):
-                    found = True
-                    break
-            if not found:
-                stories.append((player, club or ''))
-
-        # 2. For each story, find all claims about it and rank by date
-        all_claims = (
-            Claim.objects
-            .exclude(player_name='')
-            .select_related('journalist')
-            .order_by('claim_date')
+        averages = dict(
+            StoryReport.objects
+            .filter(journalist_id__in=journalist_ids)
+            .values('journalist_id')
+            .annotate(avg=Avg('earliness'))
+            .values_list('journalist_id', 'avg')
         )
 
-        # Index claims by player last name for faster lookup
-        claims_by_lastname = defaultdict(list)
-        for c in all_claims:
-            last = c.player_name.strip().split()[-1].lower()
-            claims_by_lastname[last].append(c)
-
-        journalist_earliness = defaultdict(list)  # journalist_id -> [float, ...]
-        journalist_positions = defaultdict(list)  # journalist_id -> [int, ...] (1-based ranks)
-
-        for story_player, story_club in stories:
-            last = story_player.strip().split()[-1].lower()
-            candidates = claims_by_lastname.get(last, [])
-
-            # Match claims to this story
-            story_claims = []
-            for c in candidates:
-                if players_match(c.player_name, story_player):
-                    if story_club and c.to_club:
-                        if clubs_match(c.to_club, story_club):
-                            story_claims.append(c)
-                    elif not story_club:
-                        # No club to match on, just player
-                        story_claims.append(c)
-
-            if not story_claims:
-                continue
-
-            # Sort by date and deduplicate per journalist (keep earliest)
-            story_claims.sort(key=lambda c: c.claim_date)
-            journalist_order = []  # ordered list of journalist_ids (first appearance)
-            seen_journalists = set()
-            for c in story_claims:
-                if c.journalist_id not in seen_journalists:
-                    seen_journalists.add(c.journalist_id)
-                    journalist_order.append(c.journalist_id)
-
-            n = len(journalist_order)
-            if n < 2:
-                # Skip stories with only one reporter — speed is only
-                # meaningful when multiple journalists cover the same story
-                continue
-
-            # Assign earliness: first = 1.0, last = 0.0
-            for rank_idx, jid in enumerate(journalist_order):
-                earliness = (n - 1 - rank_idx) / (n - 1)
-                journalist_earliness[jid].append(earliness)
-                journalist_positions[jid].append(rank_idx + 1)  # 1-based
-
-        return journalist_earliness, journalist_positions
+        now = timezone.now()
+        journalists = list(Journalist.objects.filter(id__in=journalist_ids))
+        for journalist in journalists:
+            avg = averages.get(journalist.id)
+            journalist.speed_score = (
+                Decimal(avg * 100).quantize(Decimal('0.01')) if avg is not None else Decimal('0.00')
+            )
+            journalist.updated_at = now
+        Journalist.objects.bulk_update(journalists, ['speed_score', 'updated_at'])
+        bump_data_version()
+        return len(journalists)
 
     @staticmethod
-    def _compute_publication_earliness():
+    def update_scores(journalist_ids):
         """
-        Compute earliness scores for ALL publications across all confirmed stories.
+        Recompute both scores for the given journalists with grouped queries.
 
-        Same approach as journalist earliness, but groups by publication name
-        instead of journalist_id.
+        Speed is read from the story index, as in refresh_speed_scores().
+        Only journalists whose scores changed are written, in one bulk_update.
+        Does not record score history.
 
-        Returns dict: publication_name -> list of earliness floats (one per story)
+        Returns the number of journalists scored.
         """
-        from apps.claims.models import Claim
+        from apps.claims.models import Claim, Journalist, StoryReport
 
-        confirmed = (
-            Claim.objects
-            .filter(validation_status='confirmed_true')
-            .exclude(player_name='')
-            .values_list('player_name', 'to_club')
-            .distinct()
-        )
+        journalist_ids = {jid for jid in journalist_ids if jid}
+        if not journalist_ids:
+            return 0
 
-        stories = []
-        for player, club in confirmed:
-            if not player:
-                continue
-            found = False
-            for sp, sc in stories:
-                if players_match(player, sp) and (clubs_match(club, sc) if club and sc else True):
-                    found = True
-                    break
-            if not found:
-                stories.append((player, club or ''))
-
-        all_claims = (
+        true_counts = dict(
             Claim.objects
-            .exclude(player_name='')
-            .exclude(publication='')
-            .order_by('claim_date')
+            .filter(journalist_id__in=journalist_ids, validation_status=Claim.STATUS_CONFIRMED_TRUE)
+            .values('journalist_id')
+            .annotate(count=Count('id'))
+            .values_list('journalist_id', 'count')
+        )
+        averages = dict(
+            StoryReport.objects
+            .filter(journalist_id__in=journalist_ids)
+            .values('journalist_id')
+            .annotate(avg=Avg('earliness'))
+            .values_list('journalist_id', 'avg')
         )
 
-        claims_by_lastname = defaultdict(list)
-        for c in all_claims:
-            last = c.player_name.strip().split()[-1].lower()
-            claims_by_lastname[last].append(c)
-
-        publication_earliness = defaultdict(list)
-        publication_positions = defaultdict(list)
-
-        for story_player, story_club in stories:
-            last = story_player.strip().split()[-1].lower()
-            candidates = claims_by_lastname.get(last, [])
-
-            story_claims = []
-            for c in candidates:
-                if players_match(c.player_name, story_player):
-                    if story_club and c.to_club:
-                        if clubs_match(c.to_club, story_club):
-                            story_claims.append(c)
-                    elif not story_club:
-                        story_claims.append(c)
-
-            if not story_claims:
-                continue
-
-            story_claims.sort(key=lambda c: c.claim_date)
-            pub_order = []
-            seen_pubs = set()
-            for c in story_claims:
-                pub = c.publication
-                if pub not in seen_pubs:
-                    seen_pubs.add(pub)
-                    pub_order.append(pub)
-
-            n = len(pub_order)
-            if n < 2:
-                continue
-
-            for rank_idx, pub in enumerate(pub_order):
-                earliness = (n - 1 - rank_idx) / (n - 1)
-                publication_earliness[pub].append(earliness)
-                publication_positions[pub].append(rank_idx + 1)
-
-        return publication_earliness, publication_positions
+        now = timezone.now()
+        journalists = list(
+            Journalist.objects
+            .filter(id__in=journalist_ids)
+            .only('id', 'truthfulness_score', 'speed_score', 'updated_at')
+        )
+        changed = []
+        for journalist in journalists:
+            truthfulness = Decimal(true_counts.get(journalist.id, 0))
+            avg = averages.get(journalist.id)
+            speed = Decimal(avg * 100).quantize(Decimal('0.01')) if avg is not None else Decimal('0.00')
+            if journalist.truthfulness_score != truthfulness or journalist.speed_score != speed:
+                journalist.truthfulness_score = truthfulness
+                journalist.speed_score = speed
+                journalist.updated_at = now
+                changed.append(journalist)
+
+        Journalist.objects.bulk_update(changed, ['truthfulness_score', 'speed_score', 'updated_at'])
+        if changed:
+            bump_data_version()
+        return len(journalists)
 
     @staticmethod
     def update_journalist_scores(journalist):
@@ -239,54 +152,64 @@ class ScoringService:
         """
         journalist.truthfulness_score = ScoringService.calculate_truthfulness_score(journalist)
         journalist.speed_score = ScoringService.calculate_speed_score(journalist)
-        journalist.save()
+        journalist.save(update_fields=['truthfulness_score', 'speed_score', 'updated_at'])
 
-        from apps.claims.models import ScoreHistory
+        from apps.claims.models import Journalist, ScoreHistory
 
+        # Counters may have moved since this instance was loaded
+        journalist.refresh_from_db(fields=Journalist.COUNTER_FIELDS)
         ScoreHistory.objects.create(
             journalist=journalist,
             truthfulness_score=journalist.truthfulness_score,
             speed_score=journalist.speed_score,
-            total_claims=journalist.claims.count(),
-            validated_claims=journalist.claims.exclude(validation_status='pending').count(),
-            true_claims=journalist.claims.filter(validation_status='confirmed_true').count(),
-            false_claims=journalist.claims.filter(validation_status='proven_false').count(),
-            original_scoops=journalist.claims.filter(source_type='original').count()
+            total_claims=journalist.total_claims,
+            validated_claims=journalist.validated_claims,
+            true_claims=journalist.true_claims,
+            false_claims=journalist.false_claims,
+            original_scoops=journalist.original_scoops,
         )
 
     @staticmethod
-    def update_all_journalist_scores():
+    def record_score_history(journalist_ids):
         """
-        Batch update scores for all journalists.
-
-        Pre-computes story earliness once, then applies to each journalist.
-        """
-        from apps.claims.models import Journalist
+        Record current scores for many journalists with one bulk insert.
 
-        # Pre-compute earliness for all journalists in one pass
-        story_earliness, _ = ScoringService._compute_story_earliness()
+        Claim counts are read from the journalists' counter columns.
 
-        journalists = Journalist.objects.prefetch_related('claims').all()
-        updated = 0
-
-        for journalist in journalists:
-            truthfulness = ScoringService.calculate_truthfulness_score(journalist)
+        Returns the number of history entries created.
+        """
+        from apps.claims.models import Journalist, ScoreHistory
+
+        if not journalist_ids:
+            return 0
+
+        entries = [
+            ScoreHistory(
+                journalist=journalist,
+                truthfulness_score=journalist.truthfulness_score,
+                speed_score=journalist.speed_score,
+                total_claims=journalist.total_claims,
+                validated_claims=journalist.validated_claims,
+                true_claims=journalist.true_claims,
+                false_claims=journalist.false_claims,
+                original_scoops=journalist.original_scoops,
+            )
+            for journalist in Journalist.objects.filter(id__in=journalist_ids)
+        ]
+        ScoreHistory.objects.bulk_create(entries, batch_size=1000)
+        return len(entries)
 
-            # Use pre-computed earliness for speed
-            jid = journalist.id
-            if jid in story_earliness and story_earliness[jid]:
-                scores = story_earliness[jid]
-                avg = sum(scores) / len(scores)
-                speed = Decimal(avg * 100).quantize(Decimal('0.01'))
-            else:
-                speed = Decimal('0.00')
+    @staticmethod
+    def update_all_journalist_scores():
+        """
+        Batch update scores for all journalists.
 
-            journalist.truthfulness_score = truthfulness
-            journalist.speed_score = speed
-            journalist.save(update_fields=['truthfulness_score', 'speed_score'])
-            updated += 1
+        Claims and story memberships are scored as arrays in one pass and
+        written back with a single bulk_update (see batch_scoring).
+        """
+        from apps.claims.services.batch_scoring import score_all_journalists
 
-        return updated
+        return score_all_journalists()
 
     @staticmethod
     def compute_club_journalist_stats(club_name):
@@ -297,96 +220,38 @@ class ScoringService:
             accuracy, speed, total_claims, validated, true_count, false_count
         }
         """
-        from apps.claims.models import Claim, Journalist
-
-        # Get all claims involving this club
-        club_claims = (
-            Claim.objects
-            .filter(Q(to_club__icontains=club_name) | Q(from_club__icontains=club_name))
-            .select_related('journalist')
+        from apps.claims.models import Claim, Story, StoryReport
+        from apps.claims.services.club_resolver import club_filter
+
+        involves_club = club_filter(club_name.strip())
+
+        # Group this club's claims by journalist
+        journalist_statuses = defaultdict(list)
+        for jid, status in Claim.objects.filter(involves_club).values_list('journalist_id', 'validation_status'):
+            journalist_statuses[jid].append(status)
+
+        # Earliness over the indexed stories confirmed for this club,
+        # counting ALL claims about them (see StoryIndex)
+        club_stories = (
+            Story.claims.through.objects
+            .filter(claim__in=Claim.objects.filter(involves_club, validation_status=Claim.STATUS_CONFIRMED_TRUE))
+            .values('story_id')
         )
-
-        # Group by journalist
-        journalist_claims = defaultdict(list)
-        for claim in club_claims:
-            journalist_claims[claim.journalist_id].append(claim)
-
-        # Compute story earliness filtered to this club's confirmed stories
-        confirmed = (
-            Claim.objects
-            .filter(validation_status='confirmed_true')
-            .filter(Q(to_club__icontains=club_name) | Q(from_club__icontains=club_name))
-            .exclude(player_name='')
-            .values_list('player_name', 'to_club')
-            .distinct()
-        )
-
-        stories = []
-        for player, club in confirmed:
-            if not player:
-                continue
-            found = False
-            for sp, sc in stories:
-                if players_match(player, sp) and (clubs_match(club, sc) if club and sc else True):
-                    found = True
-                    break
-            if not found:
-                stories.append((player, club or ''))
-
-        # For earliness, consider ALL claims about these stories (not just club-filtered)
-        all_claims = (
-            Claim.objects
-            .exclude(player_name='')
-            .select_related('journalist')
-            .order_by('claim_date')
-        )
-
-        claims_by_lastname = defaultdict(list)
-        for c in all_claims:
-            last = c.player_name.strip().split()[-1].lower()
-            claims_by_lastname[last].append(c)
-
         journalist_earliness = defaultdict(list)
-
-        for story_player, story_club in stories:
-            last = story_player.strip().split()[-1].lower()
-            candidates = claims_by_lastname.get(last, [])
-
-            story_claims = []
-            for c in candidates:
-                if players_match(c.player_name, story_player):
-                    if story_club and c.to_club:
-                        if clubs_match(c.to_club, story_club):
-                            story_claims.append(c)
-                    elif not story_club:
-                        story_claims.append(c)
-
-            if not story_claims:
-                continue
-
-            story_claims.sort(key=lambda c: c.claim_date)
-            journalist_order = []
-            seen_journalists = set()
-            for c in story_claims:
-                if c.journalist_id not in seen_journalists:
-                    seen_journalists.add(c.journalist_id)
-                    journalist_order.append(c.journalist_id)
-
-            n = len(journalist_order)
-            if n < 2:
-                continue
-
-            for rank_idx, jid in enumerate(journalist_order):
-                earliness = (n - 1 - rank_idx) / (n - 1)
-                journalist_earliness[jid].append(earliness)
+        for jid, earliness in (
+            StoryReport.objects
+            .filter(story_id__in=club_stories)
+            .values_list('journalist_id', 'earliness')
+        ):
+            journalist_earliness[jid].append(earliness)
 
         # Build results
         results = {}
-        for jid, claims in journalist_claims.items():
-            total = len(claims)
-            validated = sum(1 for c in claims if c.validation_status != 'pending')
-            true_count = sum(1 for c in claims if c.validation_status == 'confirmed_true')
-            false_count = sum(1 for c in claims if c.validation_status == 'proven_false')
+        for jid, statuses in journalist_statuses.items():
+            total = len(statuses)
+            validated = sum(1 for st in statuses if st != 'pending')
+            true_count = sum(1 for st in statuses if st == 'confirmed_true')
+            false_count = sum(1 for st in statuses if st == 'proven_false')
 
             accuracy = round((true_count / total) * 100, 2) if total > 0 else 0
 
@@ -406,18 +271,16 @@ class ScoringService:
 
     @staticmethod
     def get_journalist_stats(journalist):
-        """Get comprehensive statistics for a journalist."""
-        claims = journalist.claims
-
+        """Get comprehensive statistics for a journalist from its counter columns."""
         return {
-            'total_claims': claims.count(),
-            'validated_claims': claims.exclude(validation_status='pending').count(),
-            'pending_claims': claims.filter(validation_status='pending').count(),
-            'true_claims': claims.filter(validation_status='confirmed_true').count(),
-            'false_claims': claims.filter(validation_status='proven_false').count(),
-            'partially_true_claims': claims.filter(validation_status='partially_true').count(),
-            'original_scoops': claims.filter(source_type='original').count(),
-            'first_to_report': claims.filter(source_type='original', is_first_claim=True).count(),
+            'total_claims': journalist.total_claims,
+            'validated_claims': journalist.validated_claims,
+            'pending_claims': journalist.pending_claims,
+            'true_claims': journalist.true_claims,
+            'false_claims': journalist.false_claims,
+            'partially_true_claims': journalist.partially_true_claims,
+            'original_scoops': journalist.original_scoops,
+            'first_to_report': journalist.first_to_report_count,
             'accuracy_rate': journalist.truthfulness_score,
             'speed_rating': journalist.speed_score,
         }
@@ -0,0 +1,250 @@
+"""Indexed, ranked text search for claims, journalists and reference players.
+
+The default DRF SearchFilter compiles to ICONTAINS scans over every search
+field. This module matches against prebuilt indexes instead:
+
+- PostgreSQL: a weighted tsvector GIN expression index per model, ranked
+  with ts_rank, plus pg_trgm GIN indexes on name columns. The trigram
+  indexes catch misspellings the full-text match would miss.
+- SQLite: an FTS5 mirror table per model, kept in sync by triggers and
+  ranked with bm25.
+
+Migration 0018 creates the indexes, mirrors and triggers (the extension
+too). SQLite drops a table's triggers when a migration rebuilds the table,
+so repair_search_triggers() restores them after every migrate. Models or
+databases without an index fall back to the plain ICONTAINS search.
+"""
+
+import functools
+import logging
+import re
+
+from django.apps import apps as django_apps
+from django.db import connection, connections
+from django.db.models import BooleanField, FloatField
+from django.db.models.expressions import RawSQL
+
+logger = logging.getLogger(__name__)
+
+# Model label -> searchable columns by weight (A ranks above B), and the
+# name columns that also get a trigram index on PostgreSQL
+SEARCH_DOCUMENTS = {
+    'claims.Claim': {
+        'weights': {'A': ('player_name', 'to_club', 'from_club'), 'B': ('claim_text',)},
+        'trigram': ('player_name',),
+    },
+    'claims.Journalist': {
+        'weights': {'A': ('name', 'twitter_handle'), 'B': ('publications',)},
+        'trigram': ('name',),
+    },
+    'claims.ReferencePlayer': {
+        'weights': {'A': ('name',), 'B': ('current_club_name',)},
+        'trigram': ('name',),
+    },
+}
+
+# bm25 column weight per tsvector weight class, so both backends rank alike
+FTS_WEIGHTS = {'A': 4.0, 'B': 1.0}
+
+RANK_ANNOTATION = 'search_rank'
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def search_tokens(text):
+    """Split user input into bare word tokens (no query operators)."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def fts_table(model):
+    return f'{model._meta.db_table}_fts'
+
+
+class PostgresSearchBackend:
+    """tsvector full-text match with a pg_trgm fallback for names."""
+
+    def supports(self, model):
+        return model._meta.label in SEARCH_DOCUMENTS
+
+    def document_sql(self, model, qualified=True):
+        """
+        The weighted tsvector expression. Migration 0018 indexes the same
+        expression, so the planner can match them.
+        """
+        document = SEARCH_DOCUMENTS[model._meta.label]
+        column = self._column if qualified else self._bare_column
+        parts = []
+        for weight, fields in document['weights'].items():
+            columns = " || ' ' || ".join(
+                f"coalesce({column(model, field)}::text, '')" for field in fields
+            )
+            parts.append(f"setweight(to_tsvector('simple'::regconfig, {columns}), '{weight}')")
+        return ' || '.join(parts)
+
+    def search(self, queryset, text, tokens):
+        model = queryset.model
+
+        # Every token must match, the last one as a prefix (search-as-you-type)
+        tsquery = ' & '.join(f'{token}:*' if i == len(tokens) - 1 else token for i, token in enumerate(tokens))
+        document = self.document_sql(model)
+        trigram = [self._column(model, field) for field in SEARCH_DOCUMENTS[model._meta.label]['trigram']]
+
+        match_sql = ' OR '.join(
+            [f"({document}) @@ to_tsquery('simple', %s)"]
+            + [f'%s <%% {column}' for column in trigram]
+        )
+        rank_sql = "ts_rank({document}, to_tsquery('simple', %s)) + greatest({similarity})".format(
+            document=document,
+            similarity=', '.join(f'word_similarity(%s, {column})' for column in trigram),
+        )
+        return (
+            queryset
+            .filter(RawSQL(match_sql, [tsquery] + [text] * len(trigram), output_field=BooleanField()))
+            .annotate(**{RANK_ANNOTATION: RawSQL(rank_sql, [tsquery] + [text] * len(trigram), output_field=FloatField())})
+        )
+
+    @staticmethod
+    def _column(model, field):
+        qn = connection.ops.quote_name
+        return f'{qn(model._meta.db_table)}.{qn(model._meta.get_field(field).column)}'
+
+    @staticmethod
+    def _bare_column(model, field):
+        return connection.ops.quote_name(model._meta.get_field(field).column)
+
+
+class SQLiteFTSBackend:
+    """FTS5 mirror tables ranked with bm25."""
+
+    def supports(self, model):
+        return model._meta.label in SEARCH_DOCUMENTS and fts_table(model) in _existing_tables()
+
+    def search(self, queryset, text, tokens):
+        model = queryset.model
+
+        # Quoted tokens cannot be read as FTS5 operators; the last one is a prefix
+        match = ' '.join(f'"{token}"' + ('*' if i == len(tokens) - 1 else '') for i, token in enumerate(tokens))
+
+        qn = connection.ops.quote_name
+        table = qn(fts_table(model))
+        pk = f'{qn(model._meta.db_table)}.{qn(model._meta.pk.column)}'
+        weights = ', '.join(
+            str(FTS_WEIGHTS[weight])
+            for weight, fields in SEARCH_DOCUMENTS[model._meta.label]['weights'].items()
+            for _ in fields
+        )
+
+        # bm25() is lower-is-better; the rowid lookup seeks straight to the row
+        return (
+            queryset
+            .filter(RawSQL(f'{pk} IN (SELECT rowid FROM {table} WHERE {table} MATCH %s)', [match], output_field=BooleanField()))
+            .annotate(**{RANK_ANNOTATION: RawSQL(
+                f'(SELECT -bm25({table}, {weights}) FROM {table} WHERE {table} MATCH %s AND rowid = {pk})',
+                [match],
+                output_field=FloatField(),
+            )})
+        )
+
+
+    def mirror_sql(self, model):
+        """
+        The FTS5 external-content table over the model's table, and the
+        triggers that keep it in sync.
+        """
+        table = model._meta.db_table
+        fts = fts_table(model)
+        columns = [
+            model._meta.get_field(field).column
+            for fields in SEARCH_DOCUMENTS[model._meta.label]['weights'].values()
+            for field in fields
+        ]
+        names = ', '.join(columns)
+        new = ', '.join(f'new.{column}' for column in columns)
+        old = ', '.join(f'old.{column}' for column in columns)
+        pk = model._meta.pk.column
+
+        create_table = (
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({names}, content='{table}', "
+            f"content_rowid='{pk}', tokenize='unicode61 remove_diacritics 2')"
+        )
+        triggers = {
+            f'{fts}_ai': (
+                f'CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN '
+                f'INSERT INTO {fts}(rowid, {names}) VALUES (new.{pk}, {new}); END'
+            ),
+            f'{fts}_ad': (
+                f'CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN '
+                f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.{pk}, {old}); END"
+            ),
+            f'{fts}_au': (
+                f'CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {names} ON {table} BEGIN '
+                f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.{pk}, {old}); "
+                f'INSERT INTO {fts}(rowid, {names}) VALUES (new.{pk}, {new}); END'
+            ),
+        }
+        return create_table, triggers
+
+    def repair_triggers(self, conn, models):
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')")
+            existing = {row[0] for row in cursor.fetchall()}
+            for model in models:
+                _, triggers = self.mirror_sql(model)
+                if fts_table(model) not in existing:
+                    continue  # Migration not applied, or SQLite without FTS5
+                missing = [name for name in triggers if name not in existing]
+                if not missing:
+                    continue
+                for name in missing:
+                    cursor.execute(triggers[name])
+                # Writes made while a trigger was missing never reached the mirror
+                cursor.execute(f"INSERT INTO {fts_table(model)}({fts_table(model)}) VALUES ('rebuild')")
+                logger.info("Restored triggers and rebuilt search mirror %s", fts_table(model))
+
+
+@functools.lru_cache(maxsize=None)
+def _existing_tables():
+    return frozenset(connection.introspection.table_names())
+
+
+def get_search_backend():
+    """The indexed search backend for the current database, or None."""
+    if connection.vendor == 'postgresql':
+        return PostgresSearchBackend()
+    if connection.vendor == 'sqlite':
+        return SQLiteFTSBackend()
+    return None
+
+
+def repair_search_triggers(using='default'):
+    """
+    Recreate SQLite search triggers dropped by table rebuilds.
+
+    Safe to run repeatedly; called after every migrate.
+    """
+    conn = connections[using]
+    if conn.vendor != 'sqlite':
+        return
+
+    tables = set(conn.introspection.table_names())
+    models = [
+        model for model in map(django_apps.get_model, SEARCH_DOCUMENTS)
+        if model._meta.db_table in tables
+    ]
+    SQLiteFTSBackend().repair_triggers(conn, models)
+    _existing_tables.cache_clear()
+
+
+def search_queryset(queryset, text):
+    """
+    Filter a queryset to rows matching text, annotated with search_rank.
+
+    Returns None when no search index covers the queryset's model, or the
+    text has no word tokens, so callers can fall back to a plain ICONTAINS
+    search.
+    """
+    tokens = search_tokens(text)
+    backend = get_search_backend()
+    if not tokens or backend is None or not backend.supports(queryset.model):
+        return None
+    return backend.search(queryset, text, tokens)
@@ -0,0 +1,134 @@
+"""Story earliness computed in the database with window functions.
+
+Ranks reporters within each indexed story (see StoryIndex) without
+loading claims into Python:
+
+1. ROW_NUMBER() over (story, reporter) keeps each reporter's first claim.
+2. ROW_NUMBER() over story, ordered by (claim_date, id), gives its position,
+   and COUNT(*) over story gives N.
+3. earliness = (N - position) / (N - 1), averaged per reporter over the
+   stories with two or more reporters.
+
+Works on PostgreSQL and SQLite 3.25+. Databases without window functions
+fall back to ranking ordered membership rows in Python.
+"""
+
+from collections import defaultdict
+
+from django.db import connection
+
+from apps.claims.models import Claim, Story
+
+# Dimension name -> Claim field ranked within each story
+DIMENSION_FIELDS = {
+    'journalist': 'journalist_id',
+    'publication': 'publication',
+}
+
+_RANKING_SQL = """
+WITH members AS (
+    SELECT sc.{story_col} AS story_id,
+           c.{value_col} AS value,
+           c.{date_col} AS claim_date,
+           c.{id_col} AS claim_id,
+           ROW_NUMBER() OVER (
+               PARTITION BY sc.{story_col}, c.{value_col}
+               ORDER BY c.{date_col}, c.{id_col}
+           ) AS nth
+    FROM {through_table} sc
+    JOIN {claim_table} c ON c.{id_col} = sc.{claim_col}
+    WHERE c.{value_col} IS NOT NULL {exclude_blank}
+),
+ranked AS (
+    SELECT story_id,
+           value,
+           ROW_NUMBER() OVER (PARTITION BY story_id ORDER BY claim_date, claim_id) AS position,
+           COUNT(*) OVER (PARTITION BY story_id) AS reporters
+    FROM members
+    WHERE nth = 1
+)
+SELECT value,
+       COUNT(*) AS story_count,
+       AVG(CAST(reporters - position AS DOUBLE PRECISION) / (reporters - 1)) AS earliness,
+       AVG(CAST(position AS DOUBLE PRECISION)) AS avg_position
+FROM ranked
+WHERE reporters >= 2
+GROUP BY value
+"""
+
+
+def rank_aggregates(dimension='journalist'):
+    """
+    Aggregate story ranks per reporter for one dimension.
+
+    Returns dict: value -> (story_count, average earliness 0-1, average position).
+    """
+    if dimension not in DIMENSION_FIELDS:
+        raise ValueError(f"Unknown earliness dimension: {dimension}")
+
+    if connection.features.supports_over_clause:
+        return _rank_aggregates_sql(dimension)
+    return _rank_aggregates_python(dimension)
+
+
+def _rank_aggregates_sql(dimension):
+    through = Story.claims.through._meta
+    claim = Claim._meta
+    value_field = claim.get_field(DIMENSION_FIELDS[dimension])
+    qn = connection.ops.quote_name
+
+    sql = _RANKING_SQL.format(
+        through_table=qn(through.db_table),
+        story_col=qn(through.get_field('story').column),
+        claim_col=qn(through.get_field('claim').column),
+        claim_table=qn(claim.db_table),
+        id_col=qn(claim.pk.column),
+        date_col=qn(claim.get_field('claim_date').column),
+        value_col=qn(value_field.column),
+        exclude_blank=f"AND c.{qn(value_field.column)} <> ''" if value_field.get_internal_type() == 'CharField' else '',
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql)
+        return {
+            value: (story_count, earliness, avg_position)
+            for value, story_count, earliness, avg_position in cursor.fetchall()
+        }
+
+
+def _rank_aggregates_python(dimension):
+    """Same ranking over ordered (story, value) rows, for databases without OVER."""
+    field = DIMENSION_FIELDS[dimension]
+    rows = (
+        Story.claims.through.objects
+        .exclude(**{f'claim__{field}': ''} if field == 'publication' else {})
+        .order_by('story_id', 'claim__claim_date', 'claim_id')
+        .values_list('story_id', f'claim__{field}')
+        .iterator(chunk_size=10000)
+    )
+
+    totals = defaultdict(lambda: [0, 0.0, 0])  # value -> [stories, earliness sum, position sum]
+
+    def flush(order):
+        n = len(order)
+        if n < 2:
+            return
+        for rank_idx, value in enumerate(order):
+            total = totals[value]
+            total[0] += 1
+            total[1] += (n - 1 - rank_idx) / (n - 1)
+            total[2] += rank_idx + 1
+
+    current_story, order, seen = None, [], set()
+    for story_id, value in rows:
+        if story_id != current_story:
+            flush(order)
+            current_story, order, seen = story_id, [], set()
+        if value not in seen:
+            seen.add(value)
+            order.append(value)
+    flush(order)
+
+    return {
+        value: (count, earliness_sum / count, position_sum / count)
+        for value, (count, earliness_sum, position_sum) in totals.items()
+    }
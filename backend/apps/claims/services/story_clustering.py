@@ -0,0 +1,141 @@
+"""Story clustering — groups confirmed (player, to_club) pairs into stories.
+
+A pair joins an existing story when the player names match (substring in
+either direction) and, if both sides name a club, the clubs match too.
+Comparing every pair against every story is quadratic, so stories are
+bucketed by blocking keys and the fuzzy comparison only runs inside the
+buckets a pair can possibly match.
+
+Blocking keys are character trigrams of the normalised player name, plus
+the normalised name itself. If name A is a substring of name B, every
+trigram of A is also a trigram of B, so two lookups find every candidate:
+- stories containing A: the intersection of the posting lists of A's trigrams
+- stories contained in A: stories whose name equals one of A's substrings
+Names shorter than three characters have no trigrams and are compared
+directly. The grouping is therefore identical to the pairwise loop.
+
+Pairs may carry the ReferencePlayer id their claims resolved to. Two
+resolved pairs are the same player exactly when their ids are equal, so
+stories with the pair's id are candidates too, and fuzzy candidates with
+a different id are skipped.
+"""
+
+from collections import defaultdict
+
+from apps.claims.services.validator import normalise_club, normalise_player
+
+GRAM_SIZE = 3
+
+
+def _grams(name: str) -> set[str]:
+    return {name[i:i + GRAM_SIZE] for i in range(len(name) - GRAM_SIZE + 1)}
+
+
+class StoryClusterer:
+    """Incrementally clusters (player, to_club) pairs into stories.
+
+    Produces the same stories, in the same order, as comparing each pair
+    against every story found so far with players_match/clubs_match.
+    """
+
+    def __init__(self):
+        self.stories: list[tuple[str, str]] = []
+        self._names: list[str] = []   # normalised player per story
+        self._clubs: list[str] = []   # normalised club per story ('' if none)
+        self._player_ids: list[int | None] = []  # ReferencePlayer id per story
+        self._by_player: dict[int, list[int]] = defaultdict(list)  # player id -> stories
+        self._postings: dict[str, set[int]] = defaultdict(set)  # trigram -> stories containing it
+        self._by_name: dict[str, list[int]] = defaultdict(list)  # normalised name -> stories
+        self._short: list[int] = []   # stories whose names are too short for trigrams
+        self.comparisons = 0
+
+    def add(self, player: str, club: str, player_id: int | None = None) -> bool:
+        """Add a pair, creating a new story unless an existing one covers it.
+
+        Returns True if a new story was created.
+        """
+        if not player:
+            return False
+        if self.find(player, club, player_id) is not None:
+            return False
+
+        name = normalise_player(player)
+        idx = len(self.stories)
+        self.stories.append((player, club or ''))
+        self._names.append(name)
+        self._clubs.append(normalise_club(club) if club else '')
+        self._player_ids.append(player_id)
+        self._by_name[name].append(idx)
+        if player_id is not None:
+            self._by_player[player_id].append(idx)
+
+        grams = _grams(name)
+        if not grams:
+            self._short.append(idx)
+        for gram in grams:
+            self._postings[gram].add(idx)
+        return True
+
+    def find(self, player: str, club: str, player_id: int | None = None) -> int | None:
+        """Return the index of the first story covering this pair, or None."""
+        name = normalise_player(player)
+        if not name:
+            return None
+        club_norm = normalise_club(club) if club else ''
+
+        candidates = self._candidates(name)
+        if player_id is not None:
+            candidates.update(self._by_player.get(player_id, ()))
+
+        best = None
+        for idx in candidates:
+            if best is not None and idx >= best:
+                continue
+            self.comparisons += 1
+            story_id = self._player_ids[idx]
+            if player_id is not None and story_id is not None:
+                if player_id != story_id:
+                    continue
+            else:
+                story_name = self._names[idx]
+                if not (name in story_name or story_name in name):
+                    continue
+            story_club = self._clubs[idx]
+            if club_norm and story_club and not (club_norm in story_club or story_club in club_norm):
+                continue
+            best = idx
+        return best
+
+    def _candidates(self, name: str) -> set[int]:
+        grams = _grams(name)
+        if not grams:
+            # Very short names can sit inside any story name
+            return set(range(len(self.stories)))
+
+        # Stories containing the name share all of its trigrams
+        postings = sorted((self._postings.get(g, set()) for g in grams), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates &= posting
+
+        # Stories contained in the name are one of its substrings
+        candidates.update(self._short)
+        length = len(name)
+        for start in range(length):
+            for end in range(start + GRAM_SIZE, length + 1):
+                candidates.update(self._by_name.get(name[start:end], ()))
+        return candidates
+
+
+def cluster_stories(pairs) -> list[tuple[str, str]]:
+    """
+    Group (player_name, to_club) pairs into canonical story pairs.
+
+    Pairs may also be (player_name, to_club, reference_player_id) triples.
+    """
+    clusterer = StoryClusterer()
+    for pair in pairs:
+        clusterer.add(*pair)
+    return clusterer.stories
@@ -0,0 +1,373 @@
+import logging
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Q
+
+from apps.claims.models import Claim, Story, StoryReport
+from apps.claims.services.response_cache import bump_data_version
+from apps.claims.services.story_clustering import cluster_stories
+from apps.claims.services.validator import clubs_match, same_player
+
+logger = logging.getLogger(__name__)
+
+
+def player_key(player_name: str) -> str:
+    """Lowercased surname used to bucket claims and stories."""
+    parts = (player_name or '').strip().split()
+    return parts[-1].lower() if parts else ''
+
+
+def claim_in_story(player_name: str, to_club: str, story_player: str, story_club: str,
+                   player_id: int | None = None, story_player_id: int | None = None) -> bool:
+    """Check whether a claim belongs to a story.
+
+    The player must match (by ReferencePlayer id when both sides resolved),
+    and if the story has a destination club the claim must name a matching
+    to_club.
+    """
+    if not same_player(player_name, story_player, player_id, story_player_id):
+        return False
+    if story_club:
+        return bool(to_club) and clubs_match(to_club, story_club)
+    return True
+
+
+def story_covers(player_name: str, to_club: str, story_player: str, story_club: str,
+                 player_id: int | None = None, story_player_id: int | None = None) -> bool:
+    """Check whether a confirmed (player, to_club) pair is already a known story."""
+    if not same_player(player_name, story_player, player_id, story_player_id):
+        return False
+    if to_club and story_club:
+        return clubs_match(to_club, story_club)
+    return True
+
+
+class ClaimBuckets:
+    """
+    Claim rows bucketed for story membership lookups.
+
+    Rows resolved to a ReferencePlayer are found through their player id;
+    every row is also bucketed by surname key for the fuzzy fallback.
+    """
+
+    def __init__(self, rows, player_col, club_col, player_id_col):
+        """
+        Args:
+            rows: Claim rows (tuples), in the order members should keep
+            player_col, club_col, player_id_col: Positions of player_name,
+                to_club and reference_player_id in each row
+        """
+        self._player_col = player_col
+        self._club_col = club_col
+        self._player_id_col = player_id_col
+        self.by_key = defaultdict(list)
+        self.by_player = defaultdict(list)
+        for position, row in enumerate(rows):
+            if not row[player_col]:
+                continue
+            self.by_key[player_key(row[player_col])].append((position, row))
+            if row[player_id_col] is not None:
+                self.by_player[row[player_id_col]].append((position, row))
+
+    def members(self, story_player, story_club, story_player_id=None):
+        """The rows belonging to a story, in their original order."""
+        player, club, player_id = self._player_col, self._club_col, self._player_id_col
+        bucket = self.by_key.get(player_key(story_player), [])
+        if story_player_id is None:
+            found = [
+                (position, row) for position, row in bucket
+                if claim_in_story(row[player], row[club], story_player, story_club)
+            ]
+        else:
+            # Resolved rows join on the player id; only unresolved rows are fuzzy matched
+            found = [
+                (position, row) for position, row in self.by_player.get(story_player_id, [])
+                if claim_in_story(row[player], row[club], story_player, story_club, row[player_id], story_player_id)
+            ] + [
+                (position, row) for position, row in bucket
+                if row[player_id] is None
+                and claim_in_story(row[player], row[club], story_player, story_club)
+            ]
+            found.sort(key=lambda item: item[0])
+        return [row for _, row in found]
+
+
+class StoryIndex:
+    """
+    Persisted index of confirmed transfer stories and reporter ranks.
+
+    Each Story groups the claims about one confirmed transfer, and each
+    StoryReport holds a journalist's rank within it. The index is updated
+    incrementally as claims change, so speed scores are simple reads.
+    """
+
+    @staticmethod
+    def index_claim(claim):
+        """
+        Bring the index up to date after a claim was created or edited.
+
+        Returns the set of journalist ids whose story ranks changed.
+        """
+        previous = set(claim.stories.all())
+        matching, covered = StoryIndex._match(claim, StoryIndex._candidate_stories(claim))
+        if StoryIndex._seeds_story(claim, covered):
+            matching.add(StoryIndex._create_story(claim.player_name, claim.to_club, claim.reference_player_id))
+
+        with transaction.atomic():
+            for story in previous - matching:
+                story.claims.remove(claim)
+            for story in matching - previous:
+                story.claims.add(claim)
+
+            affected = set()
+            for story in previous | matching:
+                affected |= StoryIndex._refresh_story(story)
+
+        return affected
+
+    @staticmethod
+    def index_new_claims(claims):
+        """
+        index_claim() for claims just created together (as by bulk_create).
+
+        New claims belong to no story yet. Claims naming the same player
+        share one story lookup, and each story touched is re-ranked once.
+
+        Returns the set of journalist ids whose story ranks changed.
+        """
+        lookups = {}
+        touched = {}
+        memberships = set()
+        with transaction.atomic():
+            for claim in claims:
+                lookup_key = (claim.player_name.strip().lower(), claim.reference_player_id)
+                if lookup_key not in lookups:
+                    lookups[lookup_key] = list(StoryIndex._candidate_stories(claim))
+                matching, covered = StoryIndex._match(claim, lookups[lookup_key])
+                if StoryIndex._seeds_story(claim, covered):
+                    matching.add(StoryIndex._create_story(claim.player_name, claim.to_club, claim.reference_player_id))
+                    # Later claims must see the new story
+                    lookups.clear()
+                for story in matching:
+                    touched[story.pk] = story
+                    memberships.add((story.pk, claim.pk))
+
+            through = Story.claims.through
+            through.objects.bulk_create(
+                [through(story_id=story_id, claim_id=claim_id) for story_id, claim_id in memberships],
+                ignore_conflicts=True,
+            )
+            affected = set()
+            for story in touched.values():
+                affected |= StoryIndex._refresh_story(story)
+
+        return affected
+
+    @staticmethod
+    def _candidate_stories(claim):
+        """Stories that might hold the claim: same player key, name or player id."""
+        key = player_key(claim.player_name)
+        if not key:
+            return Story.objects.none()
+        lookup = Q(player_key=key) | Q(player_name__icontains=claim.player_name.strip())
+        if claim.reference_player_id is not None:
+            lookup |= Q(reference_player_id=claim.reference_player_id)
+        return Story.objects.filter(lookup)
+
+    @staticmethod
+    def _match(claim, stories):
+        """
+        The candidate stories the claim belongs to, and whether any of them
+        already covers it (so it must not seed a story of its own).
+        """
+        key = player_key(claim.player_name)
+        player_id = claim.reference_player_id
+        matching = set()
+        covered = False
+        for story in stories:
+            ids = (player_id, story.reference_player_id)
+            # Resolved on both sides: the ids decide, whatever the surnames
+            same_bucket = None not in ids or story.player_key == key
+            if same_bucket and claim_in_story(
+                claim.player_name, claim.to_club, story.player_name, story.to_club, *ids
+            ):
+                matching.add(story)
+            if story_covers(claim.player_name, claim.to_club, story.player_name, story.to_club, *ids):
+                covered = True
+        return matching, covered
+
+    @staticmethod
+    def _seeds_story(claim, covered):
+        return (
+            bool(player_key(claim.player_name))
+            and claim.validation_status == Claim.STATUS_CONFIRMED_TRUE
+            and not covered
+        )
+
+    @staticmethod
+    def remove_stories(story_ids):
+        """
+        Re-rank stories after one of their claims was deleted.
+
+        Returns the set of journalist ids whose story ranks changed.
+        """
+        affected = set()
+        with transaction.atomic():
+            for story in Story.objects.filter(id__in=story_ids):
+                affected |= StoryIndex._refresh_story(story)
+        return affected
+
+    @staticmethod
+    def _create_story(player_name, to_club, player_id=None):
+        """Create a story and attach every existing claim that belongs to it."""
+        key = player_key(player_name)
+        story = Story.objects.create(
+            player_name=player_name.strip(),
+            to_club=to_club or '',
+            player_key=key,
+            reference_player_id=player_id,
+        )
+        candidates = Claim.objects.filter(player_name__icontains=key)
+        if player_id is not None:
+            # Resolved claims join on the player id; only unresolved ones are fuzzy matched
+            candidates = Claim.objects.filter(
+                Q(reference_player_id=player_id)
+                | Q(reference_player__isnull=True, player_name__icontains=key)
+            )
+        members = [
+            c.id for c in candidates.only('id', 'player_name', 'to_club', 'reference_player_id')
+            if (
+                (player_id is not None and c.reference_player_id is not None)
+                or player_key(c.player_name) == key
+            )
+            and claim_in_story(
+                c.player_name, c.to_club, story.player_name, story.to_club,
+                c.reference_player_id, player_id,
+            )
+        ]
+        story.claims.add(*members)
+        logger.info("Created story: %s → %s (%d claims)", story.player_name, story.to_club or '?', len(members))
+        return story
+
+    @staticmethod
+    def _refresh_story(story):
+        """
+        Re-rank a story's reporters, or drop the story if it is no longer confirmed.
+
+        Returns the set of journalist ids whose reports were touched.
+        """
+        members = list(
+            story.claims
+            .order_by('claim_date', 'id')
+            .values_list('id', 'journalist_id', 'claim_date', 'validation_status')
+        )
+        old_journalists = set(story.reports.values_list('journalist_id', flat=True))
+
+        if not any(status == Claim.STATUS_CONFIRMED_TRUE for _, _, _, status in members):
+            story.delete()
+            return old_journalists
+
+        reports = StoryIndex._rank(story, members)
+        story.reports.all().delete()
+        StoryReport.objects.bulk_create(reports)
+
+        story.reporter_count = len({jid for _, jid, _, _ in members})
+        story.save(update_fields=['reporter_count', 'updated_at'])
+
+        return old_journalists | {r.journalist_id for r in reports}
+
+    @staticmethod
+    def _rank(story, members):
+        """
+        Build StoryReport rows from a story's claims, ordered by claim date.
+
+        Each journalist is ranked by their earliest claim:
+        earliness = (N - rank) / (N - 1), first = 1.0, last = 0.0.
+        """
+        first_claims = []  # (journalist_id, claim_id, claim_date) in order of first appearance
+        seen = set()
+        for claim_id, journalist_id, claim_date, _ in members:
+            if journalist_id not in seen:
+                seen.add(journalist_id)
+                first_claims.append((journalist_id, claim_id, claim_date))
+
+        n = len(first_claims)
+        if n < 2:
+            return []
+
+        return [
+            StoryReport(
+                story=story,
+                journalist_id=journalist_id,
+                first_claim_id=claim_id,
+                first_reported_at=claim_date,
+                position=rank_idx + 1,
+                earliness=(n - 1 - rank_idx) / (n - 1),
+            )
+            for rank_idx, (journalist_id, claim_id, claim_date) in enumerate(first_claims)
+        ]
+
+    @staticmethod
+    def rebuild():
+        """
+        Rebuild the whole index from scratch.
+
+        Returns the number of stories indexed.
+        """
+        # 1. Find all confirmed true stories (unique player+to_club combos)
+        confirmed = (
+            Claim.objects
+            .filter(validation_status=Claim.STATUS_CONFIRMED_TRUE)
+            .exclude(player_name='')
+            .values_list('player_name', 'to_club', 'reference_player_id')
+            .distinct()
+        )
+
+        # Each (player, to_club) seed keeps the player id its claims resolved to
+        player_ids = {}
+        for player, club, player_id in confirmed:
+            player_ids.setdefault((player.strip(), club), player_id)
+        seeds = cluster_stories((player, club, player_id) for (player, club), player_id in player_ids.items())
+
+        # 2. Match every claim to its stories via player ids and a last-name index
+        buckets = ClaimBuckets(
+            Claim.objects
+            .exclude(player_name='')
+            .order_by('claim_date', 'id')
+            .values_list(
+                'id', 'journalist_id', 'claim_date', 'validation_status',
+                'player_name', 'to_club', 'reference_player_id',
+            ),
+            player_col=4, club_col=5, player_id_col=6,
+        )
+
+        with transaction.atomic():
+            Story.objects.all().delete()
+
+            stories = Story.objects.bulk_create([
+                Story(
+                    player_name=player, to_club=club, player_key=player_key(player),
+                    reference_player_id=player_ids[(player, club)],
+                )
+                for player, club in seeds
+            ])
+
+            through = Story.claims.through
+            memberships = []
+            reports = []
+            for story in stories:
+                members = [
+                    row[:4] for row in buckets.members(story.player_name, story.to_club, story.reference_player_id)
+                ]
+                memberships.extend(through(story_id=story.id, claim_id=row[0]) for row in members)
+                reports.extend(StoryIndex._rank(story, members))
+                story.reporter_count = len({row[1] for row in members})
+
+            through.objects.bulk_create(memberships, batch_size=1000)
+            StoryReport.objects.bulk_create(reports, batch_size=1000)
+            Story.objects.bulk_update(stories, ['reporter_count'], batch_size=1000)
+
+        bump_data_version()
+        logger.info("Rebuilt story index: %d stories, %d reports", len(stories), len(reports))
+        return len(stories)
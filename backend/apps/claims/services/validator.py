@@ -3,7 +3,8 @@ from datetime import date, datetime, timedelta
 
 from django.utils import timezone
 
-from apps.claims.models import Claim
+from apps.claims.models import Claim, ClaimClub
+from apps.claims.services.bulk_updates import bulk_claim_updates
 from apps.claims.scrapers.transfermarkt_scraper import TransfermarktScraper
 
 logger = logging.getLogger(__name__)
@@ -69,6 +70,91 @@ def players_match(name_a: str, name_b: str) -> bool:
     return a in b or b in a
 
 
+def same_player(name_a: str, name_b: str,
+                player_id_a: int | None = None, player_id_b: int | None = None) -> bool:
+    """
+    Whether two player references name the same player.
+
+    Compares ReferencePlayer ids when both sides resolved, else falls back
+    to the substring name match.
+    """
+    if player_id_a is not None and player_id_b is not None:
+        return player_id_a == player_id_b
+    return players_match(name_a, name_b)
+
+
+def _linked_clubs(claim: Claim) -> dict[str, dict[str, int | None]]:
+    """The claim's club links by direction, name key -> resolved id (uses prefetched links)."""
+    linked = {ClaimClub.DIRECTION_FROM: {}, ClaimClub.DIRECTION_TO: {}}
+    for link in claim.club_links.all():
+        linked[link.direction][link.name_key] = link.club_id
+    return linked
+
+
+def _claim_clubs(value: str, links: dict[str, int | None]) -> list[tuple[str, int | None]]:
+    """Each club named in a claim field, with its resolved id or None."""
+    # club_resolver imports this module's alias map, so import it late
+    from apps.claims.services.club_resolver import club_key, split_clubs
+
+    return [(name, links.get(club_key(name))) for name in split_clubs(value)]
+
+
+def _club_agrees(transfer_club: str, transfer_club_id: int | None,
+                 claim_clubs: list[tuple[str, int | None]]) -> bool:
+    """
+    Whether a transfer club matches any of a claim's clubs for one direction.
+
+    Each club compares canonical ids when it and the transfer club both
+    resolved, else falls back to the substring name match.
+    """
+    for name, club_id in claim_clubs:
+        if transfer_club_id is not None and club_id is not None:
+            if club_id == transfer_club_id:
+                return True
+        elif clubs_match(transfer_club, name):
+            return True
+    return False
+
+
+class _ClaimCandidates:
+    """
+    Pending claims grouped by linked club, so each transfer is only compared
+    with claims about its clubs (plus claims with a club that did not
+    resolve) and its player (plus claims with no resolved player).
+    """
+
+    def __init__(self, claims: list[Claim]):
+        self.claims = claims
+        self.by_club: dict[int, list[Claim]] = {}
+        self.unlinked: list[Claim] = []
+        for claim in claims:
+            club_ids = {link.club_id for link in claim.club_links.all()}
+            if not club_ids or None in club_ids:
+                self.unlinked.append(claim)
+                club_ids.discard(None)
+            for club_id in club_ids:
+                self.by_club.setdefault(club_id, []).append(claim)
+
+    def for_transfer(self, transfer: dict) -> list[Claim]:
+        club_ids = [transfer.get('from_club_id'), transfer.get('to_club_id')]
+        if None in club_ids:
+            # A club that did not resolve can only be matched by name
+            candidates = self.claims
+        else:
+            seen = set()
+            candidates = []
+            for claim in [*self.by_club.get(club_ids[0], []), *self.by_club.get(club_ids[1], []), *self.unlinked]:
+                if claim.pk not in seen:
+                    seen.add(claim.pk)
+                    candidates.append(claim)
+
+        # Claims resolved to a different player can never match
+        player_id = transfer.get('player_id')
+        if player_id is None:
+            return candidates
+        return [c for c in candidates if c.reference_player_id in (None, player_id)]
+
+
 class TransferValidator:
     """Validates pending claims against confirmed transfers."""
 
@@ -97,21 +183,35 @@ class TransferValidator:
             return []
 
         cutoff = timezone.now() - timedelta(days=90)
-        pending_claims = Claim.objects.filter(
-            validation_status='pending',
-            claim_date__gte=cutoff,
-        ).select_related('journalist')
+        pending_claims = list(
+            Claim.objects.filter(
+                validation_status='pending',
+                claim_date__gte=cutoff,
+            ).select_related('journalist').prefetch_related('club_links')
+        )
+        # club_resolver imports this module's alias map, so import it late
+        from apps.claims.services.club_resolver import ClubResolver
+        from apps.claims.services.player_resolver import PlayerResolver
 
+        candidates = _ClaimCandidates(pending_claims)
+        resolver = ClubResolver.current()
+        player_resolver = PlayerResolver.current()
+
+        # Confirmations are indexed and rescored once, after the loop
         matches = []
-        for transfer in transfers:
-            for claim in pending_claims:
-                if self._is_match(transfer, claim):
-                    matches.append({
-                        'claim': claim,
-                        'transfer': transfer,
-                    })
-                    if not dry_run:
-                        self._confirm_claim(claim, transfer)
+        with bulk_claim_updates():
+            for transfer in transfers:
+                transfer['from_club_id'] = resolver.resolve(transfer.get('from_club', ''))
+                transfer['to_club_id'] = resolver.resolve(transfer.get('to_club', ''))
+                transfer['player_id'] = player_resolver.resolve(transfer.get('player_name', ''))
+                for claim in candidates.for_transfer(transfer):
+                    if self._is_match(transfer, claim):
+                        matches.append({
+                            'claim': claim,
+                            'transfer': transfer,
+                        })
+                        if not dry_run:
+                            self._confirm_claim(claim, transfer)
 
         return matches
 
@@ -136,7 +236,8 @@ class TransferValidator:
         """Match requires player name, club direction match, AND date ordering.
 
         Rules:
-        1. Player name must match (substring, case-insensitive)
+        1. Player must match (same ReferencePlayer when both resolved,
+           else substring, case-insensitive)
         2. Claim date must be on or before the transfer date
         3. Club matching depends on what the claim has:
            - Both from_club and to_club: BOTH must match the transfer
@@ -147,7 +248,10 @@ class TransferValidator:
         For multi-club to_club fields (comma-separated), at least one
         destination club must match the transfer's to_club.
         """
-        if not players_match(transfer['player_name'], claim.player_name):
+        if not same_player(
+            transfer['player_name'], claim.player_name,
+            transfer.get('player_id'), claim.reference_player_id,
+        ):
             return False
 
         # Date check: claim must have been made before the transfer completed
@@ -163,19 +267,23 @@ class TransferValidator:
         if not has_from and not has_to:
             return False
 
+        linked = _linked_clubs(claim)
+
         # Check from_club match
-        from_match = clubs_match(transfer['from_club'], claim.from_club) if has_from else True
+        from_match = True
+        if has_from:
+            from_match = _club_agrees(
+                transfer['from_club'], transfer.get('from_club_id'),
+                _claim_clubs(claim.from_club, linked[ClaimClub.DIRECTION_FROM]),
+            )
 
         # Check to_club match — handle comma-separated multi-club fields
-        to_match = False
+        to_match = True  # No to_club on claim, don't require it
         if has_to:
-            for club in claim.to_club.split(','):
-                club = club.strip()
-                if club and clubs_match(transfer['to_club'], club):
-                    to_match = True
-                    break
-        else:
-            to_match = True  # No to_club on claim, don't require it
+            to_match = _club_agrees(
+                transfer['to_club'], transfer.get('to_club_id'),
+                _claim_clubs(claim.to_club, linked[ClaimClub.DIRECTION_TO]),
+            )
 
         return from_match and to_match
 
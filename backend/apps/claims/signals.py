@@ -1,13 +1,26 @@
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
-from apps.claims.models import Claim
-from apps.claims.services.scoring import ScoringService
+from apps.claims.models import Claim, Journalist, Transfer
+from apps.claims.services import bulk_updates, claim_counters, claim_ingest, club_resolver, near_duplicates, player_resolver
+from apps.claims.services.journalist_resolver import JournalistResolver
+from apps.claims.services.response_cache import bump_data_version
+from apps.claims.services.score_queue import ScoreQueue
+from apps.claims.services.story_index import StoryIndex
+
+# Claim fields that decide which stories a claim belongs to and its rank
+STORY_FIELDS = ('player_name', 'to_club', 'claim_date', 'journalist_id', 'validation_status')
+
+# Claim columns the content hash is computed from (see Claim.CONTENT_FIELDS)
+CONTENT_COLUMNS = ('journalist_id', 'player_name', 'from_club', 'to_club', 'claim_text')
 
 
 @receiver(post_save, sender=Claim)
-def update_journalist_scores_on_claim_change(sender, instance, created, **kwargs):
+def update_journalist_scores_on_claim_change(sender, instance, created, update_fields=None, **kwargs):
     """
-    Recalculate journalist scores when a claim is saved.
+    Queue journalist rescoring when a claim is saved.
+
+    Scores are recomputed by the process_score_queue worker, which
+    coalesces repeated changes into one rescore per journalist.
 
     This signal triggers whenever:
     - A new claim is added
@@ -18,34 +31,192 @@ def update_journalist_scores_on_claim_change(sender, instance, created, **kwargs
         sender: The Claim model class
         instance: The Claim instance being saved
         created: Boolean indicating if this is a new claim
+        update_fields: Fields passed to save(), or None for all
         **kwargs: Additional keyword arguments
     """
-    # Always update scores when a claim is validated (not pending)
-    if instance.validation_status != 'pending':
-        ScoringService.update_journalist_scores(instance.journalist)
+    # In bulk mode, only record the claim; the work runs once at the end
+    if bulk_updates.bulk_mode_active():
+        bulk_updates.record_claim_save(instance, update_fields)
+        return
+
+    bump_data_version()
+
+    # Keep the journalist's claim counters in sync (same transaction as the save)
+    previous = None if created else getattr(instance, '_previous_counter_state', None)
+    claim_counters.apply_change(previous, claim_counters.counter_state(instance))
+
+    # Keep the canonical club links in sync with the club text
+    if created or _clubs_changed(instance):
+        club_resolver.sync_claim_clubs([instance])
 
-    # Also update if is_first_claim status changes (affects speed score)
-    elif instance.is_first_claim:
-        ScoringService.update_journalist_scores(instance.journalist)
+    # Keep the near-duplicate index in sync with the claim text
+    if created or _text_changed(instance):
+        near_duplicates.index_claims([instance])
+
+    # Keep the canonical player in sync with the player text (before story
+    # indexing, which joins on it)
+    player_changed = False
+    if created or _player_changed(instance):
+        player_changed = bool(player_resolver.sync_claim_players([instance]))
+
+    # Keep the story index in sync with this claim
+    affected = set()
+    if created or player_changed or _story_fields_changed(instance):
+        affected = StoryIndex.index_claim(instance)
+
+    # Queue a full rescore when a claim is validated (not pending)
+    # Also when is_first_claim is set (affects speed score)
+    if instance.validation_status != 'pending' or instance.is_first_claim:
+        ScoreQueue.mark([instance.journalist_id], record_history=True)
+        affected.discard(instance.journalist_id)
+
+    # Other journalists whose rank in a story moved only need a speed refresh
+    ScoreQueue.mark(affected)
 
 
 # Store previous validation status to detect changes
 @receiver(pre_save, sender=Claim)
-def store_previous_validation_status(sender, instance, **kwargs):
+def store_previous_validation_status(sender, instance, update_fields=None, **kwargs):
     """
     Store the previous validation status before saving.
 
     This allows us to detect when validation status changes
     and only update scores when necessary.
+    In bulk mode, where changes are not diffed per row, only the previous
+    content is read, and only when the save writes it: the content hash
+    needs it, and the journalist a claim moves away from must be rescored.
     """
+    if bulk_updates.bulk_mode_active():
+        instance._previous_content = None
+        if instance.pk and _writes_content(update_fields):
+            instance._previous_content = Claim.objects.filter(pk=instance.pk).values_list(*CONTENT_COLUMNS).first()
+            if instance._previous_content:
+                bulk_updates.record_previous_journalist(instance._previous_content[0])
+        return
+
     if instance.pk:
         try:
             old_instance = Claim.objects.get(pk=instance.pk)
             instance._previous_validation_status = old_instance.validation_status
             instance._previous_is_first_claim = old_instance.is_first_claim
+            instance._previous_story_fields = _story_field_values(old_instance)
+            instance._previous_counter_state = claim_counters.counter_state(old_instance)
+            instance._previous_clubs = (old_instance.from_club, old_instance.to_club)
+            instance._previous_claim_text = old_instance.claim_text
+            instance._previous_content = _content_values(old_instance)
         except Claim.DoesNotExist:
             instance._previous_validation_status = None
             instance._previous_is_first_claim = None
+            instance._previous_story_fields = None
+            instance._previous_counter_state = None
+            instance._previous_clubs = None
+            instance._previous_claim_text = None
+            instance._previous_content = None
     else:
         instance._previous_validation_status = None
         instance._previous_is_first_claim = None
+        instance._previous_story_fields = None
+        instance._previous_counter_state = None
+        instance._previous_clubs = None
+        instance._previous_claim_text = None
+        instance._previous_content = None
+
+
+@receiver(pre_save, sender=Claim)
+def set_content_hash(sender, instance, update_fields=None, **kwargs):
+    """
+    Hash a new claim's content, and rehash it when an edit changes it.
+
+    The unique column rejects exact repeats. An edit that makes the claim
+    an exact repeat of another leaves it without a hash, like the repeats
+    stored before the column existed.
+    """
+    if instance._state.adding:
+        if not instance.content_hash:
+            instance.content_hash = claim_ingest.claim_content_hash(instance)
+        return
+
+    if not _writes_content(update_fields):
+        return
+    previous = getattr(instance, '_previous_content', None)
+    if previous == _content_values(instance):
+        return
+
+    digest = claim_ingest.claim_content_hash(instance)
+    if digest != instance.content_hash:
+        repeat = Claim.objects.filter(content_hash=digest).exclude(pk=instance.pk).exists()
+        instance.content_hash = None if repeat else digest
+
+
+@receiver(pre_delete, sender=Claim)
+def store_story_memberships(sender, instance, **kwargs):
+    """Remember which stories a claim belonged to before it is deleted."""
+    instance._story_ids = list(instance.stories.values_list('id', flat=True))
+
+
+@receiver(post_delete, sender=Claim)
+def update_story_index_on_claim_delete(sender, instance, **kwargs):
+    """Update counters, re-rank the deleted claim's stories and queue affected speed scores."""
+    story_ids = getattr(instance, '_story_ids', [])
+    if bulk_updates.bulk_mode_active():
+        bulk_updates.record_claim_delete(instance, story_ids)
+        return
+
+    bump_data_version()
+    claim_counters.apply_change(claim_counters.counter_state(instance), None)
+
+    if story_ids:
+        ScoreQueue.mark(StoryIndex.remove_stories(story_ids))
+
+
+@receiver(post_save, sender=Journalist)
+@receiver(post_delete, sender=Journalist)
+def invalidate_cached_responses_on_journalist_change(sender, instance, **kwargs):
+    """Journalist names and scores appear in cached leaderboards."""
+    bump_data_version()
+
+
+@receiver(post_save, sender=Transfer)
+@receiver(post_delete, sender=Transfer)
+def invalidate_cached_responses_on_transfer_change(sender, instance, **kwargs):
+    """Transfer timelines are validated against the claims data version."""
+    bump_data_version()
+
+
+@receiver(post_save, sender=Journalist)
+@receiver(post_delete, sender=Journalist)
+def forget_resolved_journalist(sender, instance, **kwargs):
+    """A renamed or deleted journalist must not be handed out by name again."""
+    JournalistResolver.current().forget(instance)
+
+
+def _writes_content(update_fields):
+    return update_fields is None or bool({*update_fields} & {*Claim.CONTENT_FIELDS, 'journalist_id'})
+
+
+def _content_values(claim):
+    return tuple(getattr(claim, column) for column in CONTENT_COLUMNS)
+
+
+def _story_field_values(claim):
+    return tuple(getattr(claim, field) for field in STORY_FIELDS)
+
+
+def _story_fields_changed(instance):
+    previous = getattr(instance, '_previous_story_fields', None)
+    return previous is None or previous != _story_field_values(instance)
+
+
+def _player_changed(instance):
+    previous = getattr(instance, '_previous_story_fields', None)
+    return previous is None or previous[0] != instance.player_name
+
+
+def _clubs_changed(instance):
+    previous = getattr(instance, '_previous_clubs', None)
+    return previous is None or previous != (instance.from_club, instance.to_club)
+
+
+def _text_changed(instance):
+    previous = getattr(instance, '_previous_claim_text', None)
+    return previous is None or previous != instance.claim_text
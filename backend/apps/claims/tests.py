@@ -0,0 +1,707 @@
+import tempfile
+from contextlib import ExitStack
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.pagination import PageNumberPagination
+
+from apps.claims.classifiers import classify_claim_confidence, detect_negative_claim
+from apps.claims.models import (
+    Claim, ClaimClub, ClaimTextBand, DirtyJournalist, Journalist, ReferenceClub, ReferencePlayer, Story, StoryReport,
+)
+from apps.claims.pagination import KeysetPagination
+from apps.claims.scrapers.gossip_scraper import CLUBS
+from apps.claims.services import (
+    bulk_updates, claim_counters, claim_ingest, club_resolver, near_duplicates, response_cache,
+)
+from apps.claims.services.club_gazetteer import ClubGazetteer
+from apps.claims.services.phrase_matcher import PhraseMatcher, phrase_pattern
+from apps.claims.services.reference_name_index import ReferenceNameIndex
+from apps.claims.services.score_queue import ScoreQueue
+from apps.claims.services.scoring import ScoringService
+from apps.claims.services.story_index import StoryIndex
+from apps.claims.services.validator import TransferValidator, _ClaimCandidates
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class JournalistEndpointQueryCountTests(TestCase):
+    """
+    Journalist endpoints run a fixed number of queries, whatever the page
+    size or the number of claims behind each journalist.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        ReferenceClub.objects.create(transfermarkt_id=11, name='Arsenal FC')
+        ReferenceClub.objects.create(transfermarkt_id=631, name='Chelsea FC')
+
+        journalists = Journalist.objects.bulk_create([
+            Journalist(name=f'Reporter {i}', slug=f'reporter-{i}', publications=['The Paper'])
+            for i in range(120)
+        ])
+        cls.prolific, cls.occasional = journalists[0], journalists[1]
+
+        start = timezone.now() - timedelta(days=200)
+        statuses = [Claim.STATUS_CONFIRMED_TRUE, Claim.STATUS_PROVEN_FALSE, Claim.STATUS_PENDING]
+        claims = []
+        for i in range(150):
+            claims.append(Claim(
+                journalist=cls.prolific,
+                claim_text=f'Arsenal are closing in on Player {i % 30}.',
+                publication='The Paper',
+                article_url=f'https://example.com/prolific/{i}',
+                claim_date=start + timedelta(hours=i),
+                player_name=f'Player {i % 30}',
+                from_club='Chelsea',
+                to_club='Arsenal',
+                validation_status=statuses[i % 3],
+            ))
+        claims.append(Claim(
+            journalist=cls.occasional,
+            claim_text='Chelsea want Player 0.',
+            publication='The Paper',
+            article_url='https://example.com/occasional/0',
+            claim_date=start,
+            player_name='Player 0',
+            to_club='Chelsea',
+            validation_status=Claim.STATUS_CONFIRMED_TRUE,
+        ))
+        for i, journalist in enumerate(journalists[2:]):
+            for j in range(3):
+                claims.append(Claim(
+                    journalist=journalist,
+                    claim_text=f'Arsenal are interested in Player {(i + j) % 30}.',
+                    publication='The Paper',
+                    article_url=f'https://example.com/{journalist.slug}/{j}',
+                    claim_date=start + timedelta(hours=i * 3 + j),
+                    player_name=f'Player {(i + j) % 30}',
+                    to_club='Arsenal',
+                    validation_status=statuses[(i + j) % 3],
+                ))
+        Claim.objects.bulk_create(claims)
+
+        claim_counters.rebuild()
+        club_resolver.backfill()
+        StoryIndex.rebuild()
+
+    def setUp(self):
+        cache.clear()
+
+    def count_queries(self, url, page_size=None):
+        """Queries for one uncached GET, after a request that warms per-process state."""
+        with ExitStack() as stack:
+            if page_size:
+                for paginator in (PageNumberPagination, KeysetPagination):
+                    stack.enter_context(mock.patch.object(paginator, 'page_size', page_size))
+            self.client.get(url)
+            cache.clear()
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response.json()
+
+    def test_list_constant_across_page_sizes(self):
+        small, data = self.count_queries('/api/journalists/', page_size=20)
+        self.assertEqual(len(data['results']), 20)
+        large, data = self.count_queries('/api/journalists/', page_size=100)
+        self.assertEqual(len(data['results']), 100)
+        self.assertEqual(small, large)
+
+    def test_retrieve_constant_across_claim_counts(self):
+        few, data = self.count_queries(f'/api/journalists/{self.occasional.slug}/')
+        self.assertEqual(data['total_claims'], 1)
+        many, data = self.count_queries(f'/api/journalists/{self.prolific.slug}/')
+        self.assertEqual(data['total_claims'], 150)
+        self.assertEqual(few, many)
+
+    def test_leaderboard_constant_across_limits(self):
+        for score_type in ('truthfulness', 'speed'):
+            with self.subTest(score_type=score_type):
+                url = f'/api/journalists/leaderboard/?score_type={score_type}'
+                small, data = self.count_queries(f'{url}&limit=20')
+                self.assertEqual(len(data), 20)
+                large, data = self.count_queries(f'{url}&limit=100')
+                self.assertEqual(len(data), 100)
+                self.assertEqual(small, large)
+
+    def test_club_tiers_constant_across_journalist_counts(self):
+        few, data = self.count_queries('/api/journalists/club-tiers/?club=Chelsea')
+        self.assertEqual(len(data), 2)
+        many, data = self.count_queries('/api/journalists/club-tiers/?club=Arsenal')
+        self.assertEqual(len(data), 119)
+        self.assertEqual(few, many)
+
+    def test_claims_action_constant_across_page_sizes(self):
+        url = f'/api/journalists/{self.prolific.slug}/claims/'
+        for params in ('', '?cursor='):
+            with self.subTest(params=params):
+                small, data = self.count_queries(url + params, page_size=20)
+                self.assertEqual(len(data['results']), 20)
+                large, data = self.count_queries(url + params, page_size=100)
+                self.assertEqual(len(data['results']), 100)
+                self.assertEqual(small, large)
+
+
+class JournalistPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.journalist = Journalist.objects.create(name='Cursor Reporter')
+        Claim.objects.bulk_create([
+            Claim(
+                journalist=cls.journalist,
+                claim_text=f'Claim {i}',
+                publication='The Paper',
+                article_url=f'https://example.com/cursor/{i}',
+                claim_date=timezone.now() - timedelta(days=i),
+            )
+            for i in range(30)
+        ])
+
+    def test_list_ignores_cursor_parameter(self):
+        response = self.client.get('/api/journalists/?cursor=')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('count', response.json())
+
+    def test_claims_action_pages_by_cursor(self):
+        response = self.client.get(f'/api/journalists/{self.journalist.slug}/claims/?cursor=')
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertNotIn('count', data)
+        self.assertEqual(len(data['results']), 20)
+
+        response = self.client.get(data['next'])
+        self.assertEqual(len(response.json()['results']), 10)
+
+
+class DataVersionTests(TestCase):
+    def test_bump_is_held_in_database(self):
+        before = response_cache.get_data_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            response_cache.bump_data_version()
+        # Clearing the cache stands in for a process with its own cache
+        cache.clear()
+        self.assertEqual(response_cache.get_data_version(), before + 1)
+
+    def test_bump_waits_for_commit(self):
+        before = response_cache.get_data_version()
+        with self.captureOnCommitCallbacks(execute=False):
+            response_cache.bump_data_version()
+        self.assertEqual(response_cache.get_data_version(), before)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        journalist = Journalist.objects.create(name='Cached Reporter')
+        Claim.objects.create(
+            journalist=journalist,
+            claim_text='Arsenal want Player 1.',
+            publication='The Paper',
+            article_url='https://example.com/cached/1',
+            claim_date=timezone.now(),
+            player_name='Player 1',
+            to_club='Arsenal',
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_cache_hit_reads_only_the_data_version(self):
+        self.client.get('/api/journalists/leaderboard/')
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/journalists/leaderboard/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+    def test_not_modified_until_data_changes(self):
+        etag = self.client.get('/api/claims/').headers['ETag']
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/claims/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Journalist.objects.create(name='New Reporter')
+        response = self.client.get('/api/claims/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+
+class ClubFilterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        ReferenceClub.objects.create(transfermarkt_id=11, name='Arsenal FC')
+        ReferenceClub.objects.create(transfermarkt_id=985, name='Manchester United')
+        ReferenceClub.objects.create(transfermarkt_id=281, name='Manchester City')
+        journalist = Journalist.objects.create(name='Club Reporter')
+
+        def claim(number, to_club, from_club=''):
+            return Claim.objects.create(
+                journalist=journalist,
+                claim_text=f'Claim {number}',
+                publication='The Paper',
+                article_url=f'https://example.com/clubs/{number}',
+                claim_date=timezone.now(),
+                to_club=to_club,
+                from_club=from_club,
+            )
+
+        cls.arsenal = claim(1, 'Arsenal')
+        cls.united = claim(2, 'Man Utd', from_club='Al-Hilal FC')
+        cls.city = claim(3, 'Al Hilal, Manchester City')
+
+    def matching(self, club):
+        return set(Claim.objects.filter(club_resolver.club_filter(club)).values_list('pk', flat=True))
+
+    def test_every_club_name_is_linked(self):
+        links = set(ClaimClub.objects.filter(claim=self.city).values_list('direction', 'name_key', 'club__name'))
+        self.assertEqual(links, {('to', 'al hilal', None), ('to', 'manchester city', 'Manchester City')})
+
+    def test_filters_by_reference_club_and_name_key(self):
+        self.assertEqual(self.matching('Arsenal FC'), {self.arsenal.pk})
+        self.assertEqual(self.matching('Manchester United'), {self.united.pk})
+        self.assertEqual(self.matching('Manchester'), {self.united.pk, self.city.pk})
+        self.assertEqual(self.matching('al-hilal'), {self.united.pk, self.city.pk})
+
+    def test_relinks_on_edit(self):
+        self.arsenal.to_club = 'Al Hilal'
+        self.arsenal.save()
+        self.assertEqual(self.matching('Arsenal'), set())
+        self.assertIn(self.arsenal.pk, self.matching('Al Hilal'))
+
+    def test_filter_reads_only_the_link_table(self):
+        sql = str(Claim.objects.filter(club_resolver.club_filter('Al Hilal')).query)
+        self.assertNotIn('LIKE', sql)
+
+
+class ClubJournalistStatsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.first = Journalist.objects.create(name='First Reporter')
+        cls.second = Journalist.objects.create(name='Second Reporter')
+        start = timezone.now() - timedelta(days=10)
+
+        def claim(number, journalist, to_club, status=Claim.STATUS_PENDING):
+            return Claim.objects.create(
+                journalist=journalist,
+                claim_text=f'Claim {number}',
+                publication='The Paper',
+                article_url=f'https://example.com/club-stats/{number}',
+                claim_date=start + timedelta(days=number),
+                player_name='Player 9',
+                to_club=to_club,
+                validation_status=status,
+            )
+
+        claim(1, cls.first, 'Arsenal')
+        claim(2, cls.second, 'Arsenal', Claim.STATUS_CONFIRMED_TRUE)
+        claim(3, cls.second, 'Chelsea')
+
+    def test_speed_reads_the_story_index(self):
+        stats = ScoringService.compute_club_journalist_stats('Arsenal')
+        self.assertEqual(stats[self.first.pk]['speed'], 100.0)
+        self.assertEqual(stats[self.second.pk]['speed'], 0.0)
+        self.assertEqual(stats[self.second.pk]['true_count'], 1)
+
+    def test_club_without_confirmed_stories_has_no_speed(self):
+        stats = ScoringService.compute_club_journalist_stats('Chelsea')
+        self.assertEqual(stats, {self.second.pk: {
+            'accuracy': 0.0, 'speed': 0, 'total_claims': 1,
+            'validated': 0, 'true_count': 0, 'false_count': 0,
+        }})
+
+
+class TransferMatchClubTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.sporting = ReferenceClub.objects.create(transfermarkt_id=336, name='Sporting CP')
+        ReferenceClub.objects.create(transfermarkt_id=2448, name='Sporting Gijón')
+        cls.chelsea = ReferenceClub.objects.create(transfermarkt_id=631, name='Chelsea FC')
+        journalist = Journalist.objects.create(name='Match Reporter')
+        # "Sporting" is ambiguous, so only Chelsea resolves
+        cls.claim = Claim.objects.create(
+            journalist=journalist,
+            claim_text='Sporting or Chelsea for Player 7.',
+            publication='The Paper',
+            article_url='https://example.com/match/1',
+            claim_date=timezone.now() - timedelta(days=2),
+            player_name='Player 7',
+            to_club='Sporting, Chelsea',
+        )
+
+    def transfer(self, to_club, to_club_id):
+        return {
+            'player_name': 'Player 7',
+            'from_club': '',
+            'to_club': to_club,
+            'to_club_id': to_club_id,
+            'transfer_date': timezone.now().date(),
+        }
+
+    def test_unresolved_entry_keeps_text_match(self):
+        claim = Claim.objects.prefetch_related('club_links').get(pk=self.claim.pk)
+        validator = TransferValidator()
+        self.assertTrue(validator._is_match(self.transfer('Sporting CP', self.sporting.pk), claim))
+        self.assertTrue(validator._is_match(self.transfer('Chelsea FC', self.chelsea.pk), claim))
+        self.assertFalse(validator._is_match(self.transfer('Arsenal FC', None), claim))
+
+    def test_claim_with_unresolved_club_is_a_candidate(self):
+        claims = list(Claim.objects.prefetch_related('club_links'))
+        candidates = _ClaimCandidates(claims).for_transfer(
+            {'from_club_id': self.sporting.pk, 'to_club_id': self.sporting.pk},
+        )
+        self.assertEqual(candidates, claims)
+
+
+class ClubGazetteerTests(SimpleTestCase):
+    def setUp(self):
+        self.gazetteer = ClubGazetteer(CLUBS, ['Stade Rennais FC'])
+
+    def test_matches_whole_words_only(self):
+        self.assertEqual(self.gazetteer.clubs('Fabrizio Romano says Arsenal are close.'), ['Arsenal'])
+
+    def test_common_words_need_capitals(self):
+        self.assertEqual(self.gazetteer.clubs('It would be a nice move for him to join Arsenal.'), ['Arsenal'])
+        self.assertEqual(self.gazetteer.clubs('Nice want the Arsenal striker.'), ['Arsenal', 'Nice'])
+        self.assertEqual(self.gazetteer.clubs('The fee spurs Chelsea into action.'), ['Chelsea'])
+
+    def test_longest_name_and_written_form(self):
+        self.assertEqual(
+            self.gazetteer.clubs('Newcastle United and Man Utd chase Stade Rennais defender.'),
+            ['Newcastle United', 'Stade Rennais', 'Man Utd'],
+        )
+
+
+class ClubGazetteerCurrentTests(TestCase):
+    def test_current_is_reused_between_checks(self):
+        with mock.patch.object(ClubGazetteer, '_current', None):
+            ClubGazetteer.current()
+            with self.assertNumQueries(0):
+                ClubGazetteer.current()
+
+
+class ReferenceNameIndexTests(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.enterContext(override_settings(REFERENCE_NAME_INDEX_PATH=f'{directory.name}/names.bin'))
+        self.enterContext(mock.patch.object(ReferenceNameIndex, '_current', None))
+        ReferencePlayer.objects.create(transfermarkt_id=1, name='Declan Rice')
+
+    def test_rewrites_index_when_players_change(self):
+        self.assertEqual(ReferenceNameIndex.current().get('rice'), ['Declan Rice'])
+        # Another process imports players; this one only sees the database
+        ReferencePlayer.objects.create(transfermarkt_id=2, name='Bukayo Saka')
+        with mock.patch('apps.claims.services.reference_name_index._RECHECK_SECONDS', 0):
+            self.assertEqual(ReferenceNameIndex.current().get('saka'), ['Bukayo Saka'])
+
+    def test_trusts_index_between_checks(self):
+        ReferenceNameIndex.current()
+        with self.assertNumQueries(0):
+            ReferenceNameIndex.current()
+
+
+class ContentHashTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        journalist = Journalist.objects.create(name='Hash Reporter')
+
+        def claim(number):
+            return Claim.objects.create(
+                journalist=journalist,
+                claim_text=f'Arsenal want Player {number}.',
+                publication='The Paper',
+                article_url=f'https://example.com/hash/{number}',
+                claim_date=timezone.now(),
+                player_name=f'Player {number}',
+                to_club='Arsenal',
+            )
+
+        cls.first = claim(1)
+        cls.second = claim(2)
+
+    def hash_of(self, claim):
+        return Claim.objects.values_list('content_hash', flat=True).get(pk=claim.pk)
+
+    def test_edit_rehashes_content(self):
+        before = self.hash_of(self.first)
+        self.first.player_name = 'Player 3'
+        self.first.save(update_fields=['player_name'])
+        self.assertNotEqual(self.hash_of(self.first), before)
+        self.assertEqual(self.hash_of(self.first), claim_ingest.claim_content_hash(self.first))
+
+    def test_status_change_keeps_hash(self):
+        before = self.hash_of(self.first)
+        self.first.validation_status = Claim.STATUS_PROVEN_FALSE
+        self.first.save()
+        self.assertEqual(self.hash_of(self.first), before)
+
+    def test_edit_into_a_repeat_drops_the_hash(self):
+        self.second.claim_text = self.first.claim_text
+        self.second.player_name = self.first.player_name
+        self.second.save()
+        self.assertIsNone(self.hash_of(self.second))
+
+    def test_api_update_into_a_repeat_is_rejected(self):
+        response = self.client.patch(
+            f'/api/claims/{self.second.pk}/',
+            {'claim_text': self.first.claim_text, 'player_name': self.first.player_name},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 400)
+        self.second.refresh_from_db()
+        self.assertEqual(self.second.player_name, 'Player 2')
+
+
+class BulkClaimUpdatesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.first = Journalist.objects.create(name='Bulk Reporter')
+        cls.second = Journalist.objects.create(name='Other Reporter')
+        cls.bystander = Journalist.objects.create(name='Bystander')
+        start = timezone.now() - timedelta(days=10)
+        cls.claims = [
+            Claim.objects.create(
+                journalist=journalist,
+                claim_text=f'Claim {number}',
+                publication='The Paper',
+                article_url=f'https://example.com/bulk/{number}',
+                claim_date=start + timedelta(days=number),
+                player_name=f'Player {number}',
+                to_club='Arsenal',
+            )
+            for number, journalist in enumerate((cls.first, cls.second, cls.bystander))
+        ]
+        # A stale score that only a rescore of the bystander would correct
+        Journalist.objects.filter(pk=cls.bystander.pk).update(truthfulness_score=5)
+
+    def test_exit_rescores_touched_journalists(self):
+        claim = self.claims[0]
+        with bulk_updates.bulk_claim_updates():
+            claim.validation_status = Claim.STATUS_CONFIRMED_TRUE
+            claim.save(update_fields=['validation_status'])
+            self.assertEqual(Journalist.objects.get(pk=self.first.pk).true_claims, 0)
+
+        first = Journalist.objects.get(pk=self.first.pk)
+        self.assertEqual((first.true_claims, first.truthfulness_score), (1, 1))
+        self.assertEqual(first.score_history.count(), 1)
+        self.assertEqual(Journalist.objects.get(pk=self.bystander.pk).truthfulness_score, 5)
+
+    def test_reassigned_claim_recounts_both_journalists(self):
+        claim = self.claims[0]
+        with bulk_updates.bulk_claim_updates():
+            claim.journalist = self.second
+            claim.save()
+
+        counts = dict(Journalist.objects.values_list('name', 'total_claims'))
+        self.assertEqual(counts, {'Bulk Reporter': 0, 'Other Reporter': 2, 'Bystander': 1})
+
+
+def make_claim(journalist, number, days_ago, **fields):
+    return Claim.objects.create(
+        journalist=journalist,
+        claim_text=fields.pop('claim_text', f'Claim {number} about {fields.get("player_name", "nobody")}.'),
+        publication='The Paper',
+        article_url=f'https://example.com/series/{number}',
+        claim_date=timezone.now() - timedelta(days=days_ago),
+        **fields,
+    )
+
+
+class StoryIndexTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.journalists = [Journalist.objects.create(name=f'Story Reporter {i}') for i in range(3)]
+        first, second, third = cls.journalists
+        make_claim(first, 1, 9, player_name='Declan Rice', to_club='Arsenal')
+        make_claim(second, 2, 8, player_name='Rice', to_club='Arsenal')
+        make_claim(third, 3, 7, player_name='Declan Rice', to_club='Chelsea')
+        cls.confirmed = make_claim(
+            third, 4, 1, player_name='Declan Rice', to_club='Arsenal',
+            validation_status=Claim.STATUS_CONFIRMED_TRUE,
+        )
+
+    def reports(self):
+        return set(StoryReport.objects.values_list(
+            'story__player_name', 'story__to_club', 'journalist__name', 'position', 'earliness',
+        ))
+
+    def test_confirmed_claim_ranks_earlier_reporters(self):
+        self.assertEqual(self.reports(), {
+            ('Declan Rice', 'Arsenal', 'Story Reporter 0', 1, 1.0),
+            ('Declan Rice', 'Arsenal', 'Story Reporter 1', 2, 0.5),
+            ('Declan Rice', 'Arsenal', 'Story Reporter 2', 3, 0.0),
+        })
+
+    def test_incremental_index_matches_rebuild(self):
+        make_claim(self.journalists[1], 5, 12, player_name='Declan Rice', to_club='Arsenal FC')
+        Claim.objects.get(claim_text__startswith='Claim 1 ').delete()
+        incremental = self.reports()
+        StoryIndex.rebuild()
+        self.assertEqual(self.reports(), incremental)
+
+    def test_unconfirming_drops_the_story(self):
+        self.confirmed.validation_status = Claim.STATUS_PROVEN_FALSE
+        self.confirmed.save()
+        self.assertFalse(Story.objects.exists())
+        self.assertEqual(self.reports(), set())
+
+
+@override_settings(SCORE_QUEUE_DEBOUNCE_SECONDS=30, SCORE_QUEUE_MAX_DELAY_SECONDS=300)
+class ScoreQueueTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.journalist = Journalist.objects.create(name='Queued Reporter')
+
+    def test_repeated_marks_coalesce(self):
+        ScoreQueue.mark([self.journalist.pk])
+        ScoreQueue.mark([self.journalist.pk], record_history=True)
+        ScoreQueue.mark([self.journalist.pk])
+        entry = DirtyJournalist.objects.get()
+        self.assertTrue(entry.record_history)
+
+    def test_due_after_quiet_period_or_max_delay(self):
+        ScoreQueue.mark([self.journalist.pk])
+        now = timezone.now()
+        self.assertFalse(ScoreQueue.due(now).exists())
+        self.assertTrue(ScoreQueue.due(now + timedelta(seconds=31)).exists())
+
+        # Marked again and again: due once the first mark is old enough
+        DirtyJournalist.objects.update(first_marked_at=now - timedelta(seconds=301))
+        self.assertTrue(ScoreQueue.due(now).exists())
+
+    def test_process_rescores_and_empties_queue(self):
+        make_claim(self.journalist, 1, 1, validation_status=Claim.STATUS_CONFIRMED_TRUE)
+        self.assertEqual(DirtyJournalist.objects.count(), 1)
+        self.assertEqual(ScoreQueue.process(debounce=0), 1)
+        self.assertFalse(DirtyJournalist.objects.exists())
+        journalist = Journalist.objects.get(pk=self.journalist.pk)
+        self.assertEqual(journalist.truthfulness_score, 1)
+        self.assertEqual(journalist.score_history.count(), 1)
+
+
+class ClaimCounterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.journalist = Journalist.objects.create(name='Counted Reporter')
+        cls.other = Journalist.objects.create(name='Other Counted Reporter')
+
+    def counters(self, journalist):
+        journalist.refresh_from_db(fields=Journalist.COUNTER_FIELDS)
+        return {field: getattr(journalist, field) for field in Journalist.COUNTER_FIELDS if getattr(journalist, field)}
+
+    def test_signals_keep_counters_in_step(self):
+        claim = make_claim(self.journalist, 1, 2, source_type=Claim.SOURCE_ORIGINAL)
+        make_claim(self.journalist, 2, 1, source_type=Claim.SOURCE_CITING)
+        self.assertEqual(
+            self.counters(self.journalist),
+            {'total_claims': 2, 'pending_claims': 2, 'original_scoops': 1},
+        )
+
+        claim.validation_status = Claim.STATUS_CONFIRMED_TRUE
+        claim.is_first_claim = True
+        claim.save()
+        self.assertEqual(self.counters(self.journalist), {
+            'total_claims': 2, 'pending_claims': 1, 'validated_claims': 1, 'true_claims': 1,
+            'original_scoops': 1, 'first_to_report_count': 1,
+        })
+
+        claim.journalist = self.other
+        claim.save()
+        self.assertEqual(self.counters(self.journalist), {'total_claims': 1, 'pending_claims': 1})
+
+        claim.delete()
+        self.assertEqual(self.counters(self.other), {})
+        self.assertEqual(claim_counters.rebuild(), 0)
+
+
+class NearDuplicateTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        journalist = Journalist.objects.create(name='Duplicate Reporter')
+        cls.text = 'Arsenal are in advanced talks to sign Declan Rice from West Ham for a club record fee.'
+        cls.claim = make_claim(journalist, 1, 1, claim_text=cls.text, player_name='Declan Rice')
+
+    def test_finds_indexed_near_duplicate(self):
+        found, ratio = near_duplicates.find_near_duplicate(self.text.replace('advanced', 'advance'))
+        self.assertEqual(found, self.claim)
+        self.assertGreater(ratio, near_duplicates.SIMILARITY_THRESHOLD)
+        self.assertEqual(near_duplicates.find_near_duplicate('Chelsea want Victor Osimhen.'), (None, 0.0))
+
+    def test_flags_repeats_within_batch_and_index(self):
+        fresh = 'Chelsea have opened talks with Napoli over a summer move for striker Victor Osimhen.'
+        flags = near_duplicates.flag_near_duplicates([
+            (self.text.lower(), 'Declan Rice'),
+            (self.text, 'Bukayo Saka'),
+            (fresh, 'Victor Osimhen'),
+            (fresh + ' ', 'Victor Osimhen'),
+        ])
+        self.assertEqual(flags, [True, False, False, True])
+
+
+class ClaimIngestTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.journalist = Journalist.objects.create(name='Ingest Reporter')
+
+    def fields(self, number, text):
+        return {
+            'journalist': self.journalist,
+            'claim_text': text,
+            'publication': 'The Paper',
+            'article_url': f'https://example.com/ingest/{number}',
+            'claim_date': timezone.now(),
+            'player_name': 'Declan Rice',
+        }
+
+    def test_exact_repeat_is_skipped(self):
+        self.assertIsNotNone(claim_ingest.insert_claim(**self.fields(1, 'Arsenal want Rice.')))
+        # Case and whitespace are normalised away
+        self.assertIsNone(claim_ingest.insert_claim(**self.fields(2, '  arsenal WANT   rice. ')))
+        self.assertEqual(Claim.objects.count(), 1)
+
+    def test_batch_drops_stored_and_repeated_claims(self):
+        claim_ingest.insert_claim(**self.fields(1, 'Arsenal want Rice.'))
+        created = claim_ingest.insert_claims([
+            Claim(**self.fields(2, 'Arsenal want Rice.')),
+            Claim(**self.fields(3, 'Chelsea want Rice.')),
+            Claim(**self.fields(4, 'Chelsea  want Rice.')),
+        ])
+        self.assertEqual([claim.claim_text for claim in created], ['Chelsea want Rice.'])
+        self.assertEqual(Journalist.objects.get(pk=self.journalist.pk).total_claims, 2)
+        self.assertTrue(ClaimTextBand.objects.filter(claim__in=created).exists())
+
+
+class PhraseMatcherTests(SimpleTestCase):
+    PHRASES = [
+        ('deal agreed', 'done'), ('deal', 'talks'), ('here we go', 'done'),
+        ('in talks', 'talks'), ('talks', 'talks'), ('not', 'negative'), ('not interested', 'negative'),
+    ]
+
+    def test_labels_match_testing_every_phrase(self):
+        matcher = PhraseMatcher(self.PHRASES)
+        for text in (
+            'here we go! deal agreed',
+            'club in talks, player not interested',
+            'a deal is close',
+            'nothing to report',
+            'notalks',
+        ):
+            with self.subTest(text=text):
+                expected = frozenset(label for phrase, label in self.PHRASES if phrase in text)
+                self.assertEqual(matcher.labels(text), expected)
+
+    def test_pattern_prefers_longest_phrase_and_respects_word_boundaries(self):
+        pattern = phrase_pattern(['deal', 'deal agreed'], word_boundaries=True)
+        self.assertEqual(pattern.search('the deal agreed today').group(), 'deal agreed')
+        self.assertIsNone(pattern.search('dealing with it'))
+
+    def test_classifiers_use_the_matcher(self):
+        self.assertTrue(detect_negative_claim('Rice has signed a new contract with West Ham.'))
+        self.assertFalse(detect_negative_claim('Arsenal want Rice.'))
+        self.assertEqual(classify_claim_confidence('Here we go! Rice to Arsenal.'), Claim.CERTAINTY_TIER_1)
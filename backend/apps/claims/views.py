@@ -6,10 +6,16 @@ from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Count, Q
+from django.db.models import Avg, Count, Q
 
 from apps.claims.models import Journalist, Claim, ScoreHistory, Transfer, ReferenceClub, ReferencePlayer
-from apps.claims.services.validator import players_match, clubs_match
+from apps.claims.filters import RankedSearchFilter
+from apps.claims.pagination import ClaimFeedPagination
+from apps.claims.services.club_resolver import club_filter
+from apps.claims.services.conditional_get import conditional_get
+from apps.claims.services.player_resolver import PlayerResolver
+from apps.claims.services.response_cache import cached_response
+from apps.claims.services.validator import clubs_match, same_player
 from apps.claims.serializers import (
     JournalistListSerializer,
     JournalistDetailSerializer,
@@ -33,9 +39,9 @@ class JournalistViewSet(viewsets.ReadOnlyModelViewSet):
 
     queryset = Journalist.objects.all()
     lookup_field = 'slug'
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [filters.OrderingFilter, RankedSearchFilter]
     search_fields = ['name', 'publications', 'twitter_handle']
-    ordering_fields = ['truthfulness_score', 'speed_score', 'name', 'created_at']
+    ordering_fields = ['truthfulness_score', 'speed_score', 'name', 'created_at', 'total_claims']
     ordering = ['-truthfulness_score']  # Default ordering
 
     def get_serializer_class(self):
@@ -44,21 +50,16 @@ class JournalistViewSet(viewsets.ReadOnlyModelViewSet):
             return JournalistDetailSerializer
         return JournalistListSerializer
 
-    def get_queryset(self):
-        """Optimize queryset with prefetching"""
-        queryset = super().get_queryset()
-
-        # Prefetch claims for efficient counting
-        queryset = queryset.prefetch_related('claims')
+    @conditional_get('journalists')
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
 
-        # Annotate with claim counts for better performance
-        queryset = queryset.annotate(
-            total_claims_count=Count('claims')
-        )
-
-        return queryset
+    @conditional_get('journalists')
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
 
     @action(detail=True, methods=['get'])
+    @conditional_get('score_history')
     def score_history(self, request, slug=None):
         """
         Get historical score data for charts.
@@ -74,6 +75,7 @@ class JournalistViewSet(viewsets.ReadOnlyModelViewSet):
         return Response(serializer.data)
 
     @action(detail=True, methods=['get'])
+    @conditional_get('claims')
     def claims(self, request, slug=None):
         """
         Get all claims for a specific journalist.
@@ -81,7 +83,7 @@ class JournalistViewSet(viewsets.ReadOnlyModelViewSet):
         Supports filtering by validation_status.
         """
         journalist = self.get_object()
-        claims = Claim.objects.filter(journalist=journalist)
+        claims = Claim.objects.filter(journalist=journalist).select_related('journalist', 'cited_journalist')
 
         # Filter by validation status if provided
         status_filter = request.query_params.get('status', None)
@@ -91,16 +93,20 @@ class JournalistViewSet(viewsets.ReadOnlyModelViewSet):
         # Order by claim date (newest first)
         claims = claims.order_by('-claim_date')
 
-        # Paginate
-        page = self.paginate_queryset(claims)
+        # Paginate like the claim feed (?cursor= for keyset pages); the
+        # journalist list keeps the default paginator
+        paginator = ClaimFeedPagination()
+        page = paginator.paginate_queryset(claims, request, view=self)
         if page is not None:
             serializer = ClaimSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+            return paginator.get_paginated_response(serializer.data)
 
         serializer = ClaimSerializer(claims, many=True)
         return Response(serializer.data)
 
     @action(detail=False, methods=['get'])
+    @conditional_get('journalists')
+    @cached_response('leaderboard')
     def leaderboard(self, request):
         """
         Get leaderboard rankings.
@@ -109,8 +115,6 @@ class JournalistViewSet(viewsets.ReadOnlyModelViewSet):
         - score_type: 'truthfulness' or 'speed' (default: truthfulness)
         - limit: number of results (default: 20)
         """
-        from apps.claims.services.scoring import ScoringService
-
         score_type = request.query_params.get('score_type', 'truthfulness')
         limit = int(request.query_params.get('limit', 20))
 
@@ -122,18 +126,17 @@ class JournalistViewSet(viewsets.ReadOnlyModelViewSet):
             order_field = '-truthfulness_score'
             score_field = 'truthfulness_score'
 
-        # Pre-compute position data for speed view
-        positions_map = {}
+        # Only include journalists with at least 1 claim (counter column, no join)
+        journalists = Journalist.objects.filter(total_claims__gt=0)
+
+        # Story positions for the speed view, aggregated in the same query
         if score_type == 'speed':
-            _, positions_map = ScoringService._compute_story_earliness()
-
-        # Only include journalists with at least 1 claim
-        journalists = (
-            Journalist.objects
-            .annotate(claims_count=Count('claims'))
-            .filter(claims_count__gt=0)
-            .order_by(order_field)[:limit]
-        )
+            journalists = journalists.annotate(
+                story_count=Count('story_reports'),
+                avg_position=Avg('story_reports__position'),
+            )
+
+        journalists = journalists.order_by(order_field)[:limit]
 
         # Build response with ranks
         results = []
@@ -145,15 +148,18 @@ class JournalistViewSet(viewsets.ReadOnlyModelViewSet):
                 'score_type': score_type,
             }
             if score_type == 'speed':
-                pos_list = positions_map.get(journalist.id, [])
-                entry['story_count'] = len(pos_list)
-                entry['avg_position'] = round(sum(pos_list) / len(pos_list), 1) if pos_list else None
+                entry['story_count'] = journalist.story_count
+                entry['avg_position'] = (
+                    round(journalist.avg_position, 1) if journalist.avg_position is not None else None
+                )
             results.append(entry)
 
         return Response(results)
 
 
     @action(detail=False, methods=['get'], url_path='club-tiers')
+    @conditional_get('journalists')
+    @cached_response('club-tiers')
     def club_tiers(self, request):
         """
         Get journalist tier list for a specific club.
@@ -238,7 +244,7 @@ class ClaimViewSet(viewsets.ModelViewSet):
         if self.action in ('create', 'update', 'partial_update'):
             return ClaimWriteSerializer
         return ClaimSerializer
-    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, filters.SearchFilter]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, RankedSearchFilter]
     filterset_fields = {
         'validation_status': ['exact'],
         'certainty_level': ['exact'],
@@ -250,18 +256,18 @@ class ClaimViewSet(viewsets.ModelViewSet):
     search_fields = ['claim_text', 'player_name', 'from_club', 'to_club']
     ordering_fields = ['claim_date', 'validation_date', 'created_at']
     ordering = ['-claim_date']  # Default: newest first
+    pagination_class = ClaimFeedPagination
 
     def get_queryset(self):
         """Optimize queryset with select_related for journalist data"""
         queryset = super().get_queryset()
         queryset = queryset.select_related('journalist', 'cited_journalist')
 
-        # Custom club filter: matches to_club or from_club
+        # Custom club filter: matches to_club or from_club, through the
+        # resolved club links when the name is a known club
         club = self.request.query_params.get('club')
         if club:
-            queryset = queryset.filter(
-                Q(to_club__icontains=club) | Q(from_club__icontains=club)
-            )
+            queryset = queryset.filter(club_filter(club))
 
         # Custom publication filter: matches normalized publication name
         publication = self.request.query_params.get('publication')
@@ -270,7 +276,16 @@ class ClaimViewSet(viewsets.ModelViewSet):
 
         return queryset
 
+    @conditional_get('claims')
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @conditional_get('claims')
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
     @action(detail=False, methods=['get'])
+    @conditional_get('claims')
     def latest(self, request):
         """
         Get the latest claims (for homepage feed).
@@ -282,6 +297,7 @@ class ClaimViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
     @action(detail=False, methods=['get'])
+    @conditional_get('claims')
     def pending(self, request):
         """Get all pending claims awaiting validation"""
         claims = self.get_queryset().filter(
@@ -297,6 +313,7 @@ class ClaimViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
     @action(detail=False, methods=['get'])
+    @conditional_get('claims')
     def validated(self, request):
         """Get all validated claims (true or false)"""
         claims = self.get_queryset().exclude(
@@ -312,6 +329,8 @@ class ClaimViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
     @action(detail=False, methods=['get'], url_path='filter-options')
+    @conditional_get('claims')
+    @cached_response('filter-options')
     def filter_options(self, request):
         """
         Return distinct values for filter dropdowns.
@@ -370,6 +389,8 @@ class ClaimViewSet(viewsets.ModelViewSet):
         })
 
     @action(detail=False, methods=['get'])
+    @conditional_get('claims')
+    @cached_response('stats')
     def stats(self, request):
         """
         Get overall statistics.
@@ -398,6 +419,8 @@ class ClaimViewSet(viewsets.ModelViewSet):
 
 
     @action(detail=False, methods=['get'], url_path='publication-leaderboard')
+    @conditional_get('claims')
+    @cached_response('publication-leaderboard')
     def publication_leaderboard(self, request):
         """
         Leaderboard ranked by publication.
@@ -409,16 +432,13 @@ class ClaimViewSet(viewsets.ModelViewSet):
         Truthfulness: (confirmed_true / validated) * 100
         Speed: average rank-based earliness across confirmed true stories * 100
         """
-        from apps.claims.services.scoring import ScoringService
+        from apps.claims.services.sql_earliness import rank_aggregates
 
         score_type = request.query_params.get('score_type', 'truthfulness')
         limit = int(request.query_params.get('limit', 20))
 
-        # Pre-compute publication earliness for speed scoring
-        pub_earliness = {}
-        pub_positions = {}
-        if score_type == 'speed':
-            pub_earliness, pub_positions = ScoringService._compute_publication_earliness()
+        # Publication ranks within indexed stories, aggregated in the database
+        pub_ranks = rank_aggregates('publication') if score_type == 'speed' else {}
 
         pubs = (
             Claim.objects
@@ -442,8 +462,8 @@ class ClaimViewSet(viewsets.ModelViewSet):
             truthfulness = pub['true_claims']
 
             if score_type == 'speed':
-                scores = pub_earliness.get(pub_name, [])
-                speed = round((sum(scores) / len(scores)) * 100, 2) if scores else 0
+                _, earliness, _ = pub_ranks.get(pub_name, (0, None, None))
+                speed = round(earliness * 100, 2) if earliness is not None else 0
             else:
                 speed = 0
 
@@ -459,9 +479,9 @@ class ClaimViewSet(viewsets.ModelViewSet):
                 'score_type': score_type,
             }
             if score_type == 'speed':
-                pos_list = pub_positions.get(pub_name, [])
-                entry['story_count'] = len(pos_list)
-                entry['avg_position'] = round(sum(pos_list) / len(pos_list), 1) if pos_list else None
+                story_count, _, avg_position = pub_ranks.get(pub_name, (0, None, None))
+                entry['story_count'] = story_count
+                entry['avg_position'] = round(avg_position, 1) if avg_position is not None else None
             results.append(entry)
 
         # Sort by score descending, then by total_claims as tiebreaker
@@ -514,6 +534,7 @@ class TransferViewSet(viewsets.ReadOnlyModelViewSet):
         return queryset
 
     @action(detail=True, methods=['get'])
+    @conditional_get('transfers')
     def timeline(self, request, pk=None):
         """
         Get timeline data for a transfer story.
@@ -523,18 +544,23 @@ class TransferViewSet(viewsets.ReadOnlyModelViewSet):
         """
         transfer = self.get_object()
 
-        # Broad DB filter on last name, then precise Python matching
+        # Claims resolved to the transfer's player join on the player id;
+        # the rest get a broad DB filter on last name, then precise Python matching
         last_name = transfer.player_name.strip().split()[-1]
+        player_id = PlayerResolver.current().resolve(transfer.player_name)
+        lookup = Q(player_name__icontains=last_name)
+        if player_id is not None:
+            lookup = Q(reference_player_id=player_id) | (Q(reference_player__isnull=True) & lookup)
         candidates = (
             Claim.objects
-            .filter(player_name__icontains=last_name)
+            .filter(lookup)
             .select_related('journalist')
             .order_by('claim_date')
         )
 
         matching = [
             c for c in candidates
-            if players_match(c.player_name, transfer.player_name)
+            if same_player(c.player_name, transfer.player_name, c.reference_player_id, player_id)
             and clubs_match(c.to_club, transfer.to_club)
         ]
 
@@ -644,7 +670,7 @@ class ReferencePlayerViewSet(viewsets.ReadOnlyModelViewSet):
 
     queryset = ReferencePlayer.objects.all()
     serializer_class = ReferencePlayerSerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, RankedSearchFilter]
     filterset_fields = {
         'position': ['exact'],
         'citizenship': ['exact'],
@@ -148,6 +148,57 @@ ANTHROPIC_API_KEY = config('ANTHROPIC_API_KEY', default='')
 # Twitter API (optional)
 TWITTER_BEARER_TOKEN = config('TWITTER_BEARER_TOKEN', default='')
 
+# Cache: 'file' (default) or 'locmem'. Neither needs to be shared between
+# the web and worker processes: cached responses are keyed by a data version
+# held in the database (see apps.claims.services.response_cache).
+CACHE_BACKEND = config('CACHE_BACKEND', default='file')
+CACHE_LOCATION = config('CACHE_LOCATION', default=str(BASE_DIR / '.cache'))
+
+if CACHE_BACKEND == 'locmem':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'veracity',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': CACHE_LOCATION,
+        }
+    }
+
+# Surname index of reference players, written by import_reference_data and
+# mapped read-only by every process
+REFERENCE_NAME_INDEX_PATH = config(
+    'REFERENCE_NAME_INDEX_PATH', default=str(BASE_DIR / 'data' / 'reference_names.idx')
+)
+
+# Near-duplicate claim lookup: MinHash bands x rows (see services.near_duplicates).
+# Changing either requires running backfill_near_duplicate_index.
+NEAR_DUPLICATE_BANDS = config('NEAR_DUPLICATE_BANDS', default=32, cast=int)
+NEAR_DUPLICATE_ROWS = config('NEAR_DUPLICATE_ROWS', default=3, cast=int)
+
+# Journalists kept in memory per process by services.journalist_resolver
+JOURNALIST_CACHE_SIZE = config('JOURNALIST_CACHE_SIZE', default=1024, cast=int)
+
+# Async gossip backfill (scrape_claims --pages): concurrent requests per host,
+# and how many gossip columns are fetched ahead of the one being written
+GOSSIP_BACKFILL_HOST_CONCURRENCY = config('GOSSIP_BACKFILL_HOST_CONCURRENCY', default=4, cast=int)
+GOSSIP_BACKFILL_PREFETCH = config('GOSSIP_BACKFILL_PREFETCH', default=8, cast=int)
+
+# Aggregate endpoint responses are invalidated by the claims data version;
+# the timeout only bounds how long superseded entries linger
+RESPONSE_CACHE_TIMEOUT = config('RESPONSE_CACHE_TIMEOUT', default=600, cast=int)
+
+# Score queue: claim changes queue journalists for the process_score_queue worker.
+# A journalist is rescored once changes have been quiet for the debounce window,
+# or at the latest after the max delay.
+SCORE_QUEUE_DEBOUNCE_SECONDS = config('SCORE_QUEUE_DEBOUNCE_SECONDS', default=30, cast=int)
+SCORE_QUEUE_MAX_DELAY_SECONDS = config('SCORE_QUEUE_MAX_DELAY_SECONDS', default=300, cast=int)
+SCORE_QUEUE_POLL_SECONDS = config('SCORE_QUEUE_POLL_SECONDS', default=10, cast=int)
+
 # Logging
 LOGGING = {
     'version': 1,